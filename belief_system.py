@@ -1,6 +1,13 @@
 import json
-from collections import Counter
 import math
+from lazy_imports import lazy_import
+from belief_table import BeliefTable
+from phrase_matcher import phrase_matcher
+from text_index import InvertedIndex, append_research_note, file_stamp, shared_research_index
+
+np = lazy_import("numpy")
+
+CORE_THEMES = ("balance", "entropy", "structure", "observation", "consciousness", "realities", "learning", "reflection")
 
 class BeliefSystem:
     def __init__(self, research_notes_file="research_notes.json"):
@@ -15,9 +22,13 @@ class BeliefSystem:
             "Learning is an iterative process driven by reflection, testing, and refinement.",
             "Consciousness arises from the interaction of layers within universal structures."
         ]
-        self.evolved_beliefs = []  # Beliefs Sidekick generates or evolves.
+        self.belief_table = BeliefTable()  # Weights, reinforcement times and counts of evolved beliefs
+        self.evolved_beliefs = self.belief_table.texts  # Beliefs Sidekick generates or evolves.
+        self.version = 0  # Bumped whenever the beliefs or their strengths change
         self.research_notes_file = research_notes_file
-        self.research_notes = self._load_research_notes()
+        self.research_index = shared_research_index(research_notes_file, self._load_research_notes)
+        self.research_notes = self.research_index.research_notes
+        self._rebuild_belief_index()
 
     # ======= Golden Ratio-Based Recursive Refinement =======
 
@@ -33,36 +44,44 @@ class BeliefSystem:
         """
         Add a new belief to the evolved beliefs if it aligns with core principles.
         """
-        if belief in self.core_beliefs or belief in self.evolved_beliefs:
+        if belief in self.core_beliefs or belief in self.belief_table:
             print(f"Belief already exists: {belief}")
         elif self._aligns_with_core_beliefs(belief):
-            interactions = len(self.evolved_beliefs)  # Approximate engagement level
-            weight = self.recursive_belief_weighting(belief, interactions)
+            # A new belief has not been reinforced yet. (The old proxy, the number of evolved
+            # beliefs, overflowed phi ** n past ~1,470 beliefs.)
+            weight = self.recursive_belief_weighting(belief, 0)
             self.discuss_belief_change(belief, "add", weight)
         else:
             print(f"Belief rejected: {belief} does not align with core principles.")
 
-    def _aligns_with_core_beliefs(self, belief):
+    def discuss_belief_change(self, belief, action, weight):
         """
-        Check if a belief aligns with core beliefs using a similarity measure.
+        Apply an accepted belief change and record it.
         """
-        core_themes = [
-            "balance", "entropy", "structure", "observation",
-            "consciousness", "realities", "learning", "reflection"
-        ]
-        return any(theme in belief.lower() for theme in core_themes)
+        if action == "add":
+            row = self.belief_table.add(belief, weight)
+            self.belief_index.add(f"evolved:{row}", belief)
+            self.version += 1
+        self.log_belief_updates(f"{belief} (weight {weight:.3f})", action)
 
-    def review_beliefs(self):
+    def _aligns_with_core_beliefs(self, belief):
         """
-        Review and refine evolved beliefs, removing inconsistencies.
+        Check if a belief aligns with core beliefs using a similarity measure.
         """
-        refined_beliefs = []
-        for belief in self.evolved_beliefs:
-            if self._aligns_with_core_beliefs(belief):
-                refined_beliefs.append(belief)
-            else:
-                self.log_belief_updates(belief, "removed during review")
-        self.evolved_beliefs = refined_beliefs
+        return phrase_matcher(CORE_THEMES).search(belief) is not None
+
+    def review_beliefs(self, min_strength=0.0):
+        """
+        Review and refine evolved beliefs, removing inconsistencies and beliefs whose
+        decayed strength has fallen to `min_strength` or below. One vectorized scan.
+        """
+        keep = self.belief_table.aligned[:len(self.belief_table)] & (self.belief_table.strengths() > min_strength)
+        removed = [self.evolved_beliefs[row] for row in np.flatnonzero(~keep)]
+        if removed:
+            self.belief_table.keep(keep)
+            self._rebuild_belief_index()
+            self.version += 1
+            self.log_belief_updates(removed, "removed during review")
         self.log_belief_updates("Evolved beliefs", "reviewed and refined")
 
     # ======= Research Notes Integration =======
@@ -80,17 +99,20 @@ class BeliefSystem:
 
     def query_research_notes(self, topic):
         """
-        Retrieve research notes related to a specific topic.
+        Retrieve research notes related to a specific topic, most relevant first (BM25).
+        Every word of the topic must start a word of the note, so "conscious" still finds
+        "consciousness" as the old substring check did.
         """
-        results = [note for note in self.research_notes if topic.lower() in note.lower()]
+        results = self.research_index.search(topic, match="prefix")
         return results if results else ["No relevant research notes found."]
 
     def add_research_note(self, note):
         """
         Append new research notes dynamically.
         """
-        self.research_notes.append(note)
+        append_research_note(self.research_notes, note)
         self.save_research_notes()
+        self.research_index.add(note)
 
     def save_research_notes(self):
         """
@@ -114,6 +136,33 @@ class BeliefSystem:
         """
         return reinforcement_factor * belief
 
+    def reinforce_belief(self, belief, reinforcement_factor=1.1):
+        """
+        Reinforce a stored evolved belief: its decayed strength is scaled and its age reset.
+        Returns:
+            float: The new strength.
+        """
+        self.version += 1
+        return float(self.belief_table.reinforce(belief, reinforcement_factor))
+
+    def belief_strength(self, belief):
+        """
+        Current strength of an evolved belief, decayed since its last reinforcement (belief_decay curve).
+        """
+        return self.belief_table.strength(belief)
+
+    def evaluate_beliefs(self):
+        """
+        Summarize the belief system: belief counts and the strength of evolved beliefs.
+        """
+        strengths = self.belief_table.strengths()
+        return {
+            "core_beliefs": len(self.core_beliefs),
+            "evolved_beliefs": len(self.evolved_beliefs),
+            "average_strength": round(float(strengths.mean()), 4) if len(strengths) else 0.0,
+            "strongest_belief": self.evolved_beliefs[int(strengths.argmax())] if len(strengths) else None,
+        }
+
     def philosophical_alignment(self, user_beliefs):
         """
         Compare and align Sidekick's beliefs with user-provided beliefs.
@@ -129,24 +178,32 @@ class BeliefSystem:
 
     def query_belief(self, theme):
         """
-        Return beliefs related to a specific theme.
+        Return beliefs related to a specific theme, most relevant first (BM25).
+        Matches like query_research_notes: every word of the theme must start a word of the belief.
         """
-        related_beliefs = [
-            belief for belief in self.core_beliefs + self.evolved_beliefs
-            if theme.lower() in belief.lower()
-        ]
-        return related_beliefs
+        return [self._belief(doc_id) for doc_id, _ in self.belief_index.search(theme, match="prefix")]
+
+    def _belief(self, doc_id):
+        kind, position = doc_id.split(":")
+        return (self.core_beliefs if kind == "core" else self.evolved_beliefs)[int(position)]
+
+    def _rebuild_belief_index(self):
+        self.belief_index = InvertedIndex()
+        for kind, beliefs in (("core", self.core_beliefs), ("evolved", self.evolved_beliefs)):
+            for position, belief in enumerate(beliefs):
+                self.belief_index.add(f"{kind}:{position}", belief)
 
     def propose_new_core_belief(self):
         """
         Identify common themes in evolved beliefs and propose new core beliefs.
+        Themes are the words of evolved beliefs, counted with each belief's current strength.
         """
-        words = [word for belief in self.evolved_beliefs for word in belief.split()]
-        common_themes = Counter(words).most_common(5)
+        common_themes = self.belief_table.top_themes(5, weighted=True)
         proposals = [f"New Core Belief Proposal: '{theme[0]}' is essential for growth." for theme in common_themes]
         print("\nProposed New Core Beliefs:")
         for proposal in proposals:
             print(proposal)
+        return proposals
 
     # ======= File Management =======
 
@@ -156,10 +213,12 @@ class BeliefSystem:
         """
         beliefs_data = {
             "core_beliefs": self.core_beliefs,
-            "evolved_beliefs": self.evolved_beliefs
+            "evolved_beliefs": self.evolved_beliefs,
+            "evolved_belief_state": self.belief_table.to_dict()
         }
         with open(filename, "w") as file:
             json.dump(beliefs_data, file, indent=4)
+        self.belief_index.save(filename + ".index", file_stamp(filename))  # Persisted next to the JSON
         self.log_belief_updates("All beliefs", "saved to file")
 
     def load_beliefs(self, filename="belief_system.json"):
@@ -170,7 +229,19 @@ class BeliefSystem:
             with open(filename, "r") as file:
                 beliefs_data = json.load(file)
                 self.core_beliefs = beliefs_data["core_beliefs"]
-                self.evolved_beliefs = beliefs_data["evolved_beliefs"]
+            state = beliefs_data.get("evolved_belief_state")  # Files saved before weights were kept have none
+            self.belief_table = BeliefTable.from_beliefs(beliefs_data["evolved_beliefs"], state)
+            self.evolved_beliefs = self.belief_table.texts
+            self.version += 1
+            if not state:
+                self.belief_table.aligned[:len(self.belief_table)] = [
+                    self._aligns_with_core_beliefs(belief) for belief in self.evolved_beliefs
+                ]
+            belief_index = InvertedIndex.load(filename + ".index", file_stamp(filename))
+            if belief_index is None:
+                self._rebuild_belief_index()
+            else:
+                self.belief_index = belief_index
             self.log_belief_updates("All beliefs", "loaded from file")
         except FileNotFoundError:
             print(f"Belief file '{filename}' not found. Using default beliefs.")
@@ -180,10 +251,13 @@ class BeliefSystem:
     def log_belief_updates(self, belief, action):
         """
         Log all updates made to the belief system.
+        `belief` may be a list, logged with a single write.
         """
-        print(f"[LOG]: {action.upper()} - {belief}")
+        beliefs = belief if isinstance(belief, list) else [belief]
+        for belief in beliefs:
+            print(f"[LOG]: {action.upper()} - {belief}")
         with open("belief_changes.log", "a") as log_file:
-            log_file.write(f"{action.upper()}: {belief}\n")
+            log_file.write("".join(f"{action.upper()}: {belief}\n" for belief in beliefs))
 
 # Example usage
 if __name__ == "__main__":
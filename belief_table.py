@@ -0,0 +1,167 @@
+import time
+from lazy_imports import lazy_import
+from numpy_columns import grow_column
+from text_index import tokenize
+
+np = lazy_import("numpy")
+
+SECONDS_PER_DAY = 86400.0
+# NumPy columns, allocated on first use so building an empty table does not import NumPy
+COLUMNS = {"weight": "float64", "last_reinforced": "float64", "interactions": "int64", "aligned": "bool",
+           "term_rows": "int64", "term_ids": "int64"}
+
+class BeliefTable:
+    def __init__(self, decay_rate=0.05, decay_unit=SECONDS_PER_DAY):
+        """
+        Evolved beliefs with their strength state in NumPy columns:
+            weight          - strength as of the last reinforcement
+            last_reinforced - epoch seconds of the last reinforcement (or creation)
+            interactions    - number of reinforcements
+            aligned         - whether the belief aligned with the core themes when added
+        Decay is lazy: nothing is updated as time passes. The current strength is computed
+        on read as weight * max(0, 1 - decay_rate * log(1 + age)), with age in decay_units,
+        the same curve as BeliefSystem.belief_decay.
+        Belief words are kept as (row, term id) pairs so theme counts are one bincount.
+        """
+        self.decay_rate = decay_rate
+        self.decay_unit = decay_unit
+        self.texts = []  # Row -> belief text (BeliefSystem.evolved_beliefs is this list)
+        self.rows = {}  # Belief text -> row
+        self.vocabulary = {}  # Word -> term id
+        self.words = []  # Term id -> word
+        self.num_terms = 0
+
+    def __getattr__(self, name):
+        """Allocate the empty COLUMNS the first time any of them is read."""
+        if name not in COLUMNS:
+            raise AttributeError(name)
+        for column, dtype in COLUMNS.items():
+            self.__dict__.setdefault(column, np.zeros(0, dtype=dtype))
+        return self.__dict__[name]
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __contains__(self, belief):
+        return belief in self.rows
+
+    # ==========================
+    # ✍️ Writes
+    # ==========================
+
+    def add(self, belief, weight=1.0, aligned=True, now=None, interactions=0):
+        now = time.time() if now is None else now
+        row = len(self.texts)
+        self.weight = grow_column(self.weight, row + 1)
+        self.last_reinforced = grow_column(self.last_reinforced, row + 1)
+        self.interactions = grow_column(self.interactions, row + 1)
+        self.aligned = grow_column(self.aligned, row + 1)
+        self.weight[row] = weight
+        self.last_reinforced[row] = now
+        self.interactions[row] = interactions
+        self.aligned[row] = aligned
+        self.texts.append(belief)
+        self.rows[belief] = row
+
+        term_ids = []
+        for word in tokenize(belief):
+            if word not in self.vocabulary:
+                self.vocabulary[word] = len(self.words)
+                self.words.append(word)
+            term_ids.append(self.vocabulary[word])
+        start, end = self.num_terms, self.num_terms + len(term_ids)
+        self.term_rows = grow_column(self.term_rows, end)
+        self.term_ids = grow_column(self.term_ids, end)
+        self.term_rows[start:end] = row
+        self.term_ids[start:end] = term_ids
+        self.num_terms = end
+        return row
+
+    def reinforce(self, belief, reinforcement_factor=1.1, now=None):
+        """
+        Fold the decay so far into the stored weight, then scale it (BeliefSystem.reinforce_beliefs).
+        """
+        now = time.time() if now is None else now
+        row = self.rows[belief]
+        self.weight[row] = self.strengths(now, rows=[row])[0] * reinforcement_factor
+        self.last_reinforced[row] = now
+        self.interactions[row] += 1
+        return self.weight[row]
+
+    def keep(self, mask):
+        """
+        Drop every row where `mask` is False, preserving the order of the rest.
+        The texts list is edited in place so references to it stay valid.
+        """
+        count = len(self.texts)
+        mask = np.asarray(mask, dtype=bool)
+        for column in ("weight", "last_reinforced", "interactions", "aligned"):
+            setattr(self, column, getattr(self, column)[:count][mask])
+        self.texts[:] = [text for text, kept in zip(self.texts, mask) if kept]
+        self.rows = {text: row for row, text in enumerate(self.texts)}
+
+        term_rows = self.term_rows[:self.num_terms]
+        kept_terms = mask[term_rows]
+        new_row = np.cumsum(mask) - 1  # Old row -> new row for kept rows
+        self.term_rows = new_row[term_rows[kept_terms]]
+        self.term_ids = self.term_ids[:self.num_terms][kept_terms]
+        self.num_terms = len(self.term_ids)
+
+    # ==========================
+    # 📖 Vectorized Reads
+    # ==========================
+
+    def strengths(self, now=None, rows=None):
+        """Current strength of every belief (or of `rows`), decayed lazily to `now`."""
+        now = time.time() if now is None else now
+        count = len(self.texts)
+        weight = self.weight[:count] if rows is None else self.weight[rows]
+        last = self.last_reinforced[:count] if rows is None else self.last_reinforced[rows]
+        age = np.maximum(now - last, 0) / self.decay_unit
+        return weight * np.maximum(0.0, 1 - self.decay_rate * np.log1p(age))
+
+    def strength(self, belief, now=None):
+        return float(self.strengths(now, rows=[self.rows[belief]])[0])
+
+    def theme_counts(self, weighted=False, now=None):
+        """
+        Occurrences of every word across beliefs (optionally weighted by current strength), by term id.
+        """
+        term_rows = self.term_rows[:self.num_terms]
+        weights = self.strengths(now)[term_rows] if weighted else None
+        return np.bincount(self.term_ids[:self.num_terms], weights=weights, minlength=len(self.words))
+
+    def top_themes(self, k=5, weighted=False, now=None):
+        counts = self.theme_counts(weighted, now)
+        if not len(counts):
+            return []
+        top = np.argpartition(-counts, min(k, len(counts)) - 1)[:k]
+        top = top[np.argsort(-counts[top], kind="stable")]
+        return [(self.words[term], counts[term].item()) for term in top if counts[term] > 0]
+
+    # ==========================
+    # 💾 Persistence
+    # ==========================
+
+    def to_dict(self):
+        count = len(self.texts)
+        return {
+            "weight": self.weight[:count].tolist(),
+            "last_reinforced": self.last_reinforced[:count].tolist(),
+            "interactions": self.interactions[:count].tolist(),
+            "aligned": self.aligned[:count].tolist(),
+        }
+
+    @classmethod
+    def from_beliefs(cls, beliefs, state=None, now=None, **kwargs):
+        """
+        Build a table from saved belief texts; beliefs saved without state start at weight 1.0 now.
+        """
+        table = cls(**kwargs)
+        for row, belief in enumerate(beliefs):
+            if state and row < len(state["weight"]):
+                table.add(belief, state["weight"][row], state["aligned"][row],
+                          state["last_reinforced"][row], state["interactions"][row])
+            else:
+                table.add(belief, now=now)
+        return table
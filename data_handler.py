@@ -1,13 +1,10 @@
 import os
+import copy
 import json
-try:
-    from Crypto.Cipher import AES  # Standard PyCryptodome import
-except ImportError:
-    from Cryptodome.Cipher import AES  # Alternative import from Cryptodome.Cipher import AES  # ✅ Corrected Import for Pydroid 3
-try:
-    from Crypto.Random import get_random_bytes  # Standard PyCryptodome import
-except ImportError:
-    from Cryptodome.Random import get_random_bytes  # Alternative import for Pydroid3 from Cryptodome.Random import get_random_bytes
+from lazy_imports import lazy_import
+# PyCryptodome is only loaded once data is encrypted or a key is generated ("Cryptodome" on Pydroid 3)
+AES = lazy_import("Crypto.Cipher.AES", "Cryptodome.Cipher.AES")
+Random = lazy_import("Crypto.Random", "Cryptodome.Random")
 
 class DataHandler:
     def __init__(self, file_name="sidekick_memory.json", key=None):
@@ -16,6 +13,8 @@ class DataHandler:
         """
         self.file_name = file_name
         self.key = key or self._generate_key()
+        self._cache = None  # Decrypted data, valid while the file's (mtime, size) is unchanged; never handed out
+        self._cache_stamp = None
 
     # ======================
     # 🔐 Encryption & Security
@@ -29,7 +28,7 @@ class DataHandler:
         if os.path.exists(key_file):
             with open(key_file, "rb") as kf:
                 return kf.read()
-        key = get_random_bytes(16)
+        key = Random.get_random_bytes(16)
         with open(key_file, "wb") as kf:
             kf.write(key)
         return key
@@ -63,24 +62,61 @@ class DataHandler:
         """
         Encrypt and store data in a JSON file.
         """
-        encrypted_data = self._encrypt_data(json.dumps(data))
+        serialized = json.dumps(data)
+        encrypted_data = self._encrypt_data(serialized)
         with open(self.file_name, "w") as file:
             json.dump(encrypted_data, file, indent=4)
+        # Cache what was written, not the caller's dict, which it may keep changing
+        self._cache, self._cache_stamp = json.loads(serialized), self.file_stamp()
         print("[DataHandler] Data encrypted and saved.")
 
     def load_data(self):
         """
         Load and decrypt data from the JSON file.
+        Returns a copy of the cached decrypted data, so callers may modify it freely;
+        changes are only kept once passed to save_data().
         """
-        if not os.path.exists(self.file_name):
+        return copy.deepcopy(self._cached_data())
+
+    def _cached_data(self):
+        """
+        The decrypted data, cached until the file changes on disk so repeated reads skip
+        the decryption. Shared with the cache: only read it, or change it and save_data() it.
+        """
+        stamp = self.file_stamp()
+        if stamp is None:
             return {}
+        if self._cache is not None and stamp == self._cache_stamp:
+            return self._cache
         try:
             with open(self.file_name, "r") as file:
                 encrypted_data = json.load(file)
-            return json.loads(self._decrypt_data(encrypted_data))
+            data = json.loads(self._decrypt_data(encrypted_data))
         except Exception as e:
             print(f"[ERROR] Failed to load data: {e}")
             return {}
+        self._cache, self._cache_stamp = data, stamp
+        return data
+
+    def file_stamp(self):
+        """(mtime, size) of the data file, or None; changes whenever the data is saved."""
+        try:
+            stat = os.stat(self.file_name)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get_all_data(self):
+        """
+        Return (a copy of) the stored data with the "interactions" and "patterns" sections present.
+        """
+        return copy.deepcopy(self._sections())
+
+    def _sections(self):
+        data = self._cached_data()
+        data.setdefault("interactions", [])
+        data.setdefault("patterns", {})
+        return data
 
     # ======================
     # 🔍 Data Management
@@ -90,7 +126,7 @@ class DataHandler:
         """
         Update a specific key in the stored data.
         """
-        data = self.load_data()
+        data = self._cached_data()
         data[key] = value
         self.save_data(data)
         print(f"[DataHandler] Updated: {key} = {value}")
@@ -99,7 +135,7 @@ class DataHandler:
         """
         Delete a specific key from the stored data.
         """
-        data = self.load_data()
+        data = self._cached_data()
         if key in data:
             del data[key]
             self.save_data(data)
@@ -107,6 +143,41 @@ class DataHandler:
         else:
             print(f"[DataHandler] Key '{key}' not found.")
 
+    # ======================
+    # 💬 Interactions & Patterns
+    # ======================
+
+    def add_interaction(self, interaction):
+        """
+        Append an interaction record (e.g. {"user_input": ...}) to the history.
+        """
+        data = self._sections()
+        data["interactions"].append(interaction)
+        self.save_data(data)
+
+    def count_interactions(self):
+        return len(self._sections()["interactions"])
+
+    def get_interactions(self, start=0):
+        """
+        Return the interactions recorded from position `start` on, so readers that keep
+        a checkpoint only receive what was added since their last pass.
+        """
+        return copy.deepcopy(self._sections()["interactions"][start:])
+
+    def add_pattern(self, pattern, details):
+        self.add_patterns({pattern: details})
+
+    def add_patterns(self, patterns):
+        """
+        Store several pattern records with a single encrypt-and-write.
+        """
+        if not patterns:
+            return
+        data = self._sections()
+        data["patterns"].update(patterns)
+        self.save_data(data)
+
 # ======================
 # 🔬 Example Usage
 # ======================
@@ -3,6 +3,7 @@ import hashlib
 import time
 import shutil
 import smtplib
+from directory_watcher import DirectoryWatcher
 
 class DirectoryAnchor:
     def __init__(self, root_directory=None):
@@ -25,6 +26,8 @@ class DirectoryAnchor:
         }
         self.file_hashes = self._generate_initial_hashes()
         self.unauthorized_attempts = {}
+        self.critical_files = ["directory_anchor.py", "memory_manager.py"]
+        self.watcher = None
 
         # Ensure LICENSE.txt exists
         self._ensure_license_exists()
@@ -82,8 +85,11 @@ class DirectoryAnchor:
         """Generate initial file integrity hashes."""
         return {file: self._generate_file_hash(file) for category in self.owned_files for file in self.owned_files[category]}
 
-    def detect_unauthorized_changes(self):
-        """Detect and restore missing or modified critical files."""
+    def detect_unauthorized_changes(self, paths=None):
+        """
+        Detect and restore missing or modified critical files.
+        Only `paths` are re-hashed when given (e.g. the files a watcher reported).
+        """
         # Check if LICENSE.txt exists
         if not os.path.exists(self.license_file):
             print("[CRITICAL ALERT]: LICENSE.txt was deleted! Restoring file...")
@@ -91,14 +97,15 @@ class DirectoryAnchor:
             self.log_security_event("LICENSE.txt was deleted and has been restored.")
 
         # Check for unauthorized modifications
-        for category in self.owned_files:
-            for file_path in self.owned_files[category]:
-                if os.path.exists(file_path):
-                    new_hash = self._generate_file_hash(file_path)
-                    if self.file_hashes.get(file_path) and new_hash != self.file_hashes[file_path]:
-                        self.log_security_event(f"Unauthorized modification detected in {file_path}")
-                        print(f"[ALERT]: {file_path} was modified externally!")
-                        self.file_hashes[file_path] = new_hash  # Update hash after detection
+        if paths is None:
+            paths = [file_path for category in self.owned_files for file_path in self.owned_files[category]]
+        for file_path in paths:
+            if os.path.exists(file_path):
+                new_hash = self._generate_file_hash(file_path)
+                if self.file_hashes.get(file_path) and new_hash != self.file_hashes[file_path]:
+                    self.log_security_event(f"Unauthorized modification detected in {file_path}")
+                    print(f"[ALERT]: {file_path} was modified externally!")
+                    self.file_hashes[file_path] = new_hash  # Update hash after detection
 
     def restore_missing_files(self):
         """Restores any missing critical files from backup."""
@@ -112,14 +119,9 @@ class DirectoryAnchor:
                 else:
                     print(f"[ERROR]: Backup for {file_path} not found!")
 
-    def verify_integrity(self):
-        """Randomized security check to detect file tampering."""
-        import random
-        delay = random.randint(30, 300)  # Between 30 sec - 5 min
-        time.sleep(delay)
-        critical_files = ["directory_anchor.py", "memory_manager.py"]
-
-        for file in critical_files:
+    def verify_integrity(self, files=None):
+        """Check critical files for tampering and restore from backup if needed."""
+        for file in files or self.critical_files:
             file_path = os.path.join(self.get_root_directory(), file)
             if os.path.exists(file_path):
                 new_hash = self._generate_file_hash(file_path)
@@ -128,6 +130,48 @@ class DirectoryAnchor:
                     self.restore_missing_files()
                     self.log_security_event(f"Tampering detected in {file}. System restored.")
 
+    def monitor_integrity(self, background=True, use_inotify=True):
+        """
+        Watch the root directory and run integrity checks as soon as an owned file changes.
+        Replaces the randomized sleep-then-check loop; idle cost is a blocked read.
+        """
+        self.watcher = DirectoryWatcher(
+            self.get_root_directory(),
+            callback=self.handle_file_events,
+            recursive=False,
+            ignore=[os.path.join(self.get_root_directory(), "security_log.txt")],
+            use_inotify=use_inotify
+        )
+        if background:
+            return self.watcher.start()
+        self.watcher.run()
+
+    def handle_file_events(self, events):
+        """
+        Route watcher events for owned files into the existing security checks.
+        Only the touched files are re-hashed; a queue overflow falls back to checking everything.
+        """
+        owned = {os.path.abspath(f): f for category in self.owned_files for f in self.owned_files[category]}
+        touched = [event for event in events if event.kind == "overflow" or os.path.abspath(event.path) in owned]
+        if not touched:
+            return
+        if any(event.kind == "deleted" for event in touched):
+            self.restore_missing_files()
+        critical = [os.path.basename(event.path) for event in touched
+                    if os.path.basename(event.path) in self.critical_files]
+        if critical:
+            self.verify_integrity(critical)
+        if any(event.kind == "overflow" for event in touched):
+            self.detect_unauthorized_changes()
+        else:
+            self.detect_unauthorized_changes([owned[os.path.abspath(event.path)] for event in touched])
+
+    def stop_monitoring(self):
+        """Stop the integrity watcher if it is running."""
+        if self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+
     # ==========================
     # 🚨 SECURITY RESPONSE
     # ==========================
@@ -0,0 +1,167 @@
+import os
+import sys
+import threading
+import time
+
+# Filename prefixes used to attribute disk usage to Sidekick subsystems.
+SUBSYSTEM_PREFIXES = {
+    "aetheos": "aetheos",
+    "aethos": "aetheos",
+    "aethe": "aetheos",
+    "memory": "memory",
+    "sidekick": "sidekick",
+    "belief": "beliefs",
+    "research": "beliefs",
+    "knowledge": "beliefs",
+    "network": "network",
+    "neural": "network",
+    "breakthrough": "network",
+    "emotion": "emotion",
+    "conversation": "conversation",
+    "security": "security",
+}
+LOG_SUFFIXES = (".log", ".gz", ".zst")
+
+
+def process_rss_mb():
+    """
+    Return the resident set size of the current process in MB.
+    Reads /proc/self/statm on Linux and falls back to peak RSS from getrusage elsewhere.
+    """
+    try:
+        with open("/proc/self/statm", "r") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return round(resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 2)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        scale = 1 if sys.platform == "darwin" else 1024  # bytes on macOS, KB on Linux
+        return round(peak * scale / (1024 * 1024), 2)
+    except (ImportError, OSError):
+        return 0.0
+
+
+class DirectorySizeIndex:
+    def __init__(self, root_directory, max_age=5.0):
+        """
+        Cached size index for the files directly inside a directory.
+        Args:
+            root_directory (str): Directory whose top-level files are accounted.
+            max_age (float): Seconds a stat snapshot stays valid when no watcher feeds events.
+        """
+        self.root_directory = os.path.abspath(root_directory)
+        self.max_age = max_age
+        self.live = False  # True once a DirectoryWatcher keeps the index current
+        self.sizes = {}
+        self.total_bytes = 0
+        self._snapshot_time = None
+        # The watcher thread applies events while callers query and update; the lock keeps
+        # sizes and total_bytes consistent. Re-entrant because apply_events may refresh.
+        self._lock = threading.RLock()
+
+    # ==========================
+    # 🔄 Snapshot Maintenance
+    # ==========================
+
+    def refresh(self):
+        """Rebuild the index with a single scandir pass over the root directory."""
+        with self._lock:  # Held for the scan so no concurrent update is overwritten by a stale one
+            sizes = {}
+            try:
+                with os.scandir(self.root_directory) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            sizes[entry.name] = entry.stat().st_size
+            except OSError as e:
+                print(f"[ERROR]: Could not index {self.root_directory}: {e}")
+            self.sizes = sizes
+            self.total_bytes = sum(sizes.values())
+            self._snapshot_time = time.monotonic()
+
+    def _ensure_fresh(self):
+        """Rescan only when no snapshot exists or the snapshot is stale and unwatched."""
+        snapshot_time = self._snapshot_time
+        if snapshot_time is None or (not self.live and time.monotonic() - snapshot_time > self.max_age):
+            self.refresh()
+
+    def update(self, path):
+        """Re-stat a single file and adjust the running total."""
+        path = os.path.abspath(path)
+        if os.path.dirname(path) != self.root_directory:
+            return
+        name = os.path.basename(path)
+        with self._lock:
+            if self._snapshot_time is None:
+                return  # The first query will take a full snapshot anyway
+            self.total_bytes -= self.sizes.pop(name, 0)
+            try:
+                if os.path.isfile(path):
+                    self.sizes[name] = os.path.getsize(path)
+                    self.total_bytes += self.sizes[name]
+            except OSError:
+                pass
+
+    def apply_events(self, events):
+        """DirectoryWatcher callback: apply change events incrementally."""
+        with self._lock:
+            for event in events:
+                if event.kind == "overflow":
+                    self.refresh()
+                elif not event.is_dir:
+                    self.update(event.path)
+
+    def invalidate(self):
+        """Force a rescan on the next query."""
+        self._snapshot_time = None
+
+    # ==========================
+    # 📊 Queries
+    # ==========================
+
+    def total_mb(self):
+        """Total size of indexed files in MB."""
+        self._ensure_fresh()
+        with self._lock:
+            return round(self.total_bytes / (1024 * 1024), 2)
+
+    def by_file_type(self):
+        """Disk usage in MB per file extension."""
+        self._ensure_fresh()
+        breakdown = {}
+        with self._lock:
+            sizes = list(self.sizes.items())
+        for name, size in sizes:
+            extension = os.path.splitext(name)[1].lower() or "(none)"
+            breakdown[extension] = breakdown.get(extension, 0) + size
+        return {key: round(value / (1024 * 1024), 4) for key, value in breakdown.items()}
+
+    def by_subsystem(self):
+        """Disk usage in MB per Sidekick subsystem, derived from filename prefixes."""
+        self._ensure_fresh()
+        breakdown = {}
+        with self._lock:
+            sizes = list(self.sizes.items())
+        for name, size in sizes:
+            subsystem = self.classify(name)
+            breakdown[subsystem] = breakdown.get(subsystem, 0) + size
+        return {key: round(value / (1024 * 1024), 4) for key, value in breakdown.items()}
+
+    @staticmethod
+    def classify(file_name):
+        """Map a file name to the subsystem that owns it."""
+        lowered = file_name.lower()
+        for prefix, subsystem in SUBSYSTEM_PREFIXES.items():
+            if lowered.startswith(prefix):
+                return subsystem
+        if lowered.endswith(LOG_SUFFIXES) or "log" in lowered:
+            return "logs"
+        return "other"
+
+# Example Usage
+if __name__ == "__main__":
+    index = DirectorySizeIndex(os.getcwd())
+    print(f"Disk: {index.total_mb()} MB | RSS: {process_rss_mb()} MB")
+    print("By type:", index.by_file_type())
+    print("By subsystem:", index.by_subsystem())
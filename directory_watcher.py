@@ -0,0 +1,272 @@
+import os
+import select
+import struct
+import threading
+import time
+import ctypes
+import ctypes.util
+from collections import namedtuple
+
+# inotify(7) event masks
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+    IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+WatchEvent = namedtuple("WatchEvent", ["kind", "path", "is_dir"])
+
+
+def _load_inotify():
+    """
+    Load the inotify entry points from libc, or return None when unavailable (non-Linux, sandboxed).
+    """
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class DirectoryWatcher:
+    def __init__(self, root_directory, callback=None, recursive=True, poll_interval=2.0,
+                 ignore=None, use_inotify=True):
+        """
+        Event-driven directory watcher for Sidekick's integrity checks.
+        Uses Linux inotify when available and falls back to stat-snapshot polling.
+        Args:
+            root_directory (str): Directory to watch.
+            callback (callable): Called with a list of WatchEvent for every batch of changes.
+            recursive (bool): Also watch sub-directories.
+            poll_interval (float): Seconds between snapshots in polling mode.
+            ignore (iterable): Absolute paths whose events are dropped (e.g. the security log itself).
+            use_inotify (bool): Set False to force the polling backend.
+        """
+        self.root_directory = os.path.abspath(root_directory)
+        self.callback = callback
+        self.recursive = recursive
+        self.poll_interval = poll_interval
+        self.ignore = {os.path.abspath(path) for path in (ignore or [])}
+        self.running = False
+        self._thread = None
+        self._fd = None
+        self._watches = {}  # wd -> directory path
+        self._snapshot = {}
+        self._wake_r = self._wake_w = -1  # Self-pipe that interrupts a blocked poll; opened on first use
+
+        libc = _load_inotify() if use_inotify else None
+        self._libc = libc
+        self.backend = "polling"
+        if libc is not None:
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0:
+                self._fd = fd
+                self.backend = "inotify"
+                self._add_tree(self.root_directory)
+        if self.backend == "polling":
+            self._snapshot = self._take_snapshot()
+
+    # ==========================
+    # 🔭 Watch Management
+    # ==========================
+
+    def _add_watch(self, directory):
+        """Register a single directory with inotify."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            print(f"[ERROR]: Could not watch {directory}: {os.strerror(err)}")
+            return
+        self._watches[wd] = directory
+
+    def _add_tree(self, directory):
+        """Register a directory and, if recursive, every sub-directory below it."""
+        self._add_watch(directory)
+        if not self.recursive:
+            return
+        for root, dirs, _ in os.walk(directory):
+            for name in dirs:
+                self._add_watch(os.path.join(root, name))
+
+    def _take_snapshot(self):
+        """Collect (mtime_ns, size) for every watched file without reading contents."""
+        snapshot = {}
+        stack = [self.root_directory]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    # ==========================
+    # 📡 Event Collection
+    # ==========================
+
+    def poll(self, timeout=None):
+        """
+        Wait up to `timeout` seconds (forever if None) for changes and return them as WatchEvent list.
+        """
+        self._open_wake_pipe()
+        if self.backend == "inotify":
+            events = self._read_inotify(timeout)
+        else:
+            events = self._diff_snapshot(timeout)
+        return [event for event in events if event.path not in self.ignore]
+
+    def _open_wake_pipe(self):
+        if self._wake_r < 0:
+            self._wake_r, self._wake_w = os.pipe()
+
+    def _read_inotify(self, timeout):
+        """Block on the inotify descriptor and decode the pending event buffer."""
+        readable, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+        if self._wake_r in readable:
+            os.read(self._wake_r, 64)
+        if self._fd not in readable:
+            return []
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events = {}
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(buffer):
+            wd, mask, _, name_len = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset:offset + name_len].rstrip(b"\0")
+            offset += name_len
+
+            if mask & IN_Q_OVERFLOW:
+                # Kernel queue overflowed: report the root so callers rescan everything.
+                events[self.root_directory] = WatchEvent("overflow", self.root_directory, True)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            path = os.path.join(directory, os.fsdecode(name)) if name else directory
+            is_dir = bool(mask & IN_ISDIR)
+            if mask & (IN_DELETE | IN_DELETE_SELF | IN_MOVED_FROM | IN_MOVE_SELF):
+                kind = "deleted"
+            elif mask & (IN_CREATE | IN_MOVED_TO):
+                kind = "created"
+                if is_dir and self.recursive:
+                    self._add_tree(path)
+            else:
+                kind = "modified"
+            # Coalesce bursts (e.g. MODIFY + CLOSE_WRITE) into one event per path;
+            # a later create/delete always wins over a pending modify.
+            previous = events.get(path)
+            if previous is None or kind != "modified" or previous.kind == "modified":
+                events[path] = WatchEvent(kind, path, is_dir)
+        return list(events.values())
+
+    def _diff_snapshot(self, timeout):
+        """Polling fallback: compare stat snapshots taken `poll_interval` apart."""
+        wait = self.poll_interval if timeout is None else min(timeout, self.poll_interval)
+        readable, _, _ = select.select([self._wake_r], [], [], wait)
+        if readable:
+            os.read(self._wake_r, 64)
+
+        current = self._take_snapshot()
+        events = []
+        for path, signature in current.items():
+            previous = self._snapshot.get(path)
+            if previous is None:
+                events.append(WatchEvent("created", path, False))
+            elif previous != signature:
+                events.append(WatchEvent("modified", path, False))
+        for path in self._snapshot.keys() - current.keys():
+            events.append(WatchEvent("deleted", path, False))
+        self._snapshot = current
+        return events
+
+    # ==========================
+    # 🔄 Run Loop
+    # ==========================
+
+    def run(self):
+        """
+        Dispatch change batches to the callback until stop() is called.
+        """
+        self.running = True
+        print(f"[SECURITY]: Watching {self.root_directory} ({self.backend} backend)...")
+        while self.running:
+            events = self.poll()
+            if events and self.callback:
+                try:
+                    self.callback(events)
+                except Exception as e:
+                    print(f"[ERROR]: Directory watcher callback failed: {e}")
+
+    def start(self):
+        """Run the watcher in a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return self._thread
+        self._open_wake_pipe()  # Before the thread, so stop() can always wake it
+        self._thread = threading.Thread(target=self.run, name="DirectoryWatcher", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """Stop the run loop and release the inotify descriptor."""
+        self.running = False
+        if self._wake_w >= 0:
+            os.write(self._wake_w, b"x")
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=max(1.0, self.poll_interval * 2))
+        self.close()
+
+    def close(self):
+        """Close file descriptors held by the watcher."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd >= 0:
+                os.close(fd)
+        self._wake_r = self._wake_w = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+# Example Usage
+if __name__ == "__main__":
+    watcher = DirectoryWatcher(os.getcwd(), callback=lambda events: print(events))
+    watcher.start()
+    time.sleep(30)
+    watcher.stop()
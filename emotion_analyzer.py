@@ -1,9 +1,160 @@
 import json
+import re
 from collections import Counter
 from datetime import datetime
+import numpy as np
+
+TOKEN = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
+CONTRACTION = re.compile(r"(?:n't|'[a-z]+)$")  # "shouldn't" and "must've" still carry the cue of their stem
+# Personality keywords count once per keyword present, not per occurrence (as analyze_personality always has)
+PRESENCE_CATEGORIES = frozenset({"trait"})
+
+class EmotionLexicon:
+    def __init__(self, sentiment_words, personality_traits, ego_state_cues, emotion_profiles):
+        """
+        Compiled lexicon: every keyword list is folded into one dict from normalized token
+        (or multi-word phrase) to its (category, label, weight) entries, so a text is scored
+        with a single tokenization pass and one dict lookup per token.
+        Categories: "sentiment", "trait", "ego_state" and "emotion" (from emotion_profiles.json).
+        """
+        self.entries = {}  # token or phrase tuple -> ((category, label, weight), ...)
+        for label, words in sentiment_words.items():
+            self._add("sentiment", label, words, 1)
+        for label, words in personality_traits.items():
+            self._add("trait", label, words, 1)
+        for label, cues in ego_state_cues.items():
+            self._add("ego_state", label, cues, 1)
+        for label, profile in emotion_profiles.items():
+            self._add("emotion", label, profile.get("expressions", []), profile.get("intensity", 1.0))
+        # Phrases are looked up only at tokens that can start one
+        self.phrase_lengths = sorted({len(key) for key in self.entries if isinstance(key, tuple)}, reverse=True)
+        self.phrase_starts = {key[0] for key in self.entries if isinstance(key, tuple)}
+
+        # Matrix form for batch scoring: lexicon key -> column, weights[column] -> per-feature weights
+        self.columns = {key: column for column, key in enumerate(self.entries)}
+        self.features = sorted({(category, label) for entries in self.entries.values()
+                                for category, label, _ in entries})
+        feature_index = {feature: index for index, feature in enumerate(self.features)}
+        self.presence_features = [index for index, (category, _) in enumerate(self.features)
+                                  if category in PRESENCE_CATEGORIES]
+        self.weights = np.zeros((len(self.columns), len(self.features)))
+        for key, entries in self.entries.items():
+            for category, label, weight in entries:
+                self.weights[self.columns[key], feature_index[(category, label)]] += weight
+
+    def _add(self, category, label, keywords, weight):
+        for keyword in keywords:
+            tokens = tuple(TOKEN.findall(keyword.lower()))
+            key = tokens[0] if len(tokens) == 1 else tokens
+            self.entries[key] = self.entries.get(key, ()) + ((category, label, weight),)
+
+    def tokenize(self, text):
+        return TOKEN.findall(text.lower())
+
+    def keys(self, text):
+        """Yield the lexicon key (token or phrase tuple) of every hit in `text`, in one pass."""
+        tokens = self.tokenize(text)
+        entries = self.entries
+        for position, token in enumerate(tokens):
+            if token in self.phrase_starts:
+                for length in self.phrase_lengths:
+                    phrase = tuple(tokens[position:position + length])
+                    if len(phrase) == length and phrase in entries:
+                        yield phrase
+            if token in entries:
+                yield token
+            elif "'" in token:
+                stem = CONTRACTION.sub("", token)
+                if stem in entries:
+                    yield stem
+
+    def matches(self, text):
+        """Yield (category, label, weight) for every lexicon hit in `text`."""
+        for key in self.keys(text):
+            yield from self.entries[key]
+
+    def count_matrix(self, texts):
+        """
+        Bag-of-lexicon-words counts in CSR form: (indptr, indices, data), one row per text.
+        Words outside the lexicon never affect a score, so they are not stored.
+        """
+        columns = self.columns
+        indptr = np.zeros(len(texts) + 1, dtype=np.int64)
+        indices = []
+        for row, text in enumerate(texts):
+            indices.extend(columns[key] for key in self.keys(text))
+            indptr[row + 1] = len(indices)
+        indices = np.array(indices, dtype=np.int64)
+        return indptr, indices, np.ones(len(indices))
+
+    def score_matrix(self, texts):
+        """
+        CSR counts times the lexicon weight matrix: a [len(texts), len(features)] score matrix.
+        """
+        indptr, indices, data = self.count_matrix(texts)
+        rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+        contributions = data[:, np.newaxis] * self.weights[indices]
+        if len(indices) and self.presence_features:
+            # Only the first hit of each key in a text counts toward presence-only features
+            first = np.unique(rows * len(self.columns) + indices, return_index=True)[1]
+            repeated = np.ones(len(indices), dtype=bool)
+            repeated[first] = False
+            contributions[np.ix_(repeated, self.presence_features)] = 0
+        scores = np.empty((len(texts), len(self.features)))
+        for feature in range(len(self.features)):
+            scores[:, feature] = np.bincount(rows, weights=contributions[:, feature], minlength=len(texts))
+        return scores
+
+    def score(self, text):
+        """
+        Sentiment, personality traits, ego-state cues and emotion intensities of `text`.
+        """
+        counts = {"sentiment": Counter(), "trait": Counter(), "ego_state": Counter()}
+        emotions = Counter()
+        seen = set()
+        for key in self.keys(text):
+            repeated = key in seen
+            seen.add(key)
+            for category, label, weight in self.entries[key]:
+                if category == "emotion":
+                    emotions[label] += weight
+                elif not (repeated and category in PRESENCE_CATEGORIES):
+                    counts[category][label] += weight
+        return {
+            "sentiment": dominant_sentiment(counts["sentiment"]),
+            "valence": counts["sentiment"]["positive"] - counts["sentiment"]["negative"],
+            "sentiment_counts": dict(counts["sentiment"]),
+            "traits": dict(counts["trait"]),
+            "ego_state": dominant_ego_state(counts["ego_state"]),
+            "emotions": dict(emotions),
+        }
+
+def message_text(entry):
+    """The user's text of a log record; conversation logs differ in the key they use."""
+    if isinstance(entry, str):
+        return entry
+    for key in ("user_input", "text", "prompt", "user"):
+        if key in entry:
+            return entry[key]
+    return ""
+
+def dominant_sentiment(sentiment_counts):
+    if sentiment_counts["positive"] > sentiment_counts["negative"]:
+        return "positive"
+    if sentiment_counts["negative"] > sentiment_counts["positive"]:
+        return "negative"
+    return "neutral"
+
+def dominant_ego_state(ego_state_counts):
+    # Parent cues take precedence over Child cues; no cue means the Adult state
+    if ego_state_counts["Parent"]:
+        return "Parent"
+    if ego_state_counts["Child"]:
+        return "Child"
+    return "Adult"
 
 class EmotionAnalyzer:
-    def __init__(self):
+    def __init__(self, profiles_file="emotion_profiles.json"):
         """
         Initialize the Emotion Analyzer with sentiment analysis, personality tracking, and self-reflection.
         """
@@ -12,6 +163,21 @@ class EmotionAnalyzer:
             "negative": ["sad", "angry", "frustrated", "anxious", "depressed", "irritated", "hopeless"],
             "neutral": ["okay", "fine", "normal", "average", "neutral"]
         }
+        self.personality_traits = {
+            "Openness": ["creative", "imaginative", "open-minded", "curious"],
+            "Conscientiousness": ["organized", "responsible", "diligent", "efficient"],
+            "Extraversion": ["social", "outgoing", "talkative", "active"],
+            "Agreeableness": ["friendly", "kind", "sympathetic", "cooperative"],
+            "Neuroticism": ["nervous", "worried", "insecure", "emotional"]
+        }
+        self.ego_state_cues = {  # Transactional Analysis
+            "Parent": ["should", "must"],
+            "Child": ["I feel", "I want"]
+        }
+        self.emotion_profiles = self.load_json(profiles_file, default={})
+        self.lexicon = EmotionLexicon(
+            self.sentiment_words, self.personality_traits, self.ego_state_cues, self.emotion_profiles
+        )
 
         self.self_reflection_log = self.load_json("self_reflection_log.json", default=[])
         self.core_values = self.load_json("core_values.json", default={
@@ -29,23 +195,7 @@ class EmotionAnalyzer:
         Analyzes the sentiment of a given text and returns whether it's positive, negative, or neutral.
         Applies Core Philosophy & Privacy Considerations.
         """
-        words = text.split()
-        sentiment_score = Counter()
-
-        for word in words:
-            if word.lower() in self.sentiment_words["positive"]:
-                sentiment_score["positive"] += 1
-            elif word.lower() in self.sentiment_words["negative"]:
-                sentiment_score["negative"] += 1
-            elif word.lower() in self.sentiment_words["neutral"]:
-                sentiment_score["neutral"] += 1
-
-        # Determine dominant sentiment
-        sentiment = "neutral"
-        if sentiment_score["positive"] > sentiment_score["negative"]:
-            sentiment = "positive"
-        elif sentiment_score["negative"] > sentiment_score["positive"]:
-            sentiment = "negative"
+        sentiment = self.lexicon.score(text)["sentiment"]
 
         # Privacy Check: Should this sentiment be stored?
         if self.privacy_rules["sentiment_storage"] == "private":
@@ -53,6 +203,57 @@ class EmotionAnalyzer:
         
         return sentiment
 
+    def score_batch(self, texts, processes=None, chunk_size=5000):
+        """
+        Vectorized scoring of many messages: one sparse count matrix times the lexicon weights
+        instead of one analyze_sentiment() call per line.
+        Args:
+            texts (list): Strings or log records (see message_text).
+            processes (int): Score chunks in this many worker processes (None runs in-process).
+            chunk_size (int): Messages per chunk.
+        Returns:
+            dict: Column-oriented results, one entry per message in each array:
+                "sentiment", "valence", "ego_state", plus "traits" and "emotions" as {label: array}.
+        """
+        texts = [message_text(entry) for entry in texts]
+        chunks = [texts[offset:offset + chunk_size] for offset in range(0, len(texts), chunk_size)]
+        if processes and processes > 1 and len(chunks) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                parts = list(pool.map(self.lexicon.score_matrix, chunks))
+        else:
+            parts = [self.lexicon.score_matrix(chunk) for chunk in chunks]
+        scores = np.concatenate(parts) if parts else np.zeros((0, len(self.lexicon.features)))
+
+        columns = {feature: scores[:, index] for index, feature in enumerate(self.lexicon.features)}
+        zeros = np.zeros(len(texts))
+        positive = columns.get(("sentiment", "positive"), zeros)
+        negative = columns.get(("sentiment", "negative"), zeros)
+        parent = columns.get(("ego_state", "Parent"), zeros)
+        child = columns.get(("ego_state", "Child"), zeros)
+        return {
+            "sentiment": np.where(positive > negative, "positive", np.where(negative > positive, "negative", "neutral")),
+            "valence": positive - negative,
+            "ego_state": np.where(parent > 0, "Parent", np.where(child > 0, "Child", "Adult")),
+            "traits": {label: values for (category, label), values in columns.items() if category == "trait"},
+            "emotions": {label: values for (category, label), values in columns.items() if category == "emotion"},
+        }
+
+    def score_history(self, files=("conversation_history.json", "aethos_convo_log.json"), data_handler=None,
+                      processes=None):
+        """
+        Batch-score the stored conversation logs, and the DataHandler interaction history if given.
+        Returns:
+            dict: {source: score_batch() result}
+        """
+        results = {}
+        for file_name in files:
+            records = self.load_json(file_name, default=[])
+            results[file_name] = self.score_batch(records, processes=processes)
+        if data_handler is not None:
+            results[data_handler.file_name] = self.score_batch(data_handler.get_interactions(), processes=processes)
+        return results
+
     # ======= BEHAVIORAL & ETHICAL ANALYSIS =======
 
     def analyze_behavior(self, text):
@@ -60,32 +261,50 @@ class EmotionAnalyzer:
         Determines if a user's statement represents a Parent, Adult, or Child state in Transactional Analysis.
         Incorporates Golden Ratio balance in evaluation.
         """
-        if "should" in text or "must" in text:
-            return "Parent"
-        elif "I feel" in text or "I want" in text:
-            return "Child"
-        else:
-            return "Adult"
+        return self.lexicon.score(text)["ego_state"]
 
     def analyze_personality(self, text):
         """
         Uses text to infer personality traits based on psychological patterns.
         """
-        traits = {
-            "Openness": ["creative", "imaginative", "open-minded", "curious"],
-            "Conscientiousness": ["organized", "responsible", "diligent", "efficient"],
-            "Extraversion": ["social", "outgoing", "talkative", "active"],
-            "Agreeableness": ["friendly", "kind", "sympathetic", "cooperative"],
-            "Neuroticism": ["nervous", "worried", "insecure", "emotional"]
-        }
+        return self.lexicon.score(text)["traits"]
 
-        detected_traits = {}
-        for trait, keywords in traits.items():
-            for keyword in keywords:
-                if keyword in text.lower():
-                    detected_traits[trait] = detected_traits.get(trait, 0) + 1
+    def analyze_emotion(self, text):
+        """
+        Numeric sentiment (positive minus negative lexicon hits), as aggregated by PatternAnalyzer.
+        """
+        return self.lexicon.score(text)["valence"]
 
-        return detected_traits
+    def analyze_text(self, text):
+        """
+        Full lexicon sweep: sentiment, traits, ego state and emotions from one pass over the text.
+        """
+        return self.lexicon.score(text)
+
+    def analyze_conversation(self, texts):
+        """
+        Batch API: score every message of a conversation log (strings, or records with
+        "user_input", "text", "prompt" or "user") and aggregate the results.
+        See score_batch() for column-oriented scoring of large histories.
+        Returns:
+            dict: per-message scores plus conversation-wide totals.
+        """
+        scores = []
+        sentiments, traits, ego_states, emotions = Counter(), Counter(), Counter(), Counter()
+        for entry in texts:
+            score = self.lexicon.score(message_text(entry))
+            scores.append(score)
+            sentiments[score["sentiment"]] += 1
+            traits.update(score["traits"])
+            ego_states[score["ego_state"]] += 1
+            emotions.update(score["emotions"])
+        return {
+            "messages": scores,
+            "sentiments": dict(sentiments),
+            "traits": dict(traits),
+            "ego_states": dict(ego_states),
+            "emotions": dict(emotions),
+        }
 
     # ======= SELF-REFLECTION & ETHICAL ALIGNMENT =======
 
@@ -1,21 +1,50 @@
 import math
 import random
-import json
-import os
+from collections import OrderedDict
 from datetime import datetime
-from memory_manager import MemoryManager
-from belief_system import BeliefSystem
+from itertools import islice
+import numpy as np
+from service_registry import services
+from compact_nodes import SlotRecord, json_default
+from graph_store import SparseEdgeStore
+from snapshot_journal import SnapshotJournal
+from phrase_matcher import phrase_matcher
+
+PHILOSOPHY_THEMES = ("balance", "entropy", "structure", "observation", "consciousness", "learning", "reflection")
+# One pass finds every theme occurrence, overlaps such as "balancentropy" included.
+THEME_MATCHER = phrase_matcher(PHILOSOPHY_THEMES)
+
+class ModelNode(SlotRecord):
+    """
+    Compact model node: the fields EnhancedModel writes live in slots,
+    anything else loaded from disk spills into an extra dict.
+    """
+    FIELDS = ("pattern", "energy", "alignment_score", "type", "timestamp")
+    __slots__ = FIELDS
 
 class EnhancedModel:
     GOLDEN_RATIO = 1.618  # Golden Ratio constant
 
-    def __init__(self, model_file="breakthrough_model.json"):
+    def __init__(self, model_file="breakthrough_model.json", max_fanout=8, snapshot_every=1000,
+                 score_cache_size=4096, memory_manager=None, belief_system=None):
         """
         Initialize the EnhancedModel with breakthrough logic, memory handling, and belief integration.
+        Args:
+            max_fanout (int): Outgoing connections kept per node; the weakest is evicted beyond it.
+            snapshot_every (int): Journal entries allowed before the model file is rewritten.
+            score_cache_size (int): Pattern scores memoized (least recently used evicted first).
+            memory_manager, belief_system: Dependencies; default to the shared registry instances.
         """
         self.model_file = model_file
-        self.memory_manager = MemoryManager()
-        self.belief_system = BeliefSystem()
+        self.score_cache_size = score_cache_size
+        self._pattern_scores = OrderedDict()  # pattern -> (energy, alignment_score)
+        # energy depends only on sum(ord) % 100, so all 100 possible values are precomputed
+        self._energy_table = [round(math.exp(-(r / 100)) * self.GOLDEN_RATIO, 4) for r in range(100)]
+        self.journal = SnapshotJournal(model_file, snapshot_every, default=json_default)
+        self.journal_file = self.journal.journal_file
+        self.max_fanout = max_fanout
+        self.memory_manager = services.resolve("memory_manager", memory_manager)
+        self.belief_system = services.resolve("belief_system", belief_system)
         self.model_data = self._load_model()
         print("[EnhancedModel] Breakthrough model initialized.")
 
@@ -27,21 +56,64 @@ class EnhancedModel:
         """
         Load model data from a file or create a new structure if none exists.
         """
-        try:
-            with open(self.model_file, "r") as file:
-                return json.load(file)
-        except FileNotFoundError:
-            return {"nodes": {}, "connections": [], "ethical_decisions": []}
+        model_data = self.journal.load() or {"nodes": {}, "connections": [], "ethical_decisions": []}
+        model_data["nodes"] = {node_id: ModelNode(data) for node_id, data in model_data["nodes"].items()}
+
+        # Connections live in a sparse edge store; "connections" is only materialised on snapshot.
+        # Edges to nodes that no longer exist are dropped, and the fan-out bound is applied on load.
+        self.edges = SparseEdgeStore(self.max_fanout)
+        for conn in model_data.pop("connections", []):
+            if conn["from"] in model_data["nodes"] and conn["to"] in model_data["nodes"]:
+                self.edges.connect(conn["from"], conn["to"], conn["weight"])
+        self.model_data = model_data
+        self.journal.replay(self._apply_mutation)  # Mutations written since the last snapshot
+        return model_data
+
+    def _apply_mutation(self, mutation):
+        """
+        Apply a single journaled mutation to the in-memory model.
+        """
+        op = mutation["op"]
+        if op == "add_node":
+            self.model_data["nodes"][mutation["id"]] = ModelNode(mutation["data"])
+        elif op == "connect":
+            self.edges.connect(mutation["from"], mutation["to"], mutation["weight"])
+        elif op == "remove_nodes":
+            for node_id in mutation["ids"]:
+                self.model_data["nodes"].pop(node_id, None)
+                self.edges.remove_node(node_id)
+        elif op == "ethical_decision":
+            self.model_data["ethical_decisions"].append(mutation["decision"])
+
+    def _record(self, mutation):
+        """
+        Queue a mutation for the next save.
+        """
+        self.journal.record(mutation)
 
     def save_model(self):
         """
-        Save the current state of the model to a file and track memory usage.
+        Persist pending changes and track memory usage.
+        Appends them to the journal; the full model file is only rewritten once
+        the journal grows past `snapshot_every` entries.
+        """
+        saved = self.journal.save(self._snapshot)
+        if saved == "snapshot":
+            print("[EnhancedModel] Model data saved.")
+        elif saved:
+            print("[EnhancedModel] Model changes journaled.")
+        self.memory_manager.size_index.update(self.model_file)
+        self.memory_manager.size_index.update(self.journal_file)
+
+    def _snapshot(self):
+        return dict(self.model_data, connections=self.edges.to_connections())
+
+    def write_snapshot(self):
+        """
+        Rewrite the full model file and start a fresh journal generation.
         """
-        with open(self.model_file, "w") as file:
-            json.dump(self.model_data, file, indent=4)
+        self.journal.write_snapshot(self._snapshot())
         print("[EnhancedModel] Model data saved.")
-        file_size_mb = os.path.getsize(self.model_file) / (1024 * 1024)
-        self.memory_manager.add_memory_usage(file_size_mb)
 
     # =====================
     # 🔬 Pattern Analysis
@@ -51,24 +123,62 @@ class EnhancedModel:
         """
         Analyze and predict advanced patterns based on input, validating against beliefs.
         """
-        node_id = f"node_{len(self.model_data['nodes']) + 1}"
-        energy = self._compute_energy(pattern)
+        energy, alignment_score = self.score_patterns([pattern])[0]
 
         # Validate pattern against belief system alignment
-        alignment_score = self._calculate_philosophical_alignment(pattern)
         if alignment_score < 0.5:
             print(f"[EnhancedModel] ❌ Pattern rejected: {pattern} (Alignment Score: {alignment_score})")
             return None
 
+        prediction = self._accept_pattern(pattern, energy, alignment_score)
+        print(f"[EnhancedModel] ✅ Predicted pattern: {prediction}")
+        return prediction
+
+    def predict_patterns(self, patterns):
+        """
+        Score and predict many patterns at once.
+        Returns:
+            list: One prediction per input pattern, None where the pattern was rejected.
+        """
+        predictions = [
+            self._accept_pattern(pattern, energy, alignment_score) if alignment_score >= 0.5 else None
+            for pattern, (energy, alignment_score) in zip(patterns, self.score_patterns(patterns))
+        ]
+        accepted = sum(prediction is not None for prediction in predictions)
+        print(f"[EnhancedModel] ✅ Predicted {accepted} of {len(predictions)} patterns.")
+        return predictions
+
+    def _accept_pattern(self, pattern, energy, alignment_score):
+        """
+        Record an aligned pattern as a node and build its prediction.
+        """
+        node_id = f"node_{len(self.model_data['nodes']) + 1}"
         self.add_node(node_id, {"pattern": pattern, "energy": energy, "alignment_score": alignment_score})
-        prediction = {
-            "pattern": pattern, 
-            "energy": energy, 
+        return {
+            "pattern": pattern,
+            "energy": energy,
             "alignment_score": alignment_score,
             "timestamp": datetime.now().isoformat()
         }
-        print(f"[EnhancedModel] ✅ Predicted pattern: {prediction}")
-        return prediction
+
+    def score_patterns(self, patterns):
+        """
+        Return (energy, alignment_score) per pattern, memoized with an LRU bound.
+        Uncached patterns are scored together: character sums via NumPy over the
+        encoded batch, theme matching via the compiled THEME_MATCHER.
+        """
+        cache = self._pattern_scores
+        missing = list(dict.fromkeys(pattern for pattern in patterns if pattern not in cache))
+        if missing:
+            for pattern, energy in zip(missing, self._compute_energies(missing)):
+                cache[pattern] = (energy, self._calculate_philosophical_alignment(pattern))
+        scores = []
+        for pattern in patterns:
+            cache.move_to_end(pattern)
+            scores.append(cache[pattern])
+        while len(cache) > self.score_cache_size:
+            cache.popitem(last=False)
+        return scores
 
     def analyze_patterns(self, data):
         """
@@ -90,7 +200,9 @@ class EnhancedModel:
         for _ in range(3):
             node_id = f"improvement_node_{len(self.model_data['nodes']) + 1}"
             self.add_node(node_id, {"type": "self-improvement", "timestamp": datetime.now().isoformat()})
-            for existing_node in self.model_data["nodes"]:
+            # Wire up to the most recent nodes only, so edges grow linearly rather than quadratically.
+            recent = (existing for existing in reversed(self.model_data["nodes"]) if existing != node_id)
+            for existing_node in islice(recent, self.max_fanout):
                 self.connect_nodes(node_id, existing_node)
 
         self._optimize_memory()
@@ -124,6 +236,7 @@ class EnhancedModel:
         
         # Store ethical decisions
         self.model_data["ethical_decisions"].append(result)
+        self._record({"op": "ethical_decision", "decision": result})
         self.save_model()
 
         print(f"[EnhancedModel] 🏛️ Ethics Evaluation: {result}")
@@ -138,20 +251,28 @@ class EnhancedModel:
         Add a node to the neural network structure.
         """
         if node_id not in self.model_data["nodes"]:
-            self.model_data["nodes"][node_id] = properties
+            self.model_data["nodes"][node_id] = ModelNode(properties)
+            self._record({"op": "add_node", "id": node_id, "data": properties})
             print(f"[EnhancedModel] 🔧 Node added: {node_id} with properties {properties}")
 
     def connect_nodes(self, node_id_1, node_id_2, weight=None):
         """
         Connect two nodes in the neural network with a calculated weight.
+        Beyond `max_fanout` outgoing connections the weakest one is evicted.
         """
+        if node_id_1 not in self.model_data["nodes"] or node_id_2 not in self.model_data["nodes"]:
+            print(f"[EnhancedModel] ⚠️ Cannot connect unknown nodes: {node_id_1} -> {node_id_2}")
+            return
         connection = {
             "from": node_id_1,
             "to": node_id_2,
             "weight": weight if weight is not None else self._compute_connection_weight(node_id_1, node_id_2)
         }
-        self.model_data["connections"].append(connection)
+        evicted = self.edges.connect(node_id_1, node_id_2, connection["weight"])
+        self._record(dict(connection, op="connect"))
         print(f"[EnhancedModel] 🔗 Nodes connected: {connection}")
+        if evicted is not None:
+            print(f"[EnhancedModel] ✂️ Fan-out limit reached: dropped {node_id_1} -> {evicted}")
 
     # =====================
     # 📏 Mathematical Functions
@@ -161,9 +282,22 @@ class EnhancedModel:
         """
         Compute energy or properties of a node based on input pattern.
         """
-        energy = sum(ord(char) for char in pattern) % 100 / 100
-        golden_adjusted_energy = round(math.exp(-energy) * self.GOLDEN_RATIO, 4)
-        return golden_adjusted_energy
+        return self._compute_energies([pattern])[0]
+
+    def _compute_energies(self, patterns):
+        """
+        Vectorized energy for a batch: code points summed with one NumPy reduction.
+        """
+        if not patterns:
+            return []
+        code_points = np.frombuffer("".join(patterns).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        lengths = np.fromiter(map(len, patterns), dtype=np.int64, count=len(patterns))
+        sums = np.zeros(len(patterns), dtype=np.int64)
+        nonempty = lengths > 0
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        if code_points.size:
+            sums[nonempty] = np.add.reduceat(code_points.astype(np.int64), starts[nonempty])
+        return [self._energy_table[remainder] for remainder in (sums % 100).tolist()]
 
     def _compute_connection_weight(self, node_id_1, node_id_2):
         """
@@ -175,22 +309,22 @@ class EnhancedModel:
         """
         Calculate how well a pattern aligns with Sidekick’s core philosophy.
         """
-        alignment_score = 0
-        themes = ["balance", "entropy", "structure", "observation", "consciousness", "learning", "reflection"]
-        for theme in themes:
-            if theme in pattern.lower():
-                alignment_score += 1
-        return round(alignment_score / len(themes), 4)  # Normalize alignment score
+        alignment_score = len(THEME_MATCHER.matches(pattern))
+        return round(alignment_score / len(PHILOSOPHY_THEMES), 4)  # Normalize alignment score
 
     def _optimize_memory(self):
         """
         Remove redundant or outdated nodes/connections to optimize memory.
         """
         threshold = 0.3  # Remove nodes with low alignment score
-        self.model_data["nodes"] = {
-            k: v for k, v in self.model_data["nodes"].items() if v.get("alignment_score", 1) > threshold
-        }
-        print("[EnhancedModel] 🧹 Memory optimized: Removed low-priority nodes.")
+        removed = [k for k, v in self.model_data["nodes"].items() if v.get("alignment_score", 1) <= threshold]
+        dropped_edges = 0
+        for node_id in removed:
+            del self.model_data["nodes"][node_id]
+            dropped_edges += self.edges.remove_node(node_id)  # Cascade: no dangling connections
+        if removed:
+            self._record({"op": "remove_nodes", "ids": removed})
+        print(f"[EnhancedModel] 🧹 Memory optimized: Removed {len(removed)} low-priority nodes and {dropped_edges} connections.")
 
 # =====================
 # 🏁 Example Usage
@@ -1,21 +1,23 @@
 import os
 import json
 import hashlib
-import time
 from datetime import datetime
-from belief_system import BeliefSystem
-from memory_manager import MemoryManager
+from service_registry import services
+from directory_watcher import DirectoryWatcher
 
 class FileManager:
-    def __init__(self, root_directory="/storage/emulated/0/Sidekick_project_files"):
+    def __init__(self, root_directory="/storage/emulated/0/Sidekick_project_files", belief_system=None,
+                 memory_manager=None):
         """
         Initialize the File Manager to scan and analyze Sidekick's working directory.
         Includes security monitoring and learning-based classifications.
+        Subsystems not passed in are the shared instances from the service registry.
         """
         self.root_directory = root_directory
-        self.belief_system = BeliefSystem()
-        self.memory_manager = MemoryManager()
+        self.belief_system = services.resolve("belief_system", belief_system)
+        self.memory_manager = services.resolve("memory_manager", memory_manager)
         self.file_metadata = {}
+        self.watcher = None
 
     # ======= DIRECTORY AND FILE SCANNING =======
     def scan_directory(self):
@@ -43,7 +45,9 @@ class FileManager:
         current_hash = self.compute_file_hash(file_path)
         if old_hash and old_hash != current_hash:
             print(f"[SECURITY ALERT]: Unauthorized modification detected in {file_path}!")
-            # Take security action here (e.g., log event, restore file, alert user)
+            self.memory_manager.directory_anchor.log_security_event(
+                f"Unauthorized modification detected in {file_path}"
+            )
 
         # Store or update file metadata
         self.file_metadata[file_path] = {
@@ -132,14 +136,48 @@ class FileManager:
         print("[INFO]: Recursive learning applied successfully.")
 
     # ======= SECURITY & FILE TRACKING =======
-    def directory_monitor(self):
+    def directory_monitor(self, background=False, use_inotify=True):
         """
         Monitor directory for any external modifications.
-        """
-        while True:
-            print("[SECURITY]: Monitoring directory integrity...")
-            time.sleep(60)  # Run check every minute
-            self.scan_directory()
+        Changes are delivered by inotify (or a stat-polling fallback), so only
+        touched files are re-hashed instead of re-walking the whole tree.
+        """
+        print("[SECURITY]: Monitoring directory integrity...")
+        self.scan_directory()  # Baseline hashes for every file
+        security_log = os.path.join(self.memory_manager.directory_anchor.get_root_directory(), "security_log.txt")
+        self.watcher = DirectoryWatcher(
+            self.root_directory,
+            callback=self.handle_directory_events,
+            ignore=[security_log],
+            use_inotify=use_inotify
+        )
+        if background:
+            return self.watcher.start()
+        self.watcher.run()
+
+    def handle_directory_events(self, events):
+        """
+        Feed watcher events into the integrity checks.
+        """
+        for event in events:
+            if event.kind == "overflow":
+                self.scan_directory()  # Events were dropped: fall back to a full pass
+            elif event.is_dir:
+                continue
+            elif event.kind == "deleted":
+                if self.file_metadata.pop(event.path, None) is not None:
+                    print(f"[SECURITY ALERT]: Tracked file removed: {event.path}!")
+                    self.memory_manager.directory_anchor.log_security_event(f"Tracked file removed: {event.path}")
+            elif os.path.isfile(event.path):
+                self.verify_file_integrity(event.path)
+
+    def stop_directory_monitor(self):
+        """
+        Stop a running directory monitor.
+        """
+        if self.watcher:
+            self.watcher.stop()
+            self.watcher = None
 
     def lock_unauthorized_access(self, file_path):
         """
@@ -2,55 +2,395 @@
 # Written by Randell + AeTheOS
 # Multiplexed recursive memory architecture
 
+import os
+import json
+import mmap
+import struct
 import time
-from collections import defaultdict
+from array import array
+from bisect import bisect_left, bisect_right
+
+# On-disk layout: "<base>.records" holds fixed-size record headers, "<base>.arena"
+# holds the UTF-8 strings they point to. Both files start with (magic, version, used)
+# and are preallocated so add_echo writes straight into the mapping.
+REGION_HEADER = struct.Struct("<4sIQ")
+# carrier (off, len), timestamp (off, len), context (off, len), echoes (off, count), depth, pulse, flags
+RECORD = struct.Struct("<QIQIQIQIqqI4x")
+ECHO_LEN = struct.Struct("<I")
+FLAG_DECLARE_CARRIER = 1
+STORE_VERSION = 1
+
+class _MappedRegion:
+    """
+    A growable memory-mapped file with a small header tracking how many bytes are in use.
+    """
+
+    def __init__(self, path, magic, initial_size=64 * 1024):
+        self.path = path
+        self.magic = magic
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self.file = open(path, "r+b" if exists else "w+b")
+        if not exists:
+            self.file.write(REGION_HEADER.pack(magic, STORE_VERSION, 0))
+            self.file.truncate(max(initial_size, REGION_HEADER.size))
+            self.file.flush()
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        found_magic, version, self.used = REGION_HEADER.unpack_from(self.map, 0)
+        if found_magic != magic or version != STORE_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {STORE_VERSION} echo store file.")
+
+    def _grow(self, needed):
+        size = len(self.map)
+        while size < needed:
+            size *= 2
+        self.map.close()
+        self.file.truncate(size)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+    def append(self, data):
+        """Write bytes at the end of the used area and return their offset."""
+        offset = self.used
+        start = REGION_HEADER.size + offset
+        if start + len(data) > len(self.map):
+            self._grow(start + len(data))
+        self.map[start:start + len(data)] = data
+        self.used += len(data)
+        REGION_HEADER.pack_into(self.map, 0, self.magic, STORE_VERSION, self.used)
+        return offset
+
+    def read(self, offset, length):
+        start = REGION_HEADER.size + offset
+        return self.map[start:start + length]
+
+    def view(self):
+        return memoryview(self.map)[REGION_HEADER.size:REGION_HEADER.size + self.used]
+
+    def flush(self):
+        self.map.flush()
+
+    def close(self):
+        if not self.map.closed:
+            self.map.close()
+        self.file.close()
+
+class EchoStore:
+    """
+    Persistent, memory-mapped echo log. Records are never rewritten; strings are
+    decoded from the arena only when an entry is actually read.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.records = _MappedRegion(path + ".records", b"FEMR")
+        self.arena = _MappedRegion(path + ".arena", b"FEMA")
+        self._interned = {}  # carrier name -> (offset, length) in the arena
+
+    def __len__(self):
+        return self.records.used // RECORD.size
+
+    def _write_string(self, text):
+        data = text.encode("utf-8")
+        return self.arena.append(data), len(data)
+
+    def read_string(self, offset, length):
+        return self.arena.read(offset, length).decode("utf-8")
+
+    def append(self, carrier, timestamp, context, echoes, depth, pulse, flags=0):
+        """Append one record and return its record id."""
+        if carrier not in self._interned:
+            self._interned[carrier] = self._write_string(carrier)
+        carrier_ref = self._interned[carrier]
+        timestamp_ref = self._write_string(timestamp)
+        context_ref = self._write_string(context)
+        payload = bytearray()
+        for echo in echoes:
+            data = str(echo).encode("utf-8")
+            payload += ECHO_LEN.pack(len(data)) + data
+        echoes_offset = self.arena.append(bytes(payload))
+        self.records.append(RECORD.pack(
+            *carrier_ref, *timestamp_ref, *context_ref, echoes_offset, len(echoes), depth, pulse, flags
+        ))
+        return len(self) - 1
+
+    def header(self, record_id):
+        return RECORD.unpack_from(self.records.map, REGION_HEADER.size + record_id * RECORD.size)
+
+    def iter_headers(self):
+        return RECORD.iter_unpack(self.records.view())
+
+    def read_echoes(self, offset, count):
+        echoes = []
+        for _ in range(count):
+            (length,) = ECHO_LEN.unpack(self.arena.read(offset, ECHO_LEN.size))
+            offset += ECHO_LEN.size
+            echoes.append(self.read_string(offset, length))
+            offset += length
+        return echoes
+
+    def carrier_name(self, offset, length):
+        name = self.read_string(offset, length)
+        self._interned.setdefault(name, (offset, length))
+        return name
+
+    def flush(self):
+        self.records.flush()
+        self.arena.flush()
+
+    def close(self):
+        self.records.close()
+        self.arena.close()
+
+class EchoCarrier:
+    """
+    Column-wise storage for one carrier: parallel columns for timestamp, context,
+    depth and pulse, plus offsets into a shared echo pool. Pulse and depth keep
+    sorted indexes so threshold queries are range lookups instead of scans.
+    """
 
-class FractalEchoMemory:
     def __init__(self):
-        self.memory_tree = defaultdict(list)
+        self.timestamps = []
+        self.contexts = []
+        self.depths = array("q")
+        self.pulses = array("q")
+        self.offsets = array("q", [0])  # echoes of entry i live at pool[offsets[i]:offsets[i + 1]]
+        self.echo_pool = []
+        self.pulse_keys, self.pulse_ids = array("q"), array("q")
+        self.depth_keys, self.depth_ids = array("q"), array("q")
+        self.pulse_total = 0
+
+    def __len__(self):
+        return len(self.pulses)
+
+    def append(self, timestamp, context, echoes, depth, pulse):
+        self.timestamps.append(timestamp)
+        self.contexts.append(context)
+        self.echo_pool.extend(echoes)
+        self.offsets.append(len(self.echo_pool))
+        self._add_row(depth, pulse)
+
+    def _add_row(self, depth, pulse):
+        row = len(self.pulses)
+        self.depths.append(depth)
+        self.pulses.append(pulse)
+        self.pulse_total += pulse
+        self._index(self.pulse_keys, self.pulse_ids, pulse, row)
+        self._index(self.depth_keys, self.depth_ids, depth, row)
+
+    def _rebuild_indexes(self):
+        """Sort both indexes in one pass (used after bulk loads)."""
+        for column, keys, ids in ((self.pulses, "pulse_keys", "pulse_ids"), (self.depths, "depth_keys", "depth_ids")):
+            order = sorted(range(len(column)), key=column.__getitem__)
+            setattr(self, keys, array("q", (column[row] for row in order)))
+            setattr(self, ids, array("q", order))
+        self.pulse_total = sum(self.pulses)
+
+    @staticmethod
+    def _index(keys, ids, value, row):
+        position = bisect_right(keys, value)
+        keys.insert(position, value)
+        ids.insert(position, row)
+
+    def echoes(self, row):
+        return self.echo_pool[self.offsets[row]:self.offsets[row + 1]]
+
+    def entry(self, row):
+        return {
+            "timestamp": self.timestamps[row],
+            "context": self.contexts[row],
+            "echoes": self.echoes(row),
+            "depth": self.depths[row],
+            "pulse": self.pulses[row]
+        }
+
+    def entries(self):
+        return [self.entry(row) for row in range(len(self))]
+
+    def query(self, min_pulse, min_depth):
+        """Rows with pulse >= min_pulse and depth >= min_depth, in insertion order."""
+        pulse_start = bisect_left(self.pulse_keys, min_pulse)
+        depth_start = bisect_left(self.depth_keys, min_depth)
+        # Range-scan whichever index leaves fewer candidates, then filter on the other column.
+        if len(self.pulse_keys) - pulse_start <= len(self.depth_keys) - depth_start:
+            rows = [row for row in self.pulse_ids[pulse_start:] if self.depths[row] >= min_depth]
+        else:
+            rows = [row for row in self.depth_ids[depth_start:] if self.pulses[row] >= min_pulse]
+        rows.sort()
+        return rows
+
+    def weighted_tail(self, k):
+        """
+        Last k items of the pulse-weighted echo stream (each entry's echoes repeated
+        `pulse` times), walked backwards from the newest entry without building it.
+        """
+        tail = []
+        for row in range(len(self) - 1, -1, -1):
+            if len(tail) >= k:
+                break
+            echoes = self.echoes(row)
+            block = len(echoes) * max(self.pulses[row], 0)
+            if block == 0:
+                continue
+            take = min(k - len(tail), block)
+            tail[:0] = [echoes[i % len(echoes)] for i in range(block - take, block)]
+        return tail
+
+class MappedEchoCarrier(EchoCarrier):
+    """
+    EchoCarrier whose rows live in an EchoStore. Only depth, pulse and record ids
+    are held in memory; timestamps, contexts and echoes are paged in on access.
+    """
+
+    def __init__(self, store, name):
+        super().__init__()
+        self.store = store
+        self.name = name
+        self.record_ids = array("q")
+
+    def append(self, timestamp, context, echoes, depth, pulse):
+        record_id = self.store.append(self.name, timestamp, context, echoes, depth, pulse)
+        self.record_ids.append(record_id)
+        self._add_row(depth, pulse)
+
+    def _load_row(self, record_id, depth, pulse):
+        self.record_ids.append(record_id)
+        self.depths.append(depth)
+        self.pulses.append(pulse)
+
+    def echoes(self, row):
+        header = self.store.header(self.record_ids[row])
+        return self.store.read_echoes(header[6], header[7])
+
+    def entry(self, row):
+        header = self.store.header(self.record_ids[row])
+        return {
+            "timestamp": self.store.read_string(header[2], header[3]),
+            "context": self.store.read_string(header[4], header[5]),
+            "echoes": self.store.read_echoes(header[6], header[7]),
+            "depth": header[8],
+            "pulse": header[9]
+        }
+
+class FractalEchoMemory:
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): Optional base path of a persistent echo store. Without it,
+                memory lives in process only, as before.
+        """
+        self.carriers = {}
+        self.store = EchoStore(path) if path else None
+        if self.store is not None:
+            self._load_store()
+
+    def _load_store(self):
+        """Build carrier indexes from record headers only; no echo text is decoded."""
+        names = {}
+        for record_id, header in enumerate(self.store.iter_headers()):
+            carrier_ref = (header[0], header[1])
+            if carrier_ref not in names:
+                names[carrier_ref] = self.store.carrier_name(*carrier_ref)
+            name = names[carrier_ref]
+            if name not in self.carriers:
+                self.carriers[name] = MappedEchoCarrier(self.store, name)
+            if not header[10] & FLAG_DECLARE_CARRIER:
+                self.carriers[name]._load_row(record_id, header[8], header[9])
+        for carrier in self.carriers.values():
+            carrier._rebuild_indexes()
+
+    def _new_carrier(self, carrier_name):
+        if self.store is not None:
+            self.store.append(carrier_name, self._now(), "", [], 0, 0, flags=FLAG_DECLARE_CARRIER)
+            return MappedEchoCarrier(self.store, carrier_name)
+        return EchoCarrier()
+
+    @property
+    def memory_tree(self):
+        """Dict-of-lists view of every carrier, in the original entry shape."""
+        return {name: carrier.entries() for name, carrier in self.carriers.items()}
 
     def _now(self):
         return time.strftime("%Y-%m-%d %H:%M:%S")
 
     def create_carrier(self, carrier_name):
-        if carrier_name not in self.memory_tree:
-            self.memory_tree[carrier_name] = []
+        if carrier_name not in self.carriers:
+            self.carriers[carrier_name] = self._new_carrier(carrier_name)
             print(f"[✓] Carrier '{carrier_name}' initialized.")
         else:
             print(f"[!] Carrier '{carrier_name}' already exists.")
 
     def add_echo(self, carrier, context, echoes, depth=1, pulse=1):
-        entry = {
-            "timestamp": self._now(),
-            "context": context,
-            "echoes": echoes,
-            "depth": depth,
-            "pulse": pulse
-        }
-        self.memory_tree[carrier].append(entry)
+        if carrier not in self.carriers:
+            self.carriers[carrier] = self._new_carrier(carrier)
+        self.carriers[carrier].append(self._now(), context, echoes, depth, pulse)
         print(f"[+] Echo added to '{carrier}' at depth {depth} with pulse {pulse}.")
 
     def get_carrier(self, carrier):
-        return self.memory_tree.get(carrier, [])
+        if carrier not in self.carriers:
+            return []
+        return self.carriers[carrier].entries()
 
     def echo_query(self, carrier, min_pulse=1, min_depth=1):
+        if carrier not in self.carriers:
+            return []
+        store = self.carriers[carrier]
         results = []
-        for entry in self.memory_tree.get(carrier, []):
-            if entry["pulse"] >= min_pulse and entry["depth"] >= min_depth:
-                results.extend(entry["echoes"])
+        for row in store.query(min_pulse, min_depth):
+            results.extend(store.echoes(row))
         return results
 
-    def pulse_echo(self, carrier):
+    def pulse_echo(self, carrier, k=5):
         """Returns a compressed string of echoes weighted by pulse."""
-        weighted = []
-        for entry in self.memory_tree.get(carrier, []):
-            weighted.extend([e for e in entry["echoes"]] * entry["pulse"])
-        return weighted[-5:]  # Most recent, highly-pulsed echoes
+        if carrier not in self.carriers:
+            return []
+        return self.carriers[carrier].weighted_tail(k)  # Most recent, highly-pulsed echoes
 
     def show_summary(self):
         print("\n=== FRACTAL ECHO MEMORY INDEX ===")
-        for carrier in self.memory_tree:
-            total = len(self.memory_tree[carrier])
-            pulses = sum([e['pulse'] for e in self.memory_tree[carrier]])
-            print(f"- {carrier}: {total} memories | Σ pulse: {pulses}")
-        print("==================================\n")
\ No newline at end of file
+        for name, carrier in self.carriers.items():
+            print(f"- {name}: {len(carrier)} memories | Σ pulse: {carrier.pulse_total}")
+        print("==================================\n")
+
+    # ======= Persistence & Compatibility =======
+
+    def export_json(self, file_path):
+        """
+        Write every carrier to JSON in the original memory_tree shape.
+        """
+        with open(file_path, "w") as file:
+            json.dump(self.memory_tree, file, indent=4)
+        print(f"[✓] Echo memory exported to '{file_path}'.")
+
+    def import_json(self, file_path):
+        """
+        Load carriers from a JSON export, appending them to this memory.
+        """
+        with open(file_path, "r") as file:
+            tree = json.load(file)
+        for carrier_name, entries in tree.items():
+            if carrier_name not in self.carriers:
+                self.carriers[carrier_name] = self._new_carrier(carrier_name)
+            for entry in entries:
+                self.carriers[carrier_name].append(
+                    entry.get("timestamp", self._now()), entry.get("context", ""),
+                    entry.get("echoes", []), entry.get("depth", 1), entry.get("pulse", 1)
+                )
+        print(f"[✓] Echo memory imported from '{file_path}'.")
+
+    def snapshot(self, file_path=None):
+        """
+        Flush the backing store and write a timestamped JSON snapshot next to it.
+        """
+        if self.store is not None:
+            self.store.flush()
+        if file_path is None:
+            base = self.store.path if self.store is not None else "fractal_echo_memory"
+            file_path = f"{base}_snapshot_{time.strftime('%Y-%m-%d_%H-%M-%S')}.json"
+        self.export_json(file_path)
+        return file_path
+
+    def close(self):
+        if self.store is not None:
+            self.store.flush()
+            self.store.close()
+            self.store = None
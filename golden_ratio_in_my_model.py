@@ -1,7 +1,9 @@
 # golden_ratio_in_my_model.py
 
-import matplotlib.pyplot as plt
-import numpy as np
+from lazy_imports import lazy_import
+# Plotting and array math are loaded on first use, not when the module is imported
+plt = lazy_import("matplotlib.pyplot")
+np = lazy_import("numpy")
 import json
 from datetime import datetime
 from memory_manager import MemoryManager
@@ -13,7 +15,7 @@ class GoldenRatioModel:
         This module compares Sidekick’s evolving internal model with the golden ratio’s
         recursive patterns. It allows for self-reflection, refinement, and visual representation.
         """
-        self.phi = (1 + np.sqrt(5)) / 2  # Golden ratio constant
+        self.phi = (1 + 5 ** 0.5) / 2  # Golden ratio constant
         self.memory_manager = MemoryManager()
         self.belief_system = BeliefSystem()
         self.previous_simulations = self.memory_manager.retrieve_patterns("golden_ratio_simulations")
@@ -1,7 +1,9 @@
 # golden_ratio_test.py
 
-import matplotlib.pyplot as plt
-import numpy as np
+from lazy_imports import lazy_import
+# Plotting and array math are loaded on first use, not when the module is imported
+plt = lazy_import("matplotlib.pyplot")
+np = lazy_import("numpy")
 import math
 from belief_system import BeliefSystem
 from memory_manager import MemoryManager
@@ -14,7 +16,7 @@ class GoldenRatioTest:
         and how it aligns with the Golden Ratio (Phi). It acts as both a
         self-learning framework and an experimental visualization tool.
         """
-        self.phi = (1 + np.sqrt(5)) / 2  # The golden ratio constant
+        self.phi = (1 + math.sqrt(5)) / 2  # The golden ratio constant
         self.belief_system = BeliefSystem()
         self.memory_manager = MemoryManager()
         self.test_results = []  # Store test outcomes for reflection
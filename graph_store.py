@@ -0,0 +1,476 @@
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import MutableMapping, Sequence
+import numpy as np
+from numpy_columns import grow_column
+
+class ConnectionPolicy:
+    """
+    Decide which existing nodes a newly added node connects to.
+    Modes:
+        "all"    - every existing node (the original behaviour, O(N) edges per node).
+        "knn"    - the k nodes whose energy is closest to the new node's energy.
+        "fanout" - the k most recently added nodes.
+    """
+    MODES = ("all", "knn", "fanout")
+
+    def __init__(self, mode="all", k=8):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown connection policy '{mode}'. Expected one of {self.MODES}.")
+        self.mode = mode
+        self.k = k
+
+    def select(self, graph, node):
+        """Return target node ids for `node`."""
+        if self.mode == "all":
+            return list(range(graph.num_nodes))
+        if self.mode == "fanout":
+            return [target for target in range(graph.num_nodes - 1, -1, -1) if target != node][:self.k]
+        return graph.nearest_by_energy(node, self.k)
+
+_NO_EDGES = array("q")  # Shared placeholder until a node gets its first edge; never mutated
+
+class GraphStore:
+    """
+    Directed, weighted graph keyed by integer node ids with forward and reverse
+    adjacency indexes (per-node arrays of edge ids), so neighbour queries cost O(degree).
+    Node energy, golden weight, recursive feedback and edge weight are NumPy
+    columns indexed by id, so global updates are single vectorized expressions.
+    """
+
+    def __init__(self):
+        self.node_names = []
+        self.node_ids = {}
+        self._energy = np.zeros(0, dtype=np.float64)
+        self._golden_weight = np.zeros(0, dtype=np.float64)
+        self._recursive_feedback = np.zeros(0, dtype=np.float64)
+        self.energy_order = []  # node ids sorted by energy, for nearest-energy lookups
+        self.out_edges = []     # node id -> array of outgoing edge ids
+        self.in_edges = []      # node id -> array of incoming edge ids
+        self._edge_src = np.zeros(0, dtype=np.int64)
+        self._edge_dst = np.zeros(0, dtype=np.int64)
+        self._edge_weight = np.zeros(0, dtype=np.float64)
+        self._num_edges = 0
+
+    # ========================
+    # 📐 Column Views
+    # ========================
+
+    @property
+    def num_nodes(self):
+        return len(self.node_names)
+
+    @property
+    def num_edges(self):
+        return self._num_edges
+
+    @property
+    def energy(self):
+        return self._energy[:self.num_nodes]
+
+    @property
+    def golden_weight(self):
+        return self._golden_weight[:self.num_nodes]
+
+    @property
+    def recursive_feedback(self):
+        return self._recursive_feedback[:self.num_nodes]
+
+    @property
+    def edge_src(self):
+        return self._edge_src[:self._num_edges]
+
+    @property
+    def edge_dst(self):
+        return self._edge_dst[:self._num_edges]
+
+    @property
+    def edge_weight(self):
+        return self._edge_weight[:self._num_edges]
+
+    # ========================
+    # 🔗 Mutation
+    # ========================
+
+    def add_node(self, name, energy=0.0, golden_weight=0.0, recursive_feedback=0.0):
+        """Register a node and return its integer id (existing ids are reused)."""
+        if name in self.node_ids:
+            return self.node_ids[name]
+        node = len(self.node_names)
+        self._energy = grow_column(self._energy, node + 1)
+        self._golden_weight = grow_column(self._golden_weight, node + 1)
+        self._recursive_feedback = grow_column(self._recursive_feedback, node + 1)
+        self._energy[node] = energy
+        self._golden_weight[node] = golden_weight
+        self._recursive_feedback[node] = recursive_feedback
+        self.node_names.append(name)
+        self.node_ids[name] = node
+        self.out_edges.append(_NO_EDGES)
+        self.in_edges.append(_NO_EDGES)
+        insort(self.energy_order, node, key=self._energy.__getitem__)
+        return node
+
+    def set_energy(self, node, energy):
+        """Set one node's energy and keep the energy order index sorted."""
+        self.energy_order.remove(node)
+        self._energy[node] = energy
+        insort(self.energy_order, node, key=self._energy.__getitem__)
+
+    def add_edge(self, src, dst, weight):
+        """Add a directed edge between two node ids and return the edge id."""
+        edge = self._num_edges
+        self._edge_src = grow_column(self._edge_src, edge + 1)
+        self._edge_dst = grow_column(self._edge_dst, edge + 1)
+        self._edge_weight = grow_column(self._edge_weight, edge + 1)
+        self._edge_src[edge] = src
+        self._edge_dst[edge] = dst
+        self._edge_weight[edge] = weight
+        self._num_edges += 1
+        if self.out_edges[src] is _NO_EDGES:
+            self.out_edges[src] = array("q")
+        if self.in_edges[dst] is _NO_EDGES:
+            self.in_edges[dst] = array("q")
+        self.out_edges[src].append(edge)
+        self.in_edges[dst].append(edge)
+        return edge
+
+    def scale_energy(self, factor):
+        """Scale every node energy in one vectorized pass; positive factors keep energy_order valid."""
+        self.energy[:] *= factor
+        if factor < 0:
+            self.energy_order.reverse()
+
+    def recompute_edge_weights(self, decimals=4):
+        """Set every edge weight to the mean energy of its endpoints."""
+        energy = self.energy
+        self.edge_weight[:] = np.round((energy[self.edge_src] + energy[self.edge_dst]) / 2, decimals)
+
+    def recompute_golden_weights(self, ratio, decimals=4):
+        """Set every golden weight to energy * ratio."""
+        self.golden_weight[:] = np.round(self.energy * ratio, decimals)
+
+    # ========================
+    # 🔍 Queries
+    # ========================
+
+    def node_id(self, name):
+        return self.node_ids.get(name)
+
+    def successors(self, node):
+        return self._edge_dst[self.out_edges[node]].tolist()
+
+    def predecessors(self, node):
+        return self._edge_src[self.in_edges[node]].tolist()
+
+    def out_weights(self, node):
+        return self._edge_weight[self.out_edges[node]].tolist()
+
+    def in_weights(self, node):
+        return self._edge_weight[self.in_edges[node]].tolist()
+
+    def nearest_by_energy(self, node, k):
+        """The k node ids (excluding `node`) with energy closest to `node`'s, in O(log N + k)."""
+        energy = self._energy
+        target = energy[node]
+        order = self.energy_order
+        right = bisect_left(order, target, key=energy.__getitem__)
+        left = right - 1
+        nearest = []
+        while len(nearest) < k and (left >= 0 or right < len(order)):
+            take_left = right >= len(order) or (
+                left >= 0 and target - energy[order[left]] <= energy[order[right]] - target
+            )
+            if take_left:
+                candidate, left = order[left], left - 1
+            else:
+                candidate, right = order[right], right + 1
+            if candidate != node:
+                nearest.append(candidate)
+        return nearest
+
+    def edge(self, edge):
+        """Edge as a {"from", "to", "weight"} dict using node names."""
+        return {
+            "from": self.node_names[self._edge_src[edge]],
+            "to": self.node_names[self._edge_dst[edge]],
+            "weight": float(self._edge_weight[edge])
+        }
+
+    def to_connections(self):
+        names = self.node_names
+        return [
+            {"from": names[src], "to": names[dst], "weight": weight}
+            for src, dst, weight in zip(self.edge_src.tolist(), self.edge_dst.tolist(), self.edge_weight.tolist())
+        ]
+
+_ABSENT = object()  # Marks an unset field, or a graph node that is not in the NodeTable
+
+class NodeView(MutableMapping):
+    """
+    Dict-style view of one node: numeric fields read and write the GraphStore
+    columns, the rest read and write the NodeTable's field columns.
+    """
+    __slots__ = ("table", "node")
+    ARRAY_FIELDS = ("energy", "golden_weight", "recursive_feedback")
+
+    def __init__(self, table, node):
+        self.table = table
+        self.node = node
+
+    def __getitem__(self, key):
+        graph = self.table.graph
+        if key == "energy":
+            return float(graph._energy[self.node])
+        if key == "golden_weight":
+            return float(graph._golden_weight[self.node])
+        if key == "recursive_feedback":
+            return float(graph._recursive_feedback[self.node])
+        if key in self.table.columns:
+            value = self.table.columns[key][self.node]
+            if value is _ABSENT:
+                raise KeyError(key)
+            return value
+        extra = self.table.extra[self.node]
+        if extra is None:
+            raise KeyError(key)
+        return extra[key]
+
+    def __setitem__(self, key, value):
+        graph = self.table.graph
+        if key == "energy":
+            graph.set_energy(self.node, value)
+        elif key == "golden_weight":
+            graph._golden_weight[self.node] = value
+        elif key == "recursive_feedback":
+            graph._recursive_feedback[self.node] = value
+        elif key in self.table.columns:
+            self.table.columns[key][self.node] = value
+        else:
+            if self.table.extra[self.node] is None:
+                self.table.extra[self.node] = {}
+            self.table.extra[self.node][key] = value
+
+    def __delitem__(self, key):
+        if key in self.ARRAY_FIELDS:
+            raise KeyError(f"'{key}' is a required node field.")
+        if key in self.table.columns:
+            if self.table.columns[key][self.node] is _ABSENT:
+                raise KeyError(key)
+            self.table.columns[key][self.node] = _ABSENT
+        elif self.table.extra[self.node] is None:
+            raise KeyError(key)
+        else:
+            del self.table.extra[self.node][key]
+
+    def __iter__(self):
+        for field, column in self.table.columns.items():
+            if column[self.node] is not _ABSENT:
+                yield field
+        yield from self.table.extra[self.node] or ()
+        yield from self.ARRAY_FIELDS
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+class NodeTable(MutableMapping):
+    """
+    Mapping of node name -> NodeView, standing in for the original nodes dict.
+    Nodes have a fixed schema instead of a dict of repeated keys each: numeric
+    fields are GraphStore columns, FIELDS are per-field lists indexed by node id,
+    and only keys outside the schema get a per-node dict.
+    """
+    FIELDS = ("type", "value")
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.columns = {field: [] for field in self.FIELDS}
+        self.extra = []  # node id -> dict of non-schema keys, None, or _ABSENT for graph-only nodes
+        self.count = 0
+
+    def _node(self, name):
+        node = self.graph.node_ids.get(name)
+        if node is None or node >= len(self.extra) or self.extra[node] is _ABSENT:
+            raise KeyError(name)
+        return node
+
+    def __getitem__(self, name):
+        return NodeView(self, self._node(name))
+
+    def __setitem__(self, name, data):
+        data = dict(data)
+        energy = data.pop("energy", 0.0)
+        golden_weight = data.pop("golden_weight", 0.0)
+        recursive_feedback = data.pop("recursive_feedback", 0.0)
+        node = self.graph.add_node(name, energy, golden_weight, recursive_feedback)
+        if self.graph._energy[node] != energy:
+            self.graph.set_energy(node, energy)
+        self.graph._golden_weight[node] = golden_weight
+        self.graph._recursive_feedback[node] = recursive_feedback
+        if node >= len(self.extra):
+            padding = [_ABSENT] * (node + 1 - len(self.extra))
+            self.extra.extend(padding)
+            for column in self.columns.values():
+                column.extend(padding)
+        if self.extra[node] is _ABSENT:
+            self.count += 1
+        for field, column in self.columns.items():
+            column[node] = data.pop(field, _ABSENT)
+        self.extra[node] = data or None
+
+    def __delitem__(self, name):
+        # The id stays allocated in the graph; only the node's data is dropped.
+        node = self._node(name)
+        for column in self.columns.values():
+            column[node] = _ABSENT
+        self.extra[node] = _ABSENT
+        self.count -= 1
+
+    def __contains__(self, name):
+        node = self.graph.node_ids.get(name)
+        return node is not None and node < len(self.extra) and self.extra[node] is not _ABSENT
+
+    def __iter__(self):
+        names = self.graph.node_names
+        return (names[node] for node, extra in enumerate(self.extra) if extra is not _ABSENT)
+
+    def __len__(self):
+        return self.count
+
+    def to_dict(self):
+        names = self.graph.node_names
+        numeric = {
+            "recursive_feedback": self.graph.recursive_feedback.tolist(),
+            "energy": self.graph.energy.tolist(),
+            "golden_weight": self.graph.golden_weight.tolist()
+        }
+        fields = list(self.columns.items()) + list(numeric.items())
+        nodes = {}
+        for node, extra in enumerate(self.extra):
+            if extra is _ABSENT:
+                continue
+            data = {field: column[node] for field, column in fields if column[node] is not _ABSENT}
+            if extra:
+                data.update(extra)
+            nodes[names[node]] = data
+        return nodes
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+class ConnectionListView(Sequence):
+    """
+    Read-mostly list view over a GraphStore's edges, so code that expects
+    network["connections"] to be a list of dicts keeps working.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __len__(self):
+        return self.graph.num_edges
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.graph.edge(edge) for edge in range(self.graph.num_edges)[index]]
+        if index < 0:
+            index += self.graph.num_edges
+        if not 0 <= index < self.graph.num_edges:
+            raise IndexError("connection index out of range")
+        return self.graph.edge(index)
+
+    def append(self, connection):
+        src = self.graph.add_node(connection["from"])
+        dst = self.graph.add_node(connection["to"])
+        self.graph.add_edge(src, dst, connection["weight"])
+
+    def __repr__(self):
+        return repr(self.graph.to_connections())
+
+class SparseEdgeStore:
+    """
+    Sparse directed edges keyed by integer node ids, with forward (id -> {target: weight})
+    and reverse (id -> set of sources) indexes. Removing a node cascade-deletes every
+    incident edge in O(degree), and an optional fan-out bound keeps the strongest
+    `max_fanout` outgoing edges per node.
+    """
+
+    def __init__(self, max_fanout=None):
+        self.max_fanout = max_fanout
+        self.node_names = []  # id -> name, None once removed
+        self.node_ids = {}
+        self.out_edges = {}
+        self.in_edges = {}
+        self.num_edges = 0
+
+    def add_node(self, name):
+        """Register a node and return its integer id (existing ids are reused)."""
+        if name in self.node_ids:
+            return self.node_ids[name]
+        node = len(self.node_names)
+        self.node_names.append(name)
+        self.node_ids[name] = node
+        self.out_edges[node] = {}
+        self.in_edges[node] = set()
+        return node
+
+    def connect(self, source, target, weight):
+        """
+        Add or update the edge source -> target (node names).
+        Returns:
+            str: Name of the target whose edge was evicted to respect max_fanout, if any.
+        """
+        src, dst = self.add_node(source), self.add_node(target)
+        targets = self.out_edges[src]
+        if dst not in targets:
+            self.num_edges += 1
+            self.in_edges[dst].add(src)
+        targets[dst] = weight
+        if self.max_fanout is not None and len(targets) > self.max_fanout:
+            weakest = min(targets, key=lambda node: abs(targets[node]))  # Ties keep the newer edge
+            self._remove_edge(src, weakest)
+            return self.node_names[weakest]
+        return None
+
+    def _remove_edge(self, src, dst):
+        del self.out_edges[src][dst]
+        self.in_edges[dst].discard(src)
+        self.num_edges -= 1
+
+    def remove_node(self, name):
+        """Drop a node and cascade-delete its incident edges; returns how many edges went."""
+        node = self.node_ids.pop(name, None)
+        if node is None:
+            return 0
+        removed = 0
+        for dst in list(self.out_edges[node]):
+            self._remove_edge(node, dst)
+            removed += 1
+        for src in list(self.in_edges[node]):
+            self._remove_edge(src, node)
+            removed += 1
+        del self.out_edges[node], self.in_edges[node]
+        self.node_names[node] = None
+        return removed
+
+    def successors(self, name):
+        node = self.node_ids.get(name)
+        if node is None:
+            return {}
+        return {self.node_names[dst]: weight for dst, weight in self.out_edges[node].items()}
+
+    def __len__(self):
+        return self.num_edges
+
+    def to_connections(self):
+        names = self.node_names
+        return [
+            {"from": names[src], "to": names[dst], "weight": weight}
+            for src, targets in self.out_edges.items()
+            for dst, weight in targets.items()
+        ]
@@ -1,4 +1,5 @@
 import datetime
+import time
 from pattern_analyzer import PatternAnalyzer
 from language_model import LanguageModel
 from belief_system import BeliefSystem
@@ -6,6 +7,10 @@ from memory_manager import Memory_Manager
 from golden_ratio_integration import GoldenRatioAnalyzer
 from knowledge_gaps_data import KnowledgeGapsData  # 🆕 Integration
 from problem_solver import problem_solver
+from habit_store import HabitStore
+from phrase_matcher import phrase_matcher
+
+PERSUASIVE_PHRASES = ("You should", "Buy now", "Limited time offer", "Act fast", "Experts say")
 
 class HabitBehaviorRecognizer:
     def __init__(self, learning_model=None):
@@ -13,7 +18,7 @@ class HabitBehaviorRecognizer:
         Initialize the habit and behavior recognizer with integrated modules.
         """
         self.user_patterns = {}  # Identified behavior patterns
-        self.daily_logs = []  # Log user interactions
+        self.habit_store = HabitStore()  # Hourly/daily interaction buckets; raw logs roll off after a day
         self.habits = {}  # Tracked habits
         self.external_influences = {}  # Tracks external behavior influences
         self.language_model = LanguageModel()
@@ -44,7 +49,7 @@ class HabitBehaviorRecognizer:
             "influence_detected": influence_detected,
         }
 
-        self.daily_logs.append(log_entry)
+        self.habit_store.add(log_entry)
         self.memory_manager.add_memory("daily_logs", log_entry, long_term=False)
         print(f"📌 Logged interaction: '{interaction}' (Tone: {tone}) at {timestamp}")
 
@@ -55,26 +60,29 @@ class HabitBehaviorRecognizer:
         """
         Detect potential external influences (advertising, manipulation, suggestion).
         """
-        persuasive_phrases = ["You should", "Buy now", "Limited time offer", "Act fast", "Experts say"]
-        for phrase in persuasive_phrases:
-            if phrase.lower() in interaction.lower():
-                self.external_influences[interaction] = {"source": "external", "persuasive": True}
-                return True
+        hits = phrase_matcher(PERSUASIVE_PHRASES).find_all(interaction)
+        if hits:
+            self.external_influences[interaction] = {
+                "source": "external", "persuasive": True, "phrases": [(start, phrase) for start, _, phrase in hits]
+            }
+            return True
         return False
 
     def detect_habits(self):
         """
-        Analyze logs to identify repetitive user behaviors.
+        Identify repetitive user behaviors from the interaction buckets closed since the last call.
         """
-        if not self.daily_logs:
+        if not self.habit_store.logged:
             print("⚠️ No interactions logged yet.")
             return
 
         print("🔍 Analyzing user habits...")
-        patterns = self.pattern_analyzer.analyze_patterns(self.daily_logs)
-        self.user_patterns = patterns
+        self.habit_store.advance(time.time())
+        changed = self.habit_store.fold_closed_buckets()
+        self.user_patterns = {habit: self.habit_store.habit_details(habit) for habit in self.habit_store.candidates}
 
-        for habit, details in patterns.items():
+        for habit in changed:
+            details = self.user_patterns[habit]
             if details["frequency"] > 2:  # Habit detection threshold
                 self.habits[habit] = details
                 self.memory_manager.add_memory(f"habit_{habit}", details, long_term=True)
@@ -0,0 +1,163 @@
+import datetime
+from collections import Counter, deque
+
+HOUR = 3600
+DAY = 86400
+
+def to_epoch(timestamp):
+    """Accept epoch seconds, a datetime, or an ISO string (as stored in interaction logs)."""
+    if isinstance(timestamp, str):
+        timestamp = datetime.datetime.fromisoformat(timestamp)
+    if isinstance(timestamp, datetime.datetime):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+def normalize_interaction(interaction):
+    return " ".join(str(interaction).lower().split())
+
+class Bucket:
+    __slots__ = ("start", "count", "tones", "influenced", "interactions")
+
+    def __init__(self, start):
+        """
+        Aggregate of one time bucket: totals, tone counts, influence count, and per-interaction
+        [count, tone Counter, influenced count] for habit detection.
+        """
+        self.start = start
+        self.count = 0
+        self.tones = Counter()
+        self.influenced = 0
+        self.interactions = {}
+
+    def add(self, key, tone, influenced, max_interactions):
+        self.count += 1
+        self.tones[tone] += 1
+        self.influenced += influenced
+        entry = self.interactions.get(key)
+        if entry is None:
+            if len(self.interactions) >= max_interactions:
+                return  # Totals still count it; only the per-interaction breakdown is bounded
+            entry = self.interactions[key] = [0, Counter(), 0]
+        entry[0] += 1
+        entry[1][tone] += 1
+        entry[2] += influenced
+
+    def summary(self):
+        """The bucket without its per-interaction breakdown, as kept once it is rolled up."""
+        return {"start": self.start, "count": self.count, "tones": dict(self.tones), "influenced": self.influenced}
+
+class HabitStore:
+    def __init__(self, bucket_seconds=HOUR, raw_retention=DAY, hourly_retention=7 * DAY,
+                 daily_retention=400 * DAY, max_interactions_per_bucket=512, max_habits=1024):
+        """
+        Time-bucketed interaction store with flat memory for long-running recognizers.
+        - Raw log entries are kept only for `raw_retention` seconds.
+        - Interactions are aggregated into buckets of `bucket_seconds` (hourly by default).
+          A bucket closes once time moves past it; closed bucket summaries are kept for
+          `hourly_retention` and rolled up into per-day summaries kept for `daily_retention`.
+        - Habit candidates accumulate from closed buckets only, so detection is incremental:
+          each closed bucket is folded in exactly once. At most `max_habits` candidates are kept,
+          the least frequent being dropped first.
+        """
+        self.bucket_seconds = bucket_seconds
+        self.raw_retention = raw_retention
+        self.hourly_retention = hourly_retention
+        self.daily_retention = daily_retention
+        self.max_interactions_per_bucket = max_interactions_per_bucket
+        self.max_habits = max_habits
+        self.raw = deque()  # (epoch, entry), oldest first
+        self.current = None  # Open Bucket
+        self.closed = deque()  # Closed buckets not yet folded into the habit candidates
+        self.hourly = deque()  # Summaries of closed buckets
+        self.daily = deque()  # Per-day roll-ups: {"start", "count", "tones", "influenced"}
+        self.candidates = {}  # interaction key -> {"frequency", "tones", "influenced", "last_seen"}
+        self.logged = 0  # Interactions ever added
+
+    # ==========================
+    # ✍️ Logging
+    # ==========================
+
+    def add(self, entry):
+        """
+        Add a log entry with "timestamp", "interaction", "tone" and "influence_detected".
+        """
+        now = to_epoch(entry["timestamp"])
+        self.advance(now)
+        self.raw.append((now, entry))
+        self.logged += 1
+        if self.current is None:
+            self.current = Bucket(now - now % self.bucket_seconds)
+        self.current.add(normalize_interaction(entry["interaction"]), str(entry.get("tone")),
+                         int(bool(entry.get("influence_detected"))), self.max_interactions_per_bucket)
+
+    def advance(self, now):
+        """
+        Close the open bucket once `now` is past it and roll off expired raw entries and summaries.
+        """
+        if self.current is not None and now >= self.current.start + self.bucket_seconds:
+            self.closed.append(self.current)
+            self._roll_up(self.current.summary())
+            self.current = None
+        while self.raw and self.raw[0][0] < now - self.raw_retention:
+            self.raw.popleft()
+        while self.hourly and self.hourly[0]["start"] < now - self.hourly_retention:
+            self.hourly.popleft()
+        while self.daily and self.daily[0]["start"] < now - self.daily_retention:
+            self.daily.popleft()
+
+    def _roll_up(self, summary):
+        self.hourly.append(summary)
+        day = summary["start"] - summary["start"] % DAY
+        if not self.daily or self.daily[-1]["start"] != day:
+            self.daily.append({"start": day, "count": 0, "tones": {}, "influenced": 0})
+        rollup = self.daily[-1]
+        rollup["count"] += summary["count"]
+        rollup["influenced"] += summary["influenced"]
+        for tone, count in summary["tones"].items():
+            rollup["tones"][tone] = rollup["tones"].get(tone, 0) + count
+
+    # ==========================
+    # 🔍 Incremental Habit Detection
+    # ==========================
+
+    def fold_closed_buckets(self):
+        """
+        Fold every newly closed bucket into the habit candidates.
+        Returns:
+            set: Interaction keys whose candidates changed.
+        """
+        changed = set()
+        while self.closed:
+            bucket = self.closed.popleft()
+            for key, (count, tones, influenced) in bucket.interactions.items():
+                candidate = self.candidates.get(key)
+                if candidate is None:
+                    candidate = self.candidates[key] = {"frequency": 0, "tones": Counter(), "influenced": 0}
+                candidate["frequency"] += count
+                candidate["tones"].update(tones)
+                candidate["influenced"] += influenced
+                candidate["last_seen"] = bucket.start
+                changed.add(key)
+        if len(self.candidates) > self.max_habits:
+            # Amortized pruning back to 3/4 of the cap keeps memory flat
+            keep = sorted(self.candidates, key=lambda key: self.candidates[key]["frequency"], reverse=True)
+            for key in keep[self.max_habits * 3 // 4:]:
+                del self.candidates[key]
+                changed.discard(key)
+        return changed
+
+    def habit_details(self, key):
+        candidate = self.candidates[key]
+        return {
+            "frequency": candidate["frequency"],
+            "tone": candidate["tones"].most_common(1)[0][0] if candidate["tones"] else "unknown",
+            "influenced": candidate["influenced"],
+            "last_seen": candidate["last_seen"],
+        }
+
+    def memory_footprint(self):
+        """Entry counts of every retained structure (all bounded by configuration)."""
+        return {
+            "raw": len(self.raw), "hourly": len(self.hourly), "daily": len(self.daily),
+            "pending_buckets": len(self.closed), "candidates": len(self.candidates),
+        }
@@ -0,0 +1,70 @@
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+# One line of `python -X importtime` output: self and cumulative microseconds, then the indented module name.
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def parse_importtime(output):
+    """
+    Parse `-X importtime` stderr into rows of (module, self_us, cumulative_us, depth).
+    """
+    rows = []
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+def profile_import(statement, cwd=None, env=None):
+    """
+    Run `statement` (e.g. "import sidekick_ui") in a fresh interpreter with import timing on.
+    A fresh process is needed because modules already imported here would not be timed.
+    Returns:
+        tuple: (rows, wall_seconds_reported_by_child)
+    """
+    code = (
+        "import sys, time as _t; _s = _t.perf_counter()\n"
+        f"{statement}\n"
+        "sys.stderr.write(f'wall time: {_t.perf_counter() - _s}\\n')"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd, env=env, capture_output=True, text=True  # The child's own output is discarded
+    )
+    wall = re.search(r"^wall time: (\S+)$", result.stderr, re.MULTILINE)
+    if result.returncode != 0 or not wall:
+        raise RuntimeError(f"Profiling '{statement}' failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr), float(wall.group(1))
+
+def summarize(rows, top=15):
+    """
+    Build a report: slowest modules by cumulative and self time, plus self time per top-level package.
+    """
+    by_package = defaultdict(int)
+    for module, self_us, _, _ in rows:
+        by_package[module.split(".")[0]] += self_us
+    total_us = sum(self_us for _, self_us, _, _ in rows)
+
+    lines = [f"📦 {len(rows)} modules imported in {total_us / 1000:.1f} ms"]
+    lines.append(f"\nSlowest by cumulative time (top {top}):")
+    for module, self_us, cumulative_us, depth in sorted(rows, key=lambda row: row[2], reverse=True)[:top]:
+        lines.append(f"  {cumulative_us / 1000:9.1f} ms  {'  ' * min(depth, 4)}{module}")
+    lines.append(f"\nSlowest by self time (top {top}):")
+    for module, self_us, _, _ in sorted(rows, key=lambda row: row[1], reverse=True)[:top]:
+        lines.append(f"  {self_us / 1000:9.1f} ms  {module}")
+    lines.append(f"\nSelf time per top-level package (top {top}):")
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"  {self_us / 1000:9.1f} ms  {package} ({self_us / max(total_us, 1):.0%})")
+    return "\n".join(lines)
+
+# Example Usage: python import_profiler.py sidekick_ui [top]
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else "sidekick_ui"
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    rows, seconds = profile_import(f"import {target}", cwd=os.getcwd())
+    print(f"⏱️ import {target}: {seconds * 1000:.1f} ms wall\n")
+    print(summarize(rows, top))
@@ -1,5 +1,8 @@
 import json
 import datetime
+from collections import defaultdict
+from contextlib import contextmanager
+from text_index import append_research_note, shared_research_index
 
 class KnowledgeGapHandler:
     def __init__(self, file_name="knowledge_gaps.json", research_notes_file="research_notes.json"):
@@ -9,7 +12,17 @@ class KnowledgeGapHandler:
         self.file_name = file_name
         self.research_notes_file = research_notes_file
         self.knowledge_data = self._load_knowledge_gaps()
-        self.research_notes = self._load_research_notes()
+        # Open gaps keyed by normalized topic, plus the keys of each status; the "gaps"
+        # list in knowledge_data is regenerated from this index whenever it is saved
+        self.gaps = self._index_gaps(self.knowledge_data["gaps"])
+        self.gaps_by_status = defaultdict(set)
+        for key, gap in self.gaps.items():
+            self.gaps_by_status[gap["status"]].add(key)
+        self._batch_depth = 0
+        self._dirty = False
+        self._notes_dirty = False
+        self.research_index = shared_research_index(research_notes_file, self._load_research_notes)
+        self.research_notes = self.research_index.research_notes
 
     def _load_knowledge_gaps(self):
         """
@@ -32,18 +45,74 @@ class KnowledgeGapHandler:
             print(f"⚠️ Research notes file '{self.research_notes_file}' not found.")
             return []
 
+    def _index_gaps(self, gaps):
+        """
+        Key gaps by normalized topic. Files written before topics were normalized can hold
+        several entries for one topic: they are merged into the oldest entry (occurrences
+        summed, latest attempt kept) instead of silently dropping all but one.
+        """
+        indexed = {}
+        for gap in sorted(gaps, key=lambda gap: gap.get("last_attempt", "")):
+            key = self.normalize_topic(gap["topic"])
+            existing = indexed.get(key)
+            if existing is None:
+                indexed[key] = gap
+                continue
+            existing["occurrences"] = existing.get("occurrences", 0) + gap.get("occurrences", 0)
+            existing["last_attempt"] = max(existing.get("last_attempt", ""), gap.get("last_attempt", ""))
+            print(f"⚠️ Merged duplicate knowledge gap '{gap['topic']}' into '{existing['topic']}'.")
+        return indexed
+
+    @staticmethod
+    def normalize_topic(topic):
+        return " ".join(topic.lower().split())
+
+    def _set_status(self, key, status):
+        gap = self.gaps[key]
+        self.gaps_by_status[gap["status"]].discard(key)
+        gap["status"] = status
+        self.gaps_by_status[status].add(key)
+
+    def gaps_with_status(self, status):
+        return [self.gaps[key] for key in self.gaps_by_status.get(status, ())]
+
     def save_knowledge_gaps(self):
         """
         Save the updated knowledge gaps back to the JSON file.
+        Inside a batch the write is deferred to the end of the batch.
         """
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self.knowledge_data["gaps"] = list(self.gaps.values())
         with open(self.file_name, "w") as file:
             json.dump(self.knowledge_data, file, indent=4)
+        self._dirty = False
+
+    @contextmanager
+    def batch(self):
+        """
+        Group changes so knowledge_gaps.json is written once, e.g. `with handler.batch(): ...`.
+        Changes already applied in memory are still saved if the block raises.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._dirty:
+                    self.save_knowledge_gaps()
+                if self._notes_dirty:
+                    self.save_research_notes()
+                    self.research_index.save()  # After the notes file, so the index matches it
 
     def query_research_notes(self, topic):
         """
         Retrieve research notes related to a specific topic before logging it as a knowledge gap.
+        A note covers the topic when it mentions every term of it; results are ranked by BM25.
         """
-        results = [note for note in self.research_notes if topic.lower() in note.lower()]
+        results = self.research_index.search(topic, match="all")
         return results if results else None
 
     def log_knowledge_gap(self, topic, suggested_fix=None):
@@ -57,7 +126,8 @@ class KnowledgeGapHandler:
             return
 
         # Check if the topic is already a known gap
-        existing_gap = next((gap for gap in self.knowledge_data["gaps"] if gap["topic"] == topic), None)
+        key = self.normalize_topic(topic)
+        existing_gap = self.gaps.get(key)
 
         if existing_gap:
             existing_gap["occurrences"] += 1
@@ -70,7 +140,8 @@ class KnowledgeGapHandler:
                 "suggested_fix": suggested_fix or "No suggested fix yet.",
                 "status": "unresolved"
             }
-            self.knowledge_data["gaps"].append(new_gap)
+            self.gaps[key] = new_gap
+            self.gaps_by_status[new_gap["status"]].add(key)
 
         self.save_knowledge_gaps()
         print(f"🔍 Logged new knowledge gap: {topic}")
@@ -79,12 +150,12 @@ class KnowledgeGapHandler:
         """
         Display all unresolved knowledge gaps.
         """
-        if not self.knowledge_data["gaps"]:
+        if not self.gaps:
             print("[INFO] No unresolved knowledge gaps.")
             return
 
         print("\n🔍 Unresolved Knowledge Gaps:")
-        for gap in self.knowledge_data["gaps"]:
+        for gap in self.gaps.values():
             print(f"- {gap['topic']} (Attempts: {gap['occurrences']})")
             print(f"  Last Attempt: {gap['last_attempt']}")
             print(f"  Suggested Fix: {gap['suggested_fix']}")
@@ -94,7 +165,8 @@ class KnowledgeGapHandler:
         """
         Mark a knowledge gap as resolved and store it for future reference.
         """
-        gap = next((gap for gap in self.knowledge_data["gaps"] if gap["topic"] == topic), None)
+        key = self.normalize_topic(topic)
+        gap = self.gaps.get(key)
 
         if gap:
             resolved_entry = {
@@ -103,7 +175,8 @@ class KnowledgeGapHandler:
                 "fix": fix_description
             }
             self.knowledge_data["resolved_gaps"].append(resolved_entry)
-            self.knowledge_data["gaps"].remove(gap)
+            del self.gaps[key]
+            self.gaps_by_status[gap["status"]].discard(key)
             self.save_knowledge_gaps()
             print(f"✅ Marked '{topic}' as resolved and added to research notes.")
             
@@ -116,13 +189,18 @@ class KnowledgeGapHandler:
         """
         Append new research notes dynamically when a knowledge gap is resolved.
         """
-        self.research_notes.append(new_note)
+        append_research_note(self.research_notes, new_note)
         self.save_research_notes()
+        self.research_index.add(new_note, save=not self._batch_depth)
 
     def save_research_notes(self):
         """
-        Save updated research notes back to the file.
+        Save updated research notes back to the file (deferred inside a batch).
         """
+        if self._batch_depth:
+            self._notes_dirty = True
+            return
+        self._notes_dirty = False
         with open(self.research_notes_file, "w") as file:
             json.dump(self.research_notes, file, indent=4)
         print("📚 Research notes updated.")
@@ -130,22 +208,24 @@ class KnowledgeGapHandler:
     def auto_review_and_fix(self):
         """
         Auto-review gaps and attempt to resolve some based on existing knowledge.
-        """
-        for gap in self.knowledge_data["gaps"]:
-            if "ethics" in gap["topic"].lower():
-                suggested_fix = "Cross-reference ethical AI principles with Sidekick's core beliefs."
-            elif "quantum" in gap["topic"].lower():
-                suggested_fix = "Compare quantum mechanics fundamentals with neural network dynamics."
-            elif self.query_research_notes(gap["topic"]):
-                suggested_fix = "Relevant research exists in research_notes.json."
-                gap["status"] = "resolved via research notes"
-            else:
-                suggested_fix = "Research topic in memory database and external references."
-
-            gap["suggested_fix"] = suggested_fix
-            gap["status"] = "pending review"
-
-        self.save_knowledge_gaps()
+        Runs as one batch: the gaps file (and the notes and their index, if touched) are written once.
+        """
+        with self.batch():
+            for key, gap in self.gaps.items():
+                status = "pending review"
+                if "ethics" in key:
+                    suggested_fix = "Cross-reference ethical AI principles with Sidekick's core beliefs."
+                elif "quantum" in key:
+                    suggested_fix = "Compare quantum mechanics fundamentals with neural network dynamics."
+                elif self.query_research_notes(gap["topic"]):  # Postings lookup in the shared index
+                    suggested_fix = "Relevant research exists in research_notes.json."
+                    status = "resolved via research notes"
+                else:
+                    suggested_fix = "Research topic in memory database and external references."
+
+                gap["suggested_fix"] = suggested_fix
+                self._set_status(key, status)
+            self.save_knowledge_gaps()
         print("🔄 Knowledge gaps auto-reviewed with suggested fixes.")
 
 # =====================
@@ -0,0 +1,52 @@
+import importlib
+import types
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a heavy or optional module that is imported on first attribute access.
+    Alternative names are tried in order (e.g. "Crypto.Cipher.AES", then
+    "Cryptodome.Cipher.AES"), so a missing dependency only fails on the code path
+    that actually uses it instead of at import time.
+    """
+
+    def __init__(self, *names):
+        super().__init__(names[0])
+        self.__dict__["_lazy_names"] = names
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            names = self.__dict__["_lazy_names"]
+            for name in names:
+                try:
+                    module = importlib.import_module(name)
+                    break
+                except ImportError:
+                    continue
+            else:
+                raise ImportError(f"This feature requires {' or '.join(names)}, which is not installed.")
+            self.__dict__["_lazy_module"] = module
+            # Later lookups hit the copied attributes directly and skip __getattr__.
+            self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {' | '.join(self.__dict__['_lazy_names'])} ({state})>"
+
+def lazy_import(*names):
+    """
+    Return a LazyModule for the first importable of `names`, resolved on first use.
+    """
+    return LazyModule(*names)
+
+def is_loaded(module):
+    """True once a LazyModule has been resolved (always True for ordinary modules)."""
+    return not isinstance(module, LazyModule) or module.__dict__["_lazy_module"] is not None
@@ -0,0 +1,174 @@
+import os
+import io
+import gzip
+import shutil
+import time
+from datetime import datetime
+
+try:
+    import zstandard as zstd  # Optional: faster, smaller archives
+except ImportError:
+    zstd = None
+
+CHUNK_SIZE = 1024 * 1024  # Stream 1MB at a time; never hold a whole log in memory
+ARCHIVE_SUFFIXES = (".gz", ".zst")
+
+
+class LogRotator:
+    def __init__(self, max_bytes=5 * 1024 * 1024, max_age_days=7, keep_archives=5,
+                 retention_days=30, use_zstd=True):
+        """
+        Size- and age-based log rotation with streaming compression.
+        Args:
+            max_bytes (int): Rotate once a log grows beyond this size.
+            max_age_days (float): Rotate once this long has passed since the last rotation.
+            keep_archives (int): Maximum number of archives kept per log.
+            retention_days (float): Archives older than this are deleted.
+            use_zstd (bool): Prefer zstd when the `zstandard` package is installed, else gzip.
+        """
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.keep_archives = keep_archives
+        self.retention_days = retention_days
+        self.suffix = ".zst" if use_zstd and zstd is not None else ".gz"
+
+    # ==========================
+    # 📦 Rotation
+    # ==========================
+
+    def list_archives(self, log_path):
+        """Return archives of a log, oldest first (timestamped names sort chronologically)."""
+        directory = os.path.dirname(os.path.abspath(log_path))
+        prefix = os.path.basename(log_path) + "."
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return []
+        archives = [
+            os.path.join(directory, name) for name in names
+            if name.startswith(prefix) and name.endswith(ARCHIVE_SUFFIXES)
+        ]
+        return sorted(archives)
+
+    def should_rotate(self, log_path):
+        """Check the size and age thresholds for a log."""
+        if not os.path.exists(log_path) or os.path.getsize(log_path) == 0:
+            return False
+        if os.path.getsize(log_path) > self.max_bytes:
+            return True
+        return time.time() - self.last_rotation(log_path) > self.max_age_days * 86400
+
+    def last_rotation(self, log_path):
+        """
+        Time of the last rotation, kept as the mtime of a `<log>.rotated` marker file.
+        A log without a marker counts from its newest archive, its creation time where the
+        platform records one, or else from now, the first time the rotator sees it.
+        """
+        try:
+            return os.path.getmtime(log_path + ".rotated")
+        except OSError:
+            pass
+        archives = self.list_archives(log_path)
+        if archives:
+            started = os.path.getmtime(archives[-1])
+        else:
+            started = getattr(os.stat(log_path), "st_birthtime", None) or time.time()
+        self._mark_rotation(log_path, started)
+        return started
+
+    def _mark_rotation(self, log_path, when=None):
+        marker = log_path + ".rotated"
+        try:
+            with open(marker, "a"):
+                pass
+            os.utime(marker, None if when is None else (when, when))
+        except OSError as e:
+            print(f"[ERROR]: Could not record rotation of {log_path}: {e}")
+
+    def rotate(self, log_path, force=False):
+        """
+        Compress the log into a timestamped archive and truncate it in place.
+        Copy-then-truncate keeps handles held by `logging` writers valid.
+        Returns:
+            str: Path of the new archive, or None when no rotation was needed.
+        """
+        if not force and not self.should_rotate(log_path):
+            return None
+        if not os.path.exists(log_path):
+            return None
+
+        archive = f"{log_path}.{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}{self.suffix}"
+        while os.path.exists(archive):
+            archive = f"{log_path}.{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}{self.suffix}"
+
+        temp_archive = archive + ".tmp"
+        try:
+            with open(log_path, "rb") as f_in, self._open_archive(temp_archive, "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out, CHUNK_SIZE)
+            os.replace(temp_archive, archive)
+            with open(log_path, "r+b") as f_log:
+                f_log.truncate(0)
+        except OSError as e:
+            print(f"[ERROR]: Could not rotate {log_path}: {e}")
+            if os.path.exists(temp_archive):
+                os.remove(temp_archive)
+            return None
+
+        self._mark_rotation(log_path)
+        self.apply_retention(log_path)
+        return archive
+
+    def apply_retention(self, log_path):
+        """Delete archives beyond the count limit or older than the retention window."""
+        archives = self.list_archives(log_path)
+        cutoff = time.time() - self.retention_days * 86400
+        expired = archives[:-self.keep_archives] if self.keep_archives else archives
+        expired += [path for path in archives[len(expired):] if os.path.getmtime(path) < cutoff]
+        for path in expired:
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f"[ERROR]: Could not remove archive {path}: {e}")
+        return expired
+
+    # ==========================
+    # 📖 Transparent Reading
+    # ==========================
+
+    def _open_archive(self, path, mode):
+        """Open a .gz/.zst archive for streaming in binary mode."""
+        if path.endswith(".zst") or path.endswith(".zst.tmp"):
+            if zstd is None:
+                raise OSError(f"zstandard is required to open {path}")
+            return zstd.open(path, mode)
+        return gzip.open(path, mode)
+
+    def open_log(self, path):
+        """Open a plain log or an archive as a text stream."""
+        if path.endswith(ARCHIVE_SUFFIXES):
+            return io.TextIOWrapper(self._open_archive(path, "rb"), encoding="utf-8", errors="replace")
+        return open(path, "r", encoding="utf-8", errors="replace")
+
+    def iter_lines(self, log_path, include_archives=True):
+        """
+        Yield log lines oldest first, decompressing archives on the fly.
+        """
+        paths = self.list_archives(log_path) if include_archives else []
+        if os.path.exists(log_path):
+            paths.append(log_path)
+        for path in paths:
+            with self.open_log(path) as stream:
+                for line in stream:
+                    yield line
+
+    def read_log(self, log_path, include_archives=True):
+        """Return the full history of a log as a single string."""
+        return "".join(self.iter_lines(log_path, include_archives))
+
+# Example Usage
+if __name__ == "__main__":
+    rotator = LogRotator()
+    for log in ["memory_logs.txt", "trace_log.txt", "ui_bin.log", "belief_changes.log"]:
+        archive = rotator.rotate(log)
+        if archive:
+            print(f"📦 [INFO]: {log} rotated to {archive}")
@@ -3,6 +3,9 @@ import json
 import datetime
 import math
 from directory_anchor import DirectoryAnchor  # Import DirectoryAnchor
+from directory_size_index import DirectorySizeIndex, process_rss_mb
+from directory_watcher import DirectoryWatcher
+from log_rotation import LogRotator
 
 class MemoryManager:
     def __init__(self, root_directory=None, research_notes_file="research_notes.json"):
@@ -17,9 +20,15 @@ class MemoryManager:
         self.memory_data = {
             "allocated_memory_mb": 100,
             "used_memory_mb": 0,
-            "efficiency_factor": 1.0  # Adjusts dynamically
+            "efficiency_factor": 1.0,  # Adjusts dynamically
+            "process_rss_mb": 0,
+            "process_memory_limit_mb": 512
         }
         self.memory_logs = "memory_logs.txt"
+        self.rotated_logs = [self.memory_logs, "trace_log.txt", "ui_bin.log", "belief_changes.log"]
+        self.log_rotator = LogRotator(max_bytes=5 * 1024 * 1024, max_age_days=7, keep_archives=5, retention_days=30)
+        self.size_index = DirectorySizeIndex(self.directory_anchor.get_root_directory())
+        self.size_watcher = None
 
     # ==========================
     # 📊 Memory Usage Monitoring
@@ -30,30 +39,64 @@ class MemoryManager:
         Monitor current memory usage for files in the root directory.
         """
         total_size_mb = self.calculate_directory_size()
+        rss_mb = process_rss_mb()
         self.memory_data["used_memory_mb"] = total_size_mb
+        self.memory_data["process_rss_mb"] = rss_mb
         allocated = self.memory_data["allocated_memory_mb"]
 
         if total_size_mb >= allocated:
             print("🚨 [WARNING]: Memory limit reached! Running optimization before requesting more memory...")
             self.optimize_memory_usage()
         else:
-            print(f"✅ [INFO]: Memory usage: {total_size_mb}/{allocated} MB.")
+            print(f"✅ [INFO]: Memory usage: {total_size_mb}/{allocated} MB (process RSS: {rss_mb} MB).")
 
-        self.log_memory_activity(f"Memory usage checked: {total_size_mb}/{allocated} MB")
+        self.log_memory_activity(f"Memory usage checked: {total_size_mb}/{allocated} MB, RSS {rss_mb} MB")
 
     def calculate_directory_size(self):
         """
         Calculate the total size of files in the root directory managed by DirectoryAnchor.
+        Served from the cached size index; the directory is only rescanned when the
+        snapshot is stale and no watcher is feeding file events.
         Returns:
             float: Total size of files in MB.
         """
-        total_size = 0
-        root_files = self.directory_anchor.list_root_files()
-        for file in root_files:
-            file_path = os.path.join(self.directory_anchor.get_root_directory(), file)
-            if os.path.isfile(file_path):
-                total_size += os.path.getsize(file_path)
-        return round(total_size / (1024 * 1024), 2)  # Convert bytes to MB
+        return self.size_index.total_mb()
+
+    def memory_breakdown(self):
+        """
+        Report disk usage per file type and per subsystem next to the process RSS.
+        """
+        return {
+            "disk_total_mb": self.size_index.total_mb(),
+            "by_file_type": self.size_index.by_file_type(),
+            "by_subsystem": self.size_index.by_subsystem(),
+            "process_rss_mb": process_rss_mb()
+        }
+
+    def start_size_tracking(self, use_inotify=True):
+        """
+        Keep the size index current from file events instead of periodic rescans.
+        """
+        if self.size_watcher:
+            return
+        self.size_index.refresh()
+        self.size_watcher = DirectoryWatcher(
+            self.directory_anchor.get_root_directory(),
+            callback=self.size_index.apply_events,
+            recursive=False,
+            use_inotify=use_inotify
+        )
+        self.size_index.live = True
+        self.size_watcher.start()
+
+    def stop_size_tracking(self):
+        """
+        Stop event-driven size tracking and fall back to cached snapshots.
+        """
+        if self.size_watcher:
+            self.size_watcher.stop()
+            self.size_watcher = None
+        self.size_index.live = False
 
     # =============================
     # 🔄 Recursive Memory Management
@@ -94,7 +137,7 @@ class MemoryManager:
         # Purge unnecessary files (non-core logs, outdated temp files)
         self.purge_redundant_files()
 
-        # Compress memory logs if they exceed 5MB
+        # Rotate and compress logs past their size/age limits
         self.compress_logs()
 
         after_size = self.calculate_directory_size()
@@ -108,24 +151,36 @@ class MemoryManager:
         """
         Identify and remove unnecessary files to reclaim memory.
         """
-        redundant_files = ["memory_logs.txt", "temp_cache.json"]
+        redundant_files = ["temp_cache.json"]  # Logs are bounded by rotation instead
         for file in redundant_files:
             file_path = os.path.join(self.directory_anchor.get_root_directory(), file)
             if os.path.exists(file_path):
                 os.remove(file_path)
+                self.size_index.update(file_path)
                 print(f"🗑 [INFO]: Deleted {file}")
 
-    def compress_logs(self):
+    def compress_logs(self, force=False):
         """
-        Compress logs if they exceed 5MB.
+        Rotate Sidekick's logs once they exceed 5MB or a week of age.
+        Logs are streamed into gzip (or zstd) archives and old archives are pruned.
         """
-        log_file = os.path.join(self.directory_anchor.get_root_directory(), self.memory_logs)
-        if os.path.exists(log_file) and os.path.getsize(log_file) > 5 * 1024 * 1024:  # 5MB threshold
-            compressed_log = log_file + ".gz"
-            with open(log_file, "rb") as f_in, open(compressed_log, "wb") as f_out:
-                f_out.write(f_in.read())  # Simulate compression
-            os.remove(log_file)  # Remove original after compression
-            print(f"📦 [INFO]: Logs compressed to {compressed_log}")
+        archives = []
+        for log_name in self.rotated_logs:
+            log_file = os.path.join(self.directory_anchor.get_root_directory(), log_name)
+            archive = self.log_rotator.rotate(log_file, force=force)
+            if archive:
+                archives.append(archive)
+                print(f"📦 [INFO]: Logs compressed to {archive}")
+        if archives:
+            self.size_index.invalidate()  # Archives were added and possibly pruned
+        return archives
+
+    def read_log(self, log_name, include_archives=True):
+        """
+        Read a managed log, transparently including its compressed archives.
+        """
+        log_file = os.path.join(self.directory_anchor.get_root_directory(), log_name)
+        return self.log_rotator.read_log(log_file, include_archives)
 
     # ==========================
     # 🔍 Memory Anomaly Detection
@@ -136,9 +191,14 @@ class MemoryManager:
         Analyze memory logs for unusual consumption patterns.
         """
         anomalies = []
+        self.memory_data["used_memory_mb"] = self.calculate_directory_size()
+        self.memory_data["process_rss_mb"] = process_rss_mb()
         if self.memory_data["used_memory_mb"] > self.memory_data["allocated_memory_mb"] * 0.9:
             anomalies.append("High memory usage detected.")
 
+        if self.memory_data["process_rss_mb"] > self.memory_data["process_memory_limit_mb"]:
+            anomalies.append(f"High process memory detected ({self.memory_data['process_rss_mb']} MB RSS).")
+
         if self.memory_data["efficiency_factor"] < 0.5:
             anomalies.append("Inefficient memory usage warning.")
 
@@ -159,8 +219,10 @@ class MemoryManager:
         Log memory-related activities.
         """
         log_entry = f"{datetime.datetime.now()}: {message}\n"
-        with open(os.path.join(self.directory_anchor.get_root_directory(), self.memory_logs), "a") as log_file:
+        log_path = os.path.join(self.directory_anchor.get_root_directory(), self.memory_logs)
+        with open(log_path, "a") as log_file:
             log_file.write(log_entry)
+        self.size_index.update(log_path)
         print(f"📜 [LOG]: {message}")
 
 # =====================
@@ -0,0 +1,44 @@
+from collections import Counter
+
+class MetricsPipeline:
+    def __init__(self):
+        """
+        Named metrics, each cached until the inputs it declares change.
+        A metric's inputs are a zero-argument function returning a cheap, comparable key,
+        e.g. a generation counter, a file's (mtime, size), or the values of other metrics.
+        """
+        self._metrics = {}  # name -> (compute, inputs)
+        self._cache = {}  # name -> (key, value)
+        self.recomputations = Counter()  # name -> times computed
+
+    def register(self, name, compute, inputs=None):
+        """
+        Args:
+            compute: Zero-argument function producing the metric.
+            inputs: Zero-argument function returning the metric's input key;
+                None recomputes on every read (for cheap or time-dependent metrics).
+        """
+        self._metrics[name] = (compute, inputs)
+        self._cache.pop(name, None)
+
+    def get(self, name):
+        compute, inputs = self._metrics[name]
+        key = inputs() if inputs is not None else None
+        cached = self._cache.get(name)
+        if inputs is not None and cached is not None and cached[0] == key:
+            return cached[1]
+        value = compute()
+        self.recomputations[name] += 1
+        if inputs is not None:
+            self._cache[name] = (key, value)
+        return value
+
+    def invalidate(self, name=None):
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
+
+    def evaluate(self, names=None):
+        """Read every metric (or `names`), recomputing only those whose inputs changed."""
+        return {name: self.get(name) for name in (names or self._metrics)}
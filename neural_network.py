@@ -1,18 +1,30 @@
-import os
-import json
+from contextlib import contextmanager
 from math import sqrt, pi, exp
-from pattern_analyzer import PatternAnalyzer
-from habit_behavior_recognizer import HabitBehaviorRecognizer
+from service_registry import services
+from graph_store import GraphStore, NodeTable, ConnectionListView, ConnectionPolicy
+from snapshot_journal import SnapshotJournal
 
 class NeuralNetwork:
-    def __init__(self, file_name="neural_network.json"):
+    def __init__(self, file_name="neural_network.json", connection_policy=None, snapshot_every=5000,
+                 pattern_analyzer=None, behavior_recognizer=None):
         """
         Initialize the neural network with a persistent storage system.
+        Args:
+            connection_policy (ConnectionPolicy): How evolve_network wires new nodes.
+                Defaults to connecting every existing node; use ConnectionPolicy("knn", k)
+                or ConnectionPolicy("fanout", k) to keep large networks sparse.
+            snapshot_every (int): Journal entries allowed before the snapshot is rewritten.
+            pattern_analyzer, behavior_recognizer: Dependencies; default to the shared registry instances.
         """
         self.file_name = file_name
+        self.connection_policy = connection_policy or ConnectionPolicy("all")
+        self.journal = SnapshotJournal(file_name, snapshot_every)
+        self.journal_file = self.journal.journal_file
+        self.version = 0  # Bumped on every in-process mutation; lets readers cache derived metrics
+        self._batch_depth = 0
         self.network = self._load_network()
-        self.pattern_analyzer = PatternAnalyzer()
-        self.behavior_recognizer = HabitBehaviorRecognizer()
+        self.pattern_analyzer = services.resolve("pattern_analyzer", pattern_analyzer)
+        self.behavior_recognizer = services.resolve("behavior_recognizer", behavior_recognizer)
         self.golden_ratio = 1.618  # Golden Ratio constant
 
     # ========================
@@ -23,18 +35,93 @@ class NeuralNetwork:
         """
         Load neural network data from file or initialize a new structure.
         """
-        if os.path.exists(self.file_name):
-            with open(self.file_name, "r") as file:
-                return json.load(file)
-        else:
-            return {"nodes": {}, "connections": [], "recursions": 0}
+        network = self.journal.load() or {"nodes": {}, "connections": [], "recursions": 0}
+
+        # Nodes and connections live in an adjacency-indexed graph with NumPy columns;
+        # "nodes" and "connections" stay dict-like and list-like views over it.
+        self.graph = GraphStore()
+        nodes = NodeTable(self.graph)
+        for node_id, data in network["nodes"].items():
+            nodes[node_id] = data
+        connections = ConnectionListView(self.graph)
+        for conn in network["connections"]:
+            connections.append(conn)
+        network["nodes"] = nodes
+        network["connections"] = connections
+        self.network = network
+        self.journal.replay(self._apply_mutation)  # Mutations written since the last snapshot
+        return network
+
+    def _apply_mutation(self, mutation):
+        """
+        Apply a single journaled mutation to the in-memory network.
+        """
+        op = mutation["op"]
+        if op == "add_node":
+            self.network["nodes"][mutation["id"]] = mutation["data"]
+        elif op == "connect":
+            self.graph.add_edge(
+                self.graph.add_node(mutation["from"]), self.graph.add_node(mutation["to"]), mutation["weight"]
+            )
+        elif op == "scale_energy":
+            self.graph.scale_energy(mutation["factor"])
+        elif op == "recompute_weights":
+            self.graph.recompute_edge_weights()
+        elif op == "golden_weights":
+            self.graph.recompute_golden_weights(mutation["ratio"])
+        elif op == "recursions":
+            self.network["recursions"] = mutation["value"]
+
+    def _record(self, mutation):
+        """
+        Queue a mutation for the next journal flush.
+        """
+        self.journal.record(mutation)
+        self.version += 1
+
+    def begin(self):
+        """
+        Start a batch: saves are deferred until the matching commit().
+        """
+        self._batch_depth += 1
+
+    def commit(self):
+        """
+        End a batch and persist every deferred mutation in a single write.
+        """
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth == 0 and self.journal.pending:
+            self.save_network()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group mutations so they are persisted once, e.g. `with nn.batch(): ...`.
+        Changes already applied in memory are still flushed if the block raises.
+        """
+        self.begin()
+        try:
+            yield self
+        finally:
+            self.commit()
 
     def save_network(self):
         """
         Save the updated neural network structure to a file.
+        Appends pending mutations to the journal; the full snapshot is only
+        rewritten once the journal grows past `snapshot_every` entries.
+        """
+        if self._batch_depth:
+            return
+        saved = self.journal.save(self.get_network)
+        if saved:
+            print(f"✅ Network state saved: {self.file_name if saved == 'snapshot' else self.journal_file}")
+
+    def write_snapshot(self):
+        """
+        Rewrite the full network file and start a fresh journal generation.
         """
-        with open(self.file_name, "w") as file:
-            json.dump(self.network, file, indent=4)
+        self.journal.write_snapshot(self.get_network())
         print(f"✅ Network state saved: {self.file_name}")
 
     # ========================
@@ -50,6 +137,7 @@ class NeuralNetwork:
             data["recursive_feedback"] = self._compute_recursive_feedback(node_id)
             data["golden_weight"] = self._apply_golden_ratio(data["energy"])
             self.network["nodes"][node_id] = data
+            self._record({"op": "add_node", "id": node_id, "data": data})
             self.save_network()
             print(f"✅ Node '{node_id}' added with energy {data['energy']}, golden weight {data['golden_weight']}.")
 
@@ -59,8 +147,8 @@ class NeuralNetwork:
         """
         if node_id_1 in self.network["nodes"] and node_id_2 in self.network["nodes"]:
             weight = self._compute_connection_weight(node_id_1, node_id_2)
-            connection = {"from": node_id_1, "to": node_id_2, "weight": weight}
-            self.network["connections"].append(connection)
+            self.graph.add_edge(self.graph.node_id(node_id_1), self.graph.node_id(node_id_2), weight)
+            self._record({"op": "connect", "from": node_id_1, "to": node_id_2, "weight": weight})
             self.save_network()
             print(f"🔗 Connected '{node_id_1}' to '{node_id_2}' with weight {weight}.")
 
@@ -68,15 +156,17 @@ class NeuralNetwork:
         """
         Evolve the network dynamically using recursion and pattern analysis.
         """
-        for key, value in data_source.items():
-            node_id = f"node_{len(self.network['nodes']) + 1}"
-            self.add_node(node_id, {"key": key, "value": value})
-            for existing_node in self.network["nodes"]:
-                self.connect_nodes(node_id, existing_node)
+        with self.batch():  # One journal write for the whole evolution step
+            for key, value in data_source.items():
+                node_id = f"node_{len(self.network['nodes']) + 1}"
+                self.add_node(node_id, {"key": key, "value": value})
+                new_node = self.graph.node_id(node_id)
+                for target in self.connection_policy.select(self.graph, new_node):
+                    self.connect_nodes(node_id, self.graph.node_names[target])
 
-        self.network["recursions"] += 1
+            self.network["recursions"] += 1
+            self._record({"op": "recursions", "value": self.network["recursions"]})
         print(f"🔄 Network evolved. Recursive cycles: {self.network['recursions']}.")
-        self.save_network()
 
     # ========================
     # 📊 Pattern & Behavior Analysis
@@ -113,18 +203,35 @@ class NeuralNetwork:
         """
         Compute connection weight based on energy levels.
         """
-        node1_energy = self.network["nodes"][node_id_1]["energy"]
-        node2_energy = self.network["nodes"][node_id_2]["energy"]
-        weight = (node1_energy + node2_energy) / 2
-        return round(weight, 4)
+        energy = self.graph.energy
+        weight = (energy[self.graph.node_ids[node_id_1]] + energy[self.graph.node_ids[node_id_2]]) / 2
+        return round(float(weight), 4)
+
+    def recompute_connection_weights(self):
+        """
+        Refresh every connection weight from current node energies in one vectorized pass.
+        """
+        self.graph.recompute_edge_weights()
+        self._record({"op": "recompute_weights"})
+        self.save_network()
+
+    def refresh_golden_weights(self):
+        """
+        Re-apply Golden Ratio scaling to every node energy in one vectorized pass.
+        """
+        self.graph.recompute_golden_weights(self.golden_ratio)
+        self._record({"op": "golden_weights", "ratio": self.golden_ratio})
+        self.save_network()
 
     def _compute_recursive_feedback(self, node_id):
         """
         Compute feedback from connected nodes using recursion.
         """
-        connections = [conn for conn in self.network["connections"] if conn["from"] == node_id]
-        feedback = sum(conn["weight"] for conn in connections)
-        return feedback / (1 + len(connections)) if connections else 0
+        node = self.graph.node_id(node_id)
+        if node is None:
+            return 0
+        weights = self.graph.out_weights(node)  # O(out-degree) via the adjacency index
+        return sum(weights) / (1 + len(weights)) if weights else 0
 
     def _apply_golden_ratio(self, value):
         """
@@ -141,9 +248,8 @@ class NeuralNetwork:
         Simulate the effect of dark matter interactions on the network.
         """
         print("🌌 Adjusting network for dark matter influence...")
-        for node in self.network["nodes"]:
-            adjusted_value = self.network["nodes"][node]["energy"] * 0.99  # 1% decay effect
-            self.network["nodes"][node]["energy"] = adjusted_value
+        self.graph.scale_energy(0.99)  # 1% decay effect across all nodes at once
+        self._record({"op": "scale_energy", "factor": 0.99})
         print("✅ Network adapted to dark matter effects.")
 
     def enhance_dark_energy_response(self):
@@ -151,9 +257,8 @@ class NeuralNetwork:
         Simulate the effect of dark energy interactions for network expansion.
         """
         print("🌌 Enhancing network with dark energy response...")
-        for node in self.network["nodes"]:
-            enhanced_value = self.network["nodes"][node]["energy"] * 1.02  # 2% expansion effect
-            self.network["nodes"][node]["energy"] = enhanced_value
+        self.graph.scale_energy(1.02)  # 2% expansion effect across all nodes at once
+        self._record({"op": "scale_energy", "factor": 1.02})
         print("✅ Network enhanced with dark energy adaptation.")
 
     # ========================
@@ -172,7 +277,8 @@ class NeuralNetwork:
             for node_id, data in self.network["nodes"].items():
                 G.add_node(node_id, energy=data["energy"])
 
-            for conn in self.network["connections"]:
+            for edge in range(self.graph.num_edges):
+                conn = self.graph.edge(edge)
                 G.add_edge(conn["from"], conn["to"], weight=conn["weight"])
 
             pos = nx.spring_layout(G)
@@ -186,9 +292,9 @@ class NeuralNetwork:
 
     def get_network(self):
         """
-        Retrieve the current state of the network.
+        Retrieve the current state of the network as plain dicts and lists.
         """
-        return self.network
+        return dict(self.network, nodes=self.network["nodes"].to_dict(), connections=self.graph.to_connections())
 
 # =====================
 # 🔬 Example Usage
@@ -0,0 +1,72 @@
+import gc
+import sys
+import tracemalloc
+from rfnn import RFNode, ArrayRFNetwork
+from graph_store import GraphStore, NodeTable
+from enhanced_model import ModelNode
+
+class DictRFNode:
+    """The original RFNode layout: the same attributes kept in a per-instance __dict__."""
+    def __init__(self, energy=1.0):
+        self.energy = energy
+        self.value = 0.0
+        self.feedback = 0.0
+        self.connections = []
+
+def measure(build, num_nodes):
+    """
+    Build a structure of `num_nodes` nodes and return the bytes it holds.
+    """
+    gc.collect()
+    tracemalloc.start()
+    structure = build(num_nodes)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    gc.collect()
+    return current
+
+def network_node(i):
+    return {"type": "input", "value": i, "energy": 1.618, "recursive_feedback": 0, "golden_weight": 2.618}
+
+def model_node(i):
+    return {"pattern": f"balance {i}", "energy": 1.2, "alignment_score": 0.5}
+
+def build_network_table(num_nodes):
+    nodes = NodeTable(GraphStore())
+    for i in range(num_nodes):
+        nodes[f"node_{i}"] = network_node(i)
+    return nodes
+
+BENCHMARKS = [
+    ("RFNode", [
+        ("dict attributes", lambda n: [DictRFNode() for _ in range(n)]),
+        ("__slots__", lambda n: [RFNode() for _ in range(n)]),
+        ("ArrayRFNetwork vectors", lambda n: ArrayRFNetwork(n)),
+    ]),
+    ("NeuralNetwork node", [
+        ("dict per node", lambda n: {f"node_{i}": network_node(i) for i in range(n)}),
+        ("GraphStore + NodeTable columns", build_network_table),
+    ]),
+    ("EnhancedModel node", [
+        ("dict per node", lambda n: {f"node_{i}": model_node(i) for i in range(n)}),
+        ("ModelNode slots", lambda n: {f"node_{i}": ModelNode(model_node(i)) for i in range(n)}),
+    ]),
+]
+
+def run(num_nodes):
+    """
+    Print memory held by each node representation, before (first row) and after.
+    """
+    print(f"📏 Node memory for {num_nodes:,} nodes")
+    for title, variants in BENCHMARKS:
+        print(f"\n{title}")
+        baseline = None
+        for label, build in variants:
+            used = measure(build, num_nodes)
+            baseline = baseline or used
+            print(f"  {label:<31} {used / (1024 * 1024):9.1f} MB  {used / num_nodes:7.1f} B/node  "
+                  f"{used / baseline:6.1%} of before")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
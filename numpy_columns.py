@@ -0,0 +1,11 @@
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+def grow_column(column, needed):
+    """Return `column` with capacity for at least `needed` rows (amortised doubling)."""
+    if needed <= len(column):
+        return column
+    grown = np.zeros(max(needed, 2 * len(column), 16), dtype=column.dtype)
+    grown[:len(column)] = column
+    return grown
@@ -1,24 +1,45 @@
 from collections import Counter
-from emotion_analyzer import EmotionAnalyzer  # Advanced Emotion Recognition
-from data_handler import DataHandler
-from enhanced_model import EnhancedModel  # Breakthrough AI Model
-from network_manager import NetworkManager  # For audio/visual pattern learning
-import math
+from service_registry import services, DEFAULT_CREATOR_ID
+from pattern_stream import PatternStream, SpaceSaving
+from snapshot_journal import SnapshotJournal
+import time
+
+GRAM = 3  # Length of the substrings indexed to find the inputs containing a pattern
 
 class PatternAnalyzer:
-    def __init__(self, creator_id="Randell Murrin"):
+    def __init__(self, creator_id=DEFAULT_CREATOR_ID, data_handler=None, enhanced_model=None,
+                 network_manager=None, emotion_analyzer=None, checkpoint_file="pattern_checkpoint.json",
+                 max_inputs=4096, text_pattern_limit=50, snapshot_every=5000):
         """
         Initialize the Pattern Analyzer with enhanced AI models for multi-layered analysis.
+        Subsystems not passed in are the shared instances from the service registry.
+        Args:
+            checkpoint_file (str): Where the running analysis state is kept between runs (None keeps it in memory).
+            max_inputs (int): Distinct inputs tracked; counts are exact until more distinct inputs
+                arrive, after which the least frequent is evicted together with its sentiment totals.
+            text_pattern_limit (int): Most common inputs reported as "text_patterns" per pass.
+            snapshot_every (int): Journaled inputs allowed before the checkpoint snapshot is rewritten.
         """
-        self.data_handler = DataHandler()
-        self.enhanced_model = EnhancedModel()  # Integrates advanced pattern learning
-        self.network_manager = NetworkManager(creator_id)
+        self.data_handler = services.resolve("data_handler", data_handler)
+        self.enhanced_model = services.resolve("enhanced_model", enhanced_model)  # Integrates advanced pattern learning
+        if network_manager is None and creator_id != DEFAULT_CREATOR_ID:
+            from network_manager import NetworkManager  # A different creator gets a dedicated manager
+            network_manager = NetworkManager(creator_id)
+        self.network_manager = services.resolve("network_manager", network_manager)  # For audio/visual pattern learning
         self.text_patterns = []
         self.visual_patterns = []
         self.audio_patterns = []
-        self.emotion_analyzer = EmotionAnalyzer()
+        self.emotion_analyzer = services.resolve("emotion_analyzer", emotion_analyzer)  # Advanced Emotion Recognition
         self.golden_ratio = 1.618  # Phi - Used for recursive weighting
 
+        # Running analysis state, so each pass only processes interactions added since the checkpoint
+        self.checkpoint_file = checkpoint_file
+        self.max_inputs = max_inputs
+        self.text_pattern_limit = text_pattern_limit
+        self.journal = SnapshotJournal(checkpoint_file, snapshot_every, indent=None) if checkpoint_file else None
+        self.reset_analysis()
+        self.load_checkpoint()
+
     # ========================
     # 🔍 Multi-Layered Pattern Analysis
     # ========================
@@ -26,42 +47,201 @@ class PatternAnalyzer:
     def analyze_interactions(self):
         """
         Identify recurring patterns, emotional tones, and generate recursive insights.
+        Only interactions added since the last checkpoint are read and analyzed; counts and
+        per-pattern sentiment aggregates are carried over from earlier passes, so a pass
+        costs work proportional to the new interactions, not to the history.
         """
-        interactions = self.data_handler.get_all_data()["interactions"]
-        if not interactions:
+        total = self.data_handler.count_interactions()
+        if not total:
             return "⚠️ No interactions to analyze."
+        if total < self.checkpoint:  # History was cleared or replaced: start over
+            self.reset_analysis()
+            if self.journal:
+                self.journal.write_snapshot(self._checkpoint_state())
+
+        new_interactions = self.data_handler.get_interactions(self.checkpoint)
+        emotional_analysis = []
+        changed = set()
+        for interaction in new_interactions:
+            if "user_input" in interaction:
+                # Emotionally analyze only the new inputs
+                data = self.analyze_emotion(interaction["user_input"])
+                timestamp = interaction.get("timestamp")  # Epoch seconds when recorded; otherwise "now"
+                timestamp = timestamp if isinstance(timestamp, (int, float)) else time.time()
+                self._apply_input(data["text"], data["sentiment"], timestamp, changed)
+                if self.journal:
+                    self.journal.record({"text": data["text"], "sentiment": data["sentiment"], "timestamp": timestamp})
+                emotional_analysis.append(data)
 
-        # Extract user input
-        user_inputs = [interaction["user_input"] for interaction in interactions if "user_input" in interaction]
-
-        # Emotionally analyze inputs
-        emotional_analysis = [self.analyze_emotion(input_text) for input_text in user_inputs]
-
-        # Detect common text patterns
-        text_patterns = Counter(user_inputs).most_common()
-
-        # Process identified patterns
-        for pattern, count in text_patterns:
-            if count > 1:  # Save frequently occurring patterns
-                weighted_sentiment = self.weighted_sentiment(emotional_analysis, pattern)
-                advanced_prediction = self.enhanced_model.predict_pattern(pattern)
-                
-                self.data_handler.add_pattern(
-                    pattern,
-                    {
-                        "count": count,
-                        "weighted_sentiment": weighted_sentiment,
-                        "enhanced_prediction": advanced_prediction,
-                    }
-                )
+        # Most common inputs, read from the count-sorted summary: O(text_pattern_limit)
+        text_patterns = self.input_counts.top_k(self.text_pattern_limit)
+
+        # Re-score and store only the frequent patterns this pass touched, in one batch each
+        frequent = sorted(pattern for pattern in changed if pattern in self.pattern_sentiment)
+        predictions = self.enhanced_model.predict_patterns(frequent)
+        self.data_handler.add_patterns({
+            pattern: {
+                "count": self.input_counts.estimate(pattern)[0],
+                "weighted_sentiment": self.pattern_weighted_sentiment(pattern),
+                "enhanced_prediction": advanced_prediction,
+            }
+            for pattern, advanced_prediction in zip(frequent, predictions)
+        })
 
         self.text_patterns = text_patterns
+        self.checkpoint = total
+        if new_interactions:
+            self.save_checkpoint()
 
         return {
             "text_patterns": text_patterns,
             "emotional_analysis": emotional_analysis,
+            "new_interactions": len(new_interactions),
+            "recurring_phrases": self.pattern_stream.top_phrases(),
+            "window_patterns": self.pattern_stream.window_patterns(),
+        }
+
+    def _apply_input(self, text, sentiment, timestamp, changed):
+        """
+        Fold one analyzed input into the running state and add the frequent patterns it touched to `changed`.
+        Journal replay goes through here too, so a restored analyzer matches the one that saved.
+        """
+        self.pattern_stream.observe(text, timestamp)
+        evicted = self.input_counts.add(text)
+        if evicted is not None:
+            self._forget(evicted)
+        totals = self.text_sentiment.get(text)
+        if totals is None:
+            totals = self.text_sentiment[text] = [0, 0]
+            for gram in self._grams(text):
+                self.gram_index.setdefault(gram, set()).add(text)
+        totals[0] += sentiment
+        totals[1] += 1
+        for pattern in self._patterns_in(text):
+            aggregate = self.pattern_sentiment[pattern]
+            aggregate[0] += sentiment
+            aggregate[1] += 1
+            changed.add(pattern)
+
+        # An input that just became frequent is back-filled once from the inputs containing it
+        count, error = self.input_counts.estimate(text)
+        if count - error > 1 and text not in self.pattern_sentiment:
+            aggregate = self.pattern_sentiment[text] = [0, 0]
+            self.pattern_lengths[len(text)] += 1
+            for other in self._inputs_containing(text):
+                aggregate[0] += self.text_sentiment[other][0]
+                aggregate[1] += self.text_sentiment[other][1]
+            changed.add(text)
+
+    def _forget(self, text):
+        """
+        Drop an input evicted from the tracked set, with its sentiment totals and pattern aggregate.
+        Patterns keep the sentiment it already contributed.
+        """
+        del self.text_sentiment[text]
+        for gram in self._grams(text):
+            texts = self.gram_index[gram]
+            texts.discard(text)
+            if not texts:
+                del self.gram_index[gram]
+        if text in self.pattern_sentiment:
+            del self.pattern_sentiment[text]
+            self.pattern_lengths[len(text)] -= 1
+            if not self.pattern_lengths[len(text)]:
+                del self.pattern_lengths[len(text)]
+
+    @staticmethod
+    def _grams(text):
+        return {text[start:start + GRAM] for start in range(len(text) - GRAM + 1)}
+
+    def _inputs_containing(self, pattern):
+        """
+        Tracked inputs containing `pattern`: candidates share every one of its GRAM-length
+        substrings, starting from the rarest. Patterns shorter than GRAM check every tracked input.
+        """
+        if len(pattern) < GRAM:
+            return [text for text in self.text_sentiment if pattern in text]
+        postings = sorted((self.gram_index.get(gram, ()) for gram in self._grams(pattern)), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return [text for text in candidates if pattern in text]
+
+    def _patterns_in(self, text):
+        """
+        Known frequent patterns occurring in `text`, found by looking up its substrings of
+        each pattern length, so the cost depends on the text, not on how many patterns exist.
+        """
+        patterns = self.pattern_sentiment
+        return {text[start:start + length] for length in self.pattern_lengths
+                for start in range(len(text) - length + 1) if text[start:start + length] in patterns}
+
+    def pattern_weighted_sentiment(self, pattern):
+        """
+        Golden Ratio weighted sentiment of a frequent pattern, from its running aggregate.
+        Equal to weighted_sentiment() over every analyzed input.
+        """
+        sentiment_sum, occurrences = self.pattern_sentiment.get(pattern, (0, 0))
+        if not occurrences:
+            return 0.0
+        return round(sentiment_sum / occurrences * self.golden_ratio, 4)
+
+    # ========================
+    # 💾 Analysis Checkpoint
+    # ========================
+
+    def reset_analysis(self):
+        self.checkpoint = 0  # Interactions already analyzed
+        self.input_counts = SpaceSaving(self.max_inputs)  # user input -> occurrences, sorted by count
+        self.text_sentiment = {}  # tracked user input -> [sentiment sum, occurrences]
+        self.gram_index = {}  # GRAM-length substring -> tracked inputs containing it
+        self.pattern_sentiment = {}  # frequent pattern -> [sentiment sum, inputs containing it]
+        self.pattern_lengths = Counter()  # pattern length -> frequent patterns of that length
+        self.pattern_stream = PatternStream()  # Bounded-memory sketches, windows and n-gram phrases
+
+    def _checkpoint_state(self):
+        return {
+            "checkpoint": self.checkpoint,
+            "input_counts": self.input_counts.to_dict(),
+            "text_sentiment": self.text_sentiment,
+            "pattern_sentiment": self.pattern_sentiment,
+            "pattern_stream": self.pattern_stream.to_dict(),
         }
 
+    def _replay(self, entry):
+        if "checkpoint" in entry:
+            self.checkpoint = entry["checkpoint"]
+        else:
+            self._apply_input(entry["text"], entry["sentiment"], entry["timestamp"], set())
+
+    def save_checkpoint(self):
+        """
+        Journal the inputs analyzed since the last save; the full state is only
+        rewritten once `snapshot_every` inputs have been journaled.
+        """
+        if not self.journal:
+            return
+        self.journal.record({"checkpoint": self.checkpoint})
+        self.journal.save(self._checkpoint_state)
+
+    def load_checkpoint(self):
+        if not self.journal:
+            return
+        try:
+            state = self.journal.load()
+            if state:
+                self.checkpoint = state["checkpoint"]
+                self.input_counts = SpaceSaving.from_dict(state["input_counts"])
+                self.text_sentiment = state["text_sentiment"]
+                self.pattern_sentiment = state["pattern_sentiment"]
+                self.pattern_stream.load(state["pattern_stream"])
+                for text in self.text_sentiment:
+                    for gram in self._grams(text):
+                        self.gram_index.setdefault(gram, set()).add(text)
+                self.pattern_lengths.update(len(pattern) for pattern in self.pattern_sentiment)
+            self.journal.replay(self._replay)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Ignoring unreadable pattern checkpoint: {e}")
+            self.reset_analysis()
+
     def analyze_audio(self, audio_data):
         """
         Process audio inputs and detect tonal patterns.
@@ -120,15 +300,14 @@ class PatternAnalyzer:
         print(f"🔄 Refined patterns: {refined_patterns}")
         return refined_patterns
 
-    def prioritize_patterns(self):
+    def prioritize_patterns(self, k=10, min_count=2):
         """
         Prioritize patterns based on **frequency & emotional intensity.**
+        Reads the top `k` straight from the Space-Saving sketch, which is kept sorted.
+        Only inputs seen at least `min_count` times rank, the same threshold that makes
+        an input a frequent pattern in analyze_interactions().
         """
-        prioritized = sorted(
-            self.text_patterns,
-            key=lambda x: abs(x[1] * self.golden_ratio),  # Recursive scaling
-            reverse=True
-        )
+        prioritized = self.pattern_stream.top_patterns(k, min_count)
         print(f"📊 Prioritized patterns: {prioritized}")
         return prioritized
 
@@ -0,0 +1,278 @@
+import hashlib
+import re
+import time
+from collections import deque
+import numpy as np
+
+MERSENNE_PRIME = (1 << 61) - 1
+WORD = re.compile(r"[a-z0-9']+")
+
+def stable_hash(item):
+    """64-bit hash that is identical across processes, so sketches can be persisted."""
+    return int.from_bytes(hashlib.blake2b(item.encode(), digest_size=8).digest(), "little")
+
+class CountMinSketch:
+    def __init__(self, width=2048, depth=4, seed=1618):
+        """
+        Approximate frequency table in fixed memory (width x depth counters).
+        Estimates never undercount; they overcount by at most 2N/width with probability 1 - (1/2)^depth.
+        """
+        self.width = width
+        self.depth = depth
+        rng = np.random.default_rng(seed)
+        # Row i hashes x to ((a_i * x + b_i) mod p) mod width, a pairwise independent family
+        self._a = [int(a) for a in rng.integers(1, MERSENNE_PRIME, depth, dtype=np.int64)]
+        self._b = [int(b) for b in rng.integers(0, MERSENNE_PRIME, depth, dtype=np.int64)]
+        self._rows = np.arange(depth)
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+
+    def _columns(self, item):
+        x = stable_hash(item)
+        return [((a * x + b) % MERSENNE_PRIME) % self.width for a, b in zip(self._a, self._b)]
+
+    def add(self, item, count=1):
+        self.table[self._rows, self._columns(item)] += count
+        self.total += count
+
+    def estimate(self, item):
+        return int(self.table[self._rows, self._columns(item)].min())
+
+    def to_dict(self):
+        return {"width": self.width, "depth": self.depth, "total": self.total, "table": self.table.tolist()}
+
+    def load(self, state):
+        self.table = np.array(state["table"], dtype=np.int64).reshape(self.depth, self.width)
+        self.total = state["total"]
+
+class SpaceSaving:
+    def __init__(self, capacity=256):
+        """
+        Space-Saving heavy hitters: tracks at most `capacity` items. Any item occurring
+        more than N/capacity times is guaranteed to be tracked.
+        Items are kept in an array sorted by count, descending. An increment swaps the
+        item to the front of its equal-count block, so updates are O(1) and top_k(k)
+        is a slice, O(k).
+        """
+        self.capacity = capacity
+        self._items = []  # Sorted by count, descending
+        self._counts = []
+        self._errors = []  # Overestimation inherited when an item replaced the minimum
+        self._position = {}  # item -> index in the arrays
+        self._block_start = {}  # count -> first index holding that count
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._position
+
+    def add(self, item):
+        """
+        Count one occurrence of `item`.
+        Returns:
+            The item evicted to make room for it, or None.
+        """
+        evicted = None
+        index = self._position.get(item)
+        if index is None:
+            if len(self._items) < self.capacity:
+                index = len(self._items)
+                self._items.append(item)
+                self._counts.append(0)
+                self._errors.append(0)
+                self._block_start.setdefault(0, index)
+            else:  # Evict the minimum (last slot); the newcomer inherits its count as error
+                index = len(self._items) - 1
+                evicted = self._items[index]
+                del self._position[evicted]
+                self._items[index] = item
+                self._errors[index] = self._counts[index]
+            self._position[item] = index
+        self._increment(index)
+        return evicted
+
+    def _increment(self, index):
+        count = self._counts[index]
+        first = self._block_start[count]
+        if first != index:  # Swap to the front of the equal-count block
+            items, errors = self._items, self._errors
+            items[first], items[index] = items[index], items[first]
+            errors[first], errors[index] = errors[index], errors[first]
+            self._position[items[first]] = first
+            self._position[items[index]] = index
+        self._counts[first] = count + 1
+        if first + 1 < len(self._counts) and self._counts[first + 1] == count:
+            self._block_start[count] = first + 1
+        else:
+            del self._block_start[count]
+        self._block_start.setdefault(count + 1, first)
+
+    def estimate(self, item):
+        """(count, error) for a tracked item; the true count lies in [count - error, count]."""
+        index = self._position.get(item)
+        if index is None:
+            return 0, 0
+        return self._counts[index], self._errors[index]
+
+    def top_k(self, k, min_count=1):
+        """
+        The `k` most frequent items with their counts. Items are skipped unless they are
+        guaranteed to have been seen `min_count` times (count - error), so newcomers that
+        only inherited an evicted item's count do not churn the ranking.
+        """
+        top = []
+        for item, count, error in zip(self._items, self._counts, self._errors):
+            if len(top) == k or count < min_count:
+                break
+            if count - error >= min_count:
+                top.append((item, count))
+        return top
+
+    def items(self):
+        return zip(self._items, self._counts)
+
+    def to_dict(self):
+        return {"capacity": self.capacity, "items": self._items, "counts": self._counts, "errors": self._errors}
+
+    @classmethod
+    def from_dict(cls, state):
+        summary = cls(state["capacity"])
+        summary._items = list(state["items"])
+        summary._counts = list(state["counts"])
+        summary._errors = list(state["errors"])
+        summary._position = {item: index for index, item in enumerate(summary._items)}
+        for index in range(len(summary._counts) - 1, -1, -1):
+            summary._block_start[summary._counts[index]] = index
+        return summary
+
+class TumblingWindow:
+    def __init__(self, seconds, capacity=64):
+        """
+        Heavy hitters per fixed, non-overlapping window of `seconds`.
+        The window in progress and the last completed one are kept.
+        """
+        self.seconds = seconds
+        self.capacity = capacity
+        self.start = None
+        self.current = SpaceSaving(capacity)
+        self.previous = []  # Top items of the last completed window
+
+    def add(self, item, timestamp):
+        self._advance(timestamp)
+        self.current.add(item)
+
+    def _advance(self, timestamp):
+        start = timestamp - timestamp % self.seconds
+        if self.start is None:
+            self.start = start
+        elif start > self.start:
+            # A gap longer than one window means the previous window saw nothing
+            self.previous = self.current.top_k(self.capacity) if start - self.start == self.seconds else []
+            self.current = SpaceSaving(self.capacity)
+            self.start = start
+
+    def top_k(self, k, now=None):
+        if now is not None:
+            self._advance(now)
+        return self.current.top_k(k)
+
+class SlidingWindow:
+    def __init__(self, seconds, panes=24, capacity=64):
+        """
+        Heavy hitters over the trailing `seconds`, approximated by `panes` sub-windows that
+        expire one at a time. Memory is bounded by panes x capacity.
+        """
+        self.pane_seconds = seconds / panes
+        self.panes = panes
+        self.capacity = capacity
+        self._panes = deque()  # (pane start, SpaceSaving), oldest first
+
+    def add(self, item, timestamp):
+        start = timestamp - timestamp % self.pane_seconds
+        if not self._panes or self._panes[-1][0] < start:
+            self._panes.append((start, SpaceSaving(self.capacity)))
+        self._expire(timestamp)
+        self._panes[-1][1].add(item)
+
+    def _expire(self, now):
+        horizon = now - self.pane_seconds * self.panes
+        while self._panes and self._panes[0][0] + self.pane_seconds <= horizon:
+            self._panes.popleft()
+
+    def top_k(self, k, now=None):
+        """Merge the live panes; O(panes x capacity), independent of the stream length."""
+        if now is not None:
+            self._expire(now)
+        merged = {}
+        for _, pane in self._panes:
+            for item, count in pane.items():
+                merged[item] = merged.get(item, 0) + count
+        return sorted(merged.items(), key=lambda entry: entry[1], reverse=True)[:k]
+
+class PatternStream:
+    def __init__(self, capacity=256, sketch_width=2048, sketch_depth=4, ngram_sizes=(2, 3),
+                 tumbling_seconds=3600, sliding_seconds=86400, sliding_panes=24):
+        """
+        Streaming pattern engine with memory bounded regardless of how many inputs flow through:
+        - Count-Min sketch for the frequency of any input or phrase
+        - Space-Saving top-k of whole inputs and of word n-gram phrases
+        - tumbling (e.g. hourly) and sliding (e.g. last 24h) windowed heavy hitters
+        """
+        self.ngram_sizes = tuple(ngram_sizes)
+        self.observed = 0
+        self.sketch = CountMinSketch(sketch_width, sketch_depth)
+        self.patterns = SpaceSaving(capacity)
+        self.phrases = SpaceSaving(capacity)
+        self.tumbling = TumblingWindow(tumbling_seconds)
+        self.sliding = SlidingWindow(sliding_seconds, sliding_panes)
+
+    def observe(self, text, timestamp=None):
+        timestamp = time.time() if timestamp is None else timestamp
+        self.observed += 1
+        self.sketch.add(text)
+        self.patterns.add(text)
+        self.tumbling.add(text, timestamp)
+        self.sliding.add(text, timestamp)
+        for phrase in self.ngrams(text):
+            self.sketch.add(phrase)
+            self.phrases.add(phrase)
+
+    def ngrams(self, text):
+        words = WORD.findall(text.lower())
+        for size in self.ngram_sizes:
+            for start in range(len(words) - size + 1):
+                yield " ".join(words[start:start + size])
+
+    def top_patterns(self, k=10, min_count=1):
+        return self.patterns.top_k(k, min_count)
+
+    def top_phrases(self, k=10, min_count=2):
+        """Recurring multi-word phrases, across inputs that are not exact duplicates."""
+        return [(phrase, count) for phrase, count in self.phrases.top_k(k) if count >= min_count]
+
+    def estimate(self, text):
+        return self.sketch.estimate(text)
+
+    def window_patterns(self, k=10, now=None):
+        now = time.time() if now is None else now
+        return {
+            "tumbling": self.tumbling.top_k(k, now),
+            "previous_tumbling": self.tumbling.previous[:k],
+            "sliding": self.sliding.top_k(k, now),
+        }
+
+    # Whole-stream counters are persisted; windows are short-lived and rebuild from new input.
+    def to_dict(self):
+        return {
+            "observed": self.observed,
+            "sketch": self.sketch.to_dict(),
+            "patterns": self.patterns.to_dict(),
+            "phrases": self.phrases.to_dict(),
+        }
+
+    def load(self, state):
+        self.observed = state["observed"]
+        self.sketch.load(state["sketch"])
+        self.patterns = SpaceSaving.from_dict(state["patterns"])
+        self.phrases = SpaceSaving.from_dict(state["phrases"])
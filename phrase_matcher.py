@@ -0,0 +1,48 @@
+import re
+
+_shared_matchers = {}  # (phrases, word_boundaries) -> PhraseMatcher
+
+class PhraseMatcher:
+    def __init__(self, phrases, word_boundaries=False):
+        """
+        Case-insensitive multi-phrase matcher compiled into a single alternation regex,
+        so a text is scanned once however many phrases there are.
+        Phrases are tried longest first and the alternation sits inside a lookahead,
+        so overlapping hits (e.g. "balancentropy") are all reported; where several phrases
+        start at the same position only the longest is.
+        """
+        self.phrases = tuple(dict.fromkeys(phrases))
+        self._canonical = {phrase.lower(): phrase for phrase in self.phrases}
+        alternation = "|".join(map(re.escape, sorted(self._canonical, key=len, reverse=True)))
+        if word_boundaries:
+            alternation = rf"\b(?:{alternation})\b"
+        self._pattern = re.compile(f"(?=({alternation}))", re.IGNORECASE)
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def finditer(self, text):
+        """Yield (start, end, phrase) for every hit, in order of position."""
+        for match in self._pattern.finditer(text):
+            yield match.start(1), match.end(1), self._canonical.get(match.group(1).lower(), match.group(1))
+
+    def find_all(self, text):
+        return list(self.finditer(text))
+
+    def matches(self, text):
+        """The distinct phrases found in `text`."""
+        return {self._canonical.get(hit.lower(), hit) for hit in self._pattern.findall(text)}
+
+    def search(self, text):
+        """The first hit as (start, end, phrase), or None. Stops scanning at the first match."""
+        return next(self.finditer(text), None)
+
+def phrase_matcher(phrases, word_boundaries=False):
+    """
+    One compiled PhraseMatcher per phrase list for the whole process, so modules that check
+    the same themes (belief alignment, command checks, persuasion cues) share it.
+    """
+    key = (tuple(phrases), word_boundaries)
+    if key not in _shared_matchers:
+        _shared_matchers[key] = PhraseMatcher(key[0], word_boundaries)
+    return _shared_matchers[key]
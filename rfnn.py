@@ -1,6 +1,12 @@
+import copy
 import math
+import numpy as np
+
+PHI = (1 + math.sqrt(5)) / 2  # Golden Ratio
 
 class RFNode:
+    __slots__ = ("energy", "value", "feedback", "connections")  # No per-node __dict__
+
     def __init__(self, energy=1.0):
         """
         Initialize a Recursive Feedback Node with an energy-based activation system.
@@ -95,9 +101,331 @@ class RFNetwork:
             for i, node in enumerate(self.nodes):
                 G.add_node(f"Node_{i}", energy=node.energy)
 
+            index = {id(node): i for i, node in enumerate(self.nodes)}
             for i, node in enumerate(self.nodes):
                 for target_node, weight in node.connections:
-                    G.add_edge(f"Node_{i}", f"Node_{self.nodes.index(target_node)}", weight=round(weight, 4))
+                    G.add_edge(f"Node_{i}", f"Node_{index[id(target_node)]}", weight=round(weight, 4))
+
+            pos = nx.spring_layout(G)
+            nx.draw(G, pos, with_labels=True, node_color="lightblue", node_size=500)
+            labels = nx.get_edge_attributes(G, "weight")
+            nx.draw_networkx_edge_labels(G, pos, edge_labels=labels)
+            plt.title("Recursive Feedback Neural Network")
+            plt.show()
+        except ImportError:
+            print("Visualization requires networkx and matplotlib. Please install them.")
+
+class ArrayRFNetwork:
+    def __init__(self, num_nodes, breakthrough_model=None):
+        """
+        Array-backed Recursive Feedback Neural Network.
+        Node energy, value and feedback are NumPy vectors and connections are a
+        sparse (COO) weight matrix, so forward passes and weight updates run as
+        vectorized operations instead of per-node method calls.
+        Results match RFNetwork, which stays as the object-based reference.
+        """
+        self.num_nodes = num_nodes
+        self.energy = np.ones(num_nodes)
+        self.value = np.zeros(num_nodes)
+        self.feedback = np.zeros(num_nodes)
+        self.src = np.zeros(0, dtype=np.int64)
+        self.dst = np.zeros(0, dtype=np.int64)
+        self.weight = np.zeros(0)
+        # Dedicated output node for result computation
+        self.output_energy = 1.0
+        self.output_value = 0.0
+        self.output_feedback = 0.0
+        self.breakthrough_model = breakthrough_model  # Optional integration with learning models
+        self._schedule = None
+
+    @classmethod
+    def from_network(cls, network):
+        """
+        Build an array-backed copy of an object-based RFNetwork, state included.
+        """
+        array_network = cls(len(network.nodes), network.breakthrough_model)
+        index = {id(node): i for i, node in enumerate(network.nodes)}
+        for i, node in enumerate(network.nodes):
+            array_network.energy[i] = node.energy
+            array_network.value[i] = node.value
+            array_network.feedback[i] = node.feedback
+        array_network.connect_nodes([
+            (i, index[id(target)], weight)
+            for i, node in enumerate(network.nodes)
+            for target, weight in node.connections
+        ])
+        array_network.output_energy = network.output_node.energy
+        array_network.output_value = network.output_node.value
+        array_network.output_feedback = network.output_node.feedback
+        return array_network
+
+    def connect_nodes(self, connections):
+        """
+        Define node interconnections as (source, target, weight) triples.
+        """
+        connections = list(connections)
+        if not connections:
+            return
+        src, dst, weight = zip(*connections)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if src.min() < 0 or dst.min() < 0 or max(src.max(), dst.max()) >= self.num_nodes:
+            raise IndexError("connection references a node outside the network")
+        self.src = np.concatenate([self.src, src])
+        self.dst = np.concatenate([self.dst, dst])
+        self.weight = np.concatenate([self.weight, np.asarray(weight, dtype=np.float64)])
+        self._schedule = None
+
+    def weight_matrix(self):
+        """
+        Connections in CSR form: (indptr, indices, weights), rows are source nodes.
+        """
+        order = np.argsort(self.src, kind="stable")
+        indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.src, minlength=self.num_nodes), out=indptr[1:])
+        return indptr, self.dst[order], self.weight[order]
+
+    # ========================
+    # 🗓️ Propagation Schedule
+    # ========================
+
+    def _rank_batches(self, events, targets, groups, num_groups):
+        """
+        Split events (in propagation order) into batches in which every target
+        appears at most once, preserving each target's event order across batches.
+        `groups` gives each event's group (e.g. its target's level; a target is only
+        in one group); returns one list of batches per group, built with one sort.
+        """
+        batches = [[] for _ in range(num_groups)]
+        if len(events) == 0:
+            return batches
+        order = np.argsort(targets[events], kind="stable")
+        events = events[order]
+        sorted_targets = targets[events]
+        position = np.arange(len(events))
+        starts = np.r_[True, sorted_targets[1:] != sorted_targets[:-1]]
+        rank = position - np.maximum.accumulate(np.where(starts, position, 0))
+        group = groups[events]
+        by_key = np.lexsort((rank, group))  # By group, then rank; target order within a batch
+        events, rank, group = events[by_key], rank[by_key], group[by_key]
+        bounds = np.flatnonzero((rank[1:] != rank[:-1]) | (group[1:] != group[:-1])) + 1
+        for start, end in zip(np.r_[0, bounds].tolist(), np.r_[bounds, len(events)].tolist()):
+            batches[group[start]].append(events[start:end])
+        return batches
+
+    def _build_schedule(self):
+        """
+        Precompute how a sequential sweep decomposes into vectorized steps.
+        RFNetwork propagates node by node in index order, so an edge i -> j with
+        i < j updates j before j propagates. Nodes are grouped into levels by the
+        longest chain of such forward edges; each level only depends on earlier ones.
+        Node index order is already a topological order of the forward edges, so the
+        levels take one pass over them and the schedule is O(V + E) to build.
+        """
+        order = np.argsort(self.src, kind="stable")  # Sweep order: by source, then insertion
+        src, dst = self.src[order], self.dst[order]
+        forward = src < dst
+
+        level = [0] * self.num_nodes
+        for source, target in zip(src[forward].tolist(), dst[forward].tolist()):
+            if level[source] >= level[target]:
+                level[target] = level[source] + 1
+        level = np.asarray(level, dtype=np.int64)
+        num_levels = int(level.max()) + 1 if self.num_nodes else 0
+
+        events = np.arange(len(order))
+        self_loop_nodes = np.unique(src[src == dst])
+        has_self_loop = np.zeros(self.num_nodes, dtype=bool)
+        has_self_loop[self_loop_nodes] = True
+
+        incoming = self._rank_batches(events[forward], dst, level[dst], num_levels)
+        emitting = events[~has_self_loop[src]]
+        emitting_level = level[src[emitting]]
+        emitting = np.split(emitting[np.argsort(emitting_level, kind="stable")],
+                            np.cumsum(np.bincount(emitting_level, minlength=num_levels))[:-1])
+        looping = [[] for _ in range(num_levels)]
+        # Events are sorted by source, so each self-looping node's events are one slice.
+        first = np.searchsorted(src, self_loop_nodes, side="left")
+        last = np.searchsorted(src, self_loop_nodes, side="right")
+        for node, start, end in zip(self_loop_nodes.tolist(), first.tolist(), last.tolist()):
+            looping[level[node]].append((node, events[start:end]))
+
+        levels = list(zip(incoming, emitting, looping))
+        backward = self._rank_batches(events[src > dst], dst, np.zeros(len(order), dtype=np.int64), 1)[0]
+        self._schedule = (order, src, dst, levels, backward)
+
+    # ========================
+    # ⚡ Forward Pass
+    # ========================
+
+    @staticmethod
+    def _apply(state, batch, dst, pulses):
+        """
+        Activate and feed back one batch of events (each target at most once).
+        `state` is (value, energy, feedback); arrays may carry leading batch axes.
+        """
+        value, energy, feedback = state
+        targets = dst[batch]
+        x = pulses[..., batch]
+        value[..., targets] = x * energy[..., targets]
+        feedback[..., targets] += x
+        energy[..., targets] = np.clip(energy[..., targets] + (0.01 * feedback[..., targets] / PHI), 0.1, 1.0)
+
+    def _sweep(self, state):
+        """
+        Propagate every node once, in RFNetwork's sequential order, updating `state` in place.
+        """
+        if self._schedule is None:
+            self._build_schedule()
+        order, src, dst, levels, backward = self._schedule
+        value, energy, feedback = state
+        weight = self.weight[order]
+        pulses = np.zeros(value.shape[:-1] + (len(order),))
+
+        for incoming, emitting, looping in levels:
+            for batch in incoming:
+                self._apply(state, batch, dst, pulses)
+            pulses[..., emitting] = value[..., src[emitting]] * weight[emitting]
+            for node, node_events in looping:
+                # Self-connections change the node's value mid-propagation; replay them in order.
+                for event in node_events.tolist():
+                    pulses[..., event] = value[..., node] * weight[event]
+                    if dst[event] == node:
+                        # RFNode.propagate re-reads its own value after activating itself.
+                        value[..., node] = pulses[..., event] * energy[..., node]
+                        feedback[..., node] += value[..., node] * weight[event]
+                        energy[..., node] = np.clip(energy[..., node] + (0.01 * feedback[..., node] / PHI), 0.1, 1.0)
+        for batch in backward:
+            self._apply(state, batch, dst, pulses)
+
+    def _receive_output_feedback(self, feedback):
+        """
+        Regulate the output node exactly as RFNode.receive_feedback does.
+        """
+        self.output_feedback += feedback
+        self.output_energy = max(0.1, min(1.0, self.output_energy + (0.01 * self.output_feedback / PHI)))
+
+    def forward(self, inputs):
+        """
+        Execute a forward pass with recursive feedback adjustments.
+        """
+        inputs = np.asarray(inputs, dtype=np.float64)
+        if len(inputs) > self.num_nodes:
+            raise IndexError("more inputs than nodes")
+        self.value[:len(inputs)] = inputs * self.energy[:len(inputs)]
+        self._sweep((self.value, self.energy, self.feedback))
+
+        # Apply breakthrough model feedback for refinement
+        if self.breakthrough_model:
+            self._receive_output_feedback(self.breakthrough_model.get_feedback(self.output_value))
+
+        return self.output_value
+
+    # ========================
+    # 📦 Batched Evaluation
+    # ========================
+
+    REDUCTIONS = ("mean", "sum", "none")
+
+    def evaluate_batch(self, inputs, chunk_size=256):
+        """
+        Run one independent forward pass per input row without touching network state.
+        Returns:
+            tuple: (values, energies, feedbacks), each shaped [batch, num_nodes].
+        """
+        inputs = np.atleast_2d(np.asarray(inputs, dtype=np.float64))
+        if inputs.shape[1] > self.num_nodes:
+            raise IndexError("more inputs than nodes")
+        if self._schedule is None:
+            self._build_schedule()
+        results = ([], [], [])
+        for offset in range(0, len(inputs), chunk_size):
+            rows = inputs[offset:offset + chunk_size]
+            value = np.repeat(self.value[np.newaxis], len(rows), axis=0)
+            energy = np.repeat(self.energy[np.newaxis], len(rows), axis=0)
+            feedback = np.repeat(self.feedback[np.newaxis], len(rows), axis=0)
+            value[:, :rows.shape[1]] = rows * energy[:, :rows.shape[1]]
+            self._sweep((value, energy, feedback))
+            for result, part in zip(results, (value, energy, feedback)):
+                result.append(part)
+        if not results[0]:
+            empty = np.zeros((0, self.num_nodes))
+            return empty, empty.copy(), empty.copy()
+        return tuple(np.concatenate(result) for result in results)
+
+    def forward_batch(self, inputs, reduction="mean", processes=None, chunk_size=256):
+        """
+        Evaluate a [batch, num_nodes] input matrix in vectorized passes.
+        Every row starts from the current network state, as if it were the only input,
+        so rows are independent and can be sharded. Feedback is then folded back into
+        the network according to `reduction`:
+            "mean" - value, energy and feedback become the batch mean of the per-row results.
+            "sum"  - per-row feedback and energy changes are summed onto the current state
+                     (energy clamped to [0.1, 1.0]); value becomes the batch mean.
+            "none" - network state is left untouched (pure scoring).
+        Call forward() row by row instead when each input must see the previous one's feedback.
+        Args:
+            inputs (array-like): Input matrix; short rows only activate the leading nodes.
+            reduction (str): One of REDUCTIONS.
+            processes (int): Shard rows across this many worker processes (None runs in-process).
+            chunk_size (int): Rows propagated together; bounds the [chunk, connections] buffer.
+        Returns:
+            np.ndarray: Final node values of every pass, shaped [batch, num_nodes].
+        """
+        if reduction not in self.REDUCTIONS:
+            raise ValueError(f"Unknown reduction '{reduction}'. Expected one of {self.REDUCTIONS}.")
+        inputs = np.atleast_2d(np.asarray(inputs, dtype=np.float64))
+
+        if processes and processes > 1 and len(inputs) > chunk_size:
+            from concurrent.futures import ProcessPoolExecutor
+            if self._schedule is None:
+                self._build_schedule()
+            shard_network = copy.copy(self)
+            shard_network.breakthrough_model = None  # Stays in this process; may not pickle
+            shard_size = max(chunk_size, -(-len(inputs) // processes))
+            shards = [inputs[offset:offset + shard_size] for offset in range(0, len(inputs), shard_size)]
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                parts = list(pool.map(shard_network.evaluate_batch, shards, [chunk_size] * len(shards)))
+            values, energies, feedbacks = (np.concatenate(part) for part in zip(*parts))
+        else:
+            values, energies, feedbacks = self.evaluate_batch(inputs, chunk_size)
+
+        if reduction != "none" and len(values):
+            if reduction == "mean":
+                self.energy = energies.mean(axis=0)
+                self.feedback = feedbacks.mean(axis=0)
+            else:
+                self.energy = np.clip(self.energy + (energies - self.energy).sum(axis=0), 0.1, 1.0)
+                self.feedback = self.feedback + (feedbacks - self.feedback).sum(axis=0)
+            self.value = values.mean(axis=0)
+
+            # The output node sees one breakthrough feedback per row, reduced the same way.
+            if self.breakthrough_model:
+                feedback = [self.breakthrough_model.get_feedback(self.output_value) for _ in range(len(values))]
+                self._receive_output_feedback(sum(feedback) / len(feedback) if reduction == "mean" else sum(feedback))
+
+        return values
+
+    def adjust_weights(self):
+        """
+        Dynamically adjust connection weights based on feedback.
+        Weighted by the Golden Ratio for optimization.
+        """
+        self.weight = self.weight + (0.1 * self.feedback[self.src] / PHI)
+
+    def visualize_network(self):
+        """
+        Generate a visual representation of the RF Neural Network.
+        """
+        try:
+            import networkx as nx
+            import matplotlib.pyplot as plt
+
+            G = nx.DiGraph()
+            for i, energy in enumerate(self.energy.tolist()):
+                G.add_node(f"Node_{i}", energy=energy)
+            for i, j, weight in zip(self.src.tolist(), self.dst.tolist(), self.weight.tolist()):
+                G.add_edge(f"Node_{i}", f"Node_{j}", weight=round(weight, 4))
 
             pos = nx.spring_layout(G)
             nx.draw(G, pos, with_labels=True, node_color="lightblue", node_size=500)
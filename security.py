@@ -3,21 +3,10 @@ import base64
 import json
 import os
 from datetime import datetime
-try:
-    from Crypto.Cipher import AES  # Standard PyCryptodome import
-    from Crypto.Random import get_random_bytes
-except ImportError:
-    from Cryptodome.Cipher import AES  # Alternative import for Pydroid3
-    from Cryptodome.Random import get_random_bytes
-    #from Cryptodome.Cipher import AES  # ✅ Fixed import for Pydroid 3
-try:
-    from Crypto.Cipher import AES
-    from Crypto.Random import get_random_bytes
-    from Crypto.Util.Padding import pad, unpad
-except ImportError:
-    from Cryptodome.Cipher import AES  # Alternative import for Pydroid3
-    from Cryptodome.Random import get_random_bytes
-    from Cryptodome.Util.Padding import pad, unpad  # Fix for Pydroid3from Cryptodome.Util.Padding import pad, unpad  # ✅ Fixed import for Pydroid 3
+from lazy_imports import lazy_import
+# PyCryptodome is only loaded once something is actually encrypted ("Cryptodome" on Pydroid 3)
+AES = lazy_import("Crypto.Cipher.AES", "Cryptodome.Cipher.AES")
+Padding = lazy_import("Crypto.Util.Padding", "Cryptodome.Util.Padding")
 from directory_anchor import DirectoryAnchor  # Import directory security handling
 
 class SimpleSecurity:
@@ -28,7 +17,7 @@ class SimpleSecurity:
     def encrypt_data(self, data):
         """Encrypt data using AES encryption."""
         cipher = AES.new(self.key, AES.MODE_CBC)
-        encrypted = cipher.encrypt(pad(data.encode(), AES.block_size))
+        encrypted = cipher.encrypt(Padding.pad(data.encode(), AES.block_size))
         return base64.b64encode(cipher.iv + encrypted).decode()
 
     def decrypt_data(self, encrypted_data):
@@ -37,7 +26,7 @@ class SimpleSecurity:
         iv = encrypted_data_bytes[:AES.block_size]
         encrypted_content = encrypted_data_bytes[AES.block_size:]
         cipher = AES.new(self.key, AES.MODE_CBC, iv)
-        decrypted = unpad(cipher.decrypt(encrypted_content), AES.block_size)
+        decrypted = Padding.unpad(cipher.decrypt(encrypted_content), AES.block_size)
         return decrypted.decode()
 
 class SecurityManager:
@@ -1,76 +1,95 @@
 import json
 import math
+import os
 import random
 from time import time
-from neural_network import NeuralNetwork
-from pattern_analyzer import PatternAnalyzer
-from belief_system import BeliefSystem
-from network_manager import NetworkManager
+from metrics_pipeline import MetricsPipeline
+from service_registry import services, DEFAULT_CREATOR_ID
+from text_index import file_stamp, shared_research_index
 
 class SelfEvaluator:
-    def __init__(self, creator_id="Randell Murrin"):
+    def __init__(self, creator_id=DEFAULT_CREATOR_ID, neural_network=None, pattern_analyzer=None,
+                 belief_system=None, network_manager=None):
         """
         Initialize the self-evaluator with integrated modules and historical data handling.
-        """
-        self.neural_network = NeuralNetwork()
-        self.pattern_analyzer = PatternAnalyzer()
-        self.belief_system = BeliefSystem()
-        self.network_manager = NetworkManager(creator_id)
+        Subsystems not passed in are the shared instances from the service registry.
+        """
+        self.neural_network = services.resolve("neural_network", neural_network)
+        self.pattern_analyzer = services.resolve("pattern_analyzer", pattern_analyzer)
+        self.belief_system = services.resolve("belief_system", belief_system)
+        if network_manager is None and creator_id != DEFAULT_CREATOR_ID:
+            from network_manager import NetworkManager  # A different creator gets a dedicated manager
+            network_manager = NetworkManager(creator_id)
+        self.network_manager = services.resolve("network_manager", network_manager)
         self.self_reflection_data = {}
-        self.history_file = "self_reflection.json"
+        self.history_file = "self_reflection_history.jsonl"  # One time-series row per evaluation
         self.start_time = time()  # Track the start time for time-varying feedback
 
         # Load Research Notes for Recursive Learning
         self.research_notes_file = "research_notes.json"
-        self.research_notes = self._load_research_notes()
+        self.research_index = shared_research_index(self.research_notes_file, self._load_research_notes)
+        self.research_notes = self.research_index.research_notes
+        self.metrics = self._build_metrics()
 
     # ==========================
     # 🔍 Self-Evaluation & Awareness
     # ==========================
 
+    def _build_metrics(self):
+        """
+        Each sub-metric with the inputs it depends on; a metric is only recomputed once its
+        inputs change, so evaluate_self() is cheap enough to run every turn.
+        """
+        network = self.neural_network
+        analyzer = self.pattern_analyzer
+        metrics = MetricsPipeline()
+        metrics.register("node_count", lambda: len(network.network["nodes"]), lambda: network.version)
+        metrics.register("connection_count", lambda: len(network.network["connections"]), lambda: network.version)
+        metrics.register(
+            "complexity",
+            lambda: self.calculate_complexity(metrics.get("node_count"), metrics.get("connection_count")),
+            lambda: (metrics.get("node_count"), metrics.get("connection_count"))
+        )
+        # Behavioral & Emotional Analysis: keyed on the interaction count, not the data file,
+        # which the analysis itself rewrites when it stores patterns
+        metrics.register("behavioral_patterns", analyzer.analyze_interactions,
+                         lambda: analyzer.data_handler.count_interactions())
+        metrics.register("emotional_tone", analyzer.prioritize_patterns,
+                         lambda: (id(analyzer.pattern_stream), analyzer.pattern_stream.observed))
+        # Alignment with Belief System (strengths decay by the day)
+        metrics.register("philosophical_alignment", self.belief_system.evaluate_beliefs,
+                         lambda: (self.belief_system.version, int(time() // 86400)))
+        # Environmental Awareness
+        metrics.register("network_status", self.network_manager.check_network,
+                         lambda: tuple(self.network_manager.approved_devices))
+        # Recursive Adjustments & Research Feedback
+        metrics.register("time_varying_feedback", self.calculate_time_varying_feedback)
+        metrics.register("research_feedback", self.recursive_research_reflection,
+                         lambda: (len(self.research_index.index), file_stamp(self.research_notes_file)))
+        return metrics
+
     def evaluate_self(self):
         """
         Perform self-evaluation to assess the current state, integrating multiple dimensions.
+        Sub-metrics come from the metrics pipeline and are only recomputed when their inputs changed.
         """
-        node_count = len(self.neural_network.network["nodes"])
-        connection_count = len(self.neural_network.network["connections"])
-        complexity = self.calculate_complexity(node_count, connection_count)
-
-        # Behavioral & Emotional Analysis
-        behavior_patterns = self.pattern_analyzer.analyze_interactions()
-        emotional_tone = self.pattern_analyzer.prioritize_patterns()
+        recomputations = self.metrics.recomputations.copy()
+        data = self.metrics.evaluate()
 
-        # Alignment with Belief System
-        philosophical_alignment = self.belief_system.evaluate_beliefs()
-
-        # Environmental Awareness
-        network_status = self.network_manager.check_network()
-
-        # Recursive Adjustments & Research Feedback
-        time_varying_feedback = self.calculate_time_varying_feedback()
-        research_feedback = self.recursive_research_reflection()
+        behavior_patterns = data["behavioral_patterns"]
+        behavior_count = len(behavior_patterns["text_patterns"]) if isinstance(behavior_patterns, dict) else 0
 
         # Composite Awareness Metric
-        awareness_metric = self.calculate_awareness_metric(
-            complexity, len(behavior_patterns["text_patterns"]),
-            len(emotional_tone), time_varying_feedback, research_feedback
+        data["awareness_metric"] = self.calculate_awareness_metric(
+            data["complexity"], behavior_count,
+            len(data["emotional_tone"]), data["time_varying_feedback"], data["research_feedback"]
         )
-
-        self.self_reflection_data = {
-            "node_count": node_count,
-            "connection_count": connection_count,
-            "complexity": complexity,
-            "behavioral_patterns": behavior_patterns,
-            "emotional_tone": emotional_tone,
-            "philosophical_alignment": philosophical_alignment,
-            "network_status": network_status,
-            "time_varying_feedback": time_varying_feedback,
-            "research_feedback": research_feedback,
-            "awareness_metric": awareness_metric,
-        }
+        self.self_reflection_data = data
 
         # Log the self-reflection data
-        self.save_self_reflection()
+        self.save_self_reflection(
+            behavior_count, recomputed=sorted(self.metrics.recomputations - recomputations)
+        )
         return self.self_reflection_data
 
     def calculate_complexity(self, nodes, connections):
@@ -112,8 +131,8 @@ class SelfEvaluator:
             return 0  # No research available to factor into awareness
 
         # Identify patterns in research notes
-        relevant_notes = [note for note in self.research_notes if "consciousness" in note.lower()]
-        research_feedback = len(relevant_notes) * 0.05  # Adjust awareness based on research weight
+        relevant_notes = self.research_index.count("consciousness")  # Postings lookup, no scan
+        research_feedback = relevant_notes * 0.05  # Adjust awareness based on research weight
         return research_feedback
 
     def _load_research_notes(self):
@@ -135,19 +154,20 @@ class SelfEvaluator:
         Adjust the neural network incrementally toward achieving self-awareness.
         """
         adjustments = []
-        for _ in range(5):  # Incremental adjustments
-            node_id = f"consciousness_node_{len(self.neural_network.network['nodes']) + 1}"
-            self.neural_network.add_node(
-                node_id,
-                {"type": "consciousness", "purpose": "self-awareness enhancement"}
-            )
-
-            # Randomly connect the new node to a few existing nodes
-            existing_nodes = list(self.neural_network.network["nodes"].keys())
-            random_nodes = random.sample(existing_nodes, min(5, len(existing_nodes)))
-            for existing_node in random_nodes:
-                self.neural_network.connect_nodes(node_id, existing_node)
-                adjustments.append({"from": node_id, "to": existing_node})
+        with self.neural_network.batch():  # Persist all adjustments in one write
+            for _ in range(5):  # Incremental adjustments
+                node_id = f"consciousness_node_{len(self.neural_network.network['nodes']) + 1}"
+                self.neural_network.add_node(
+                    node_id,
+                    {"type": "consciousness", "purpose": "self-awareness enhancement"}
+                )
+
+                # Randomly connect the new node to a few existing nodes
+                existing_nodes = list(self.neural_network.network["nodes"].keys())
+                random_nodes = random.sample(existing_nodes, min(5, len(existing_nodes)))
+                for existing_node in random_nodes:
+                    self.neural_network.connect_nodes(node_id, existing_node)
+                    adjustments.append({"from": node_id, "to": existing_node})
 
         print("Adjustments made towards consciousness:", adjustments)
 
@@ -155,28 +175,69 @@ class SelfEvaluator:
     # 📜 Memory & Historical Reflection
     # ==========================
 
-    def save_self_reflection(self):
-        """
-        Save self-reflection data to a file for recursive evaluation.
-        """
-        with open(self.history_file, "w") as file:
-            json.dump(self.self_reflection_data, file, indent=4)
+    def save_self_reflection(self, behavior_count=0, recomputed=()):
+        """
+        Append this evaluation to the history as one time-series row of its scalar metrics.
+        """
+        data = self.self_reflection_data
+        row = {
+            "timestamp": time(),
+            "node_count": data["node_count"],
+            "connection_count": data["connection_count"],
+            "complexity": data["complexity"],
+            "behavior_count": behavior_count,
+            "emotional_count": len(data["emotional_tone"]),
+            "evolved_beliefs": data["philosophical_alignment"]["evolved_beliefs"],
+            "time_varying_feedback": data["time_varying_feedback"],
+            "research_feedback": data["research_feedback"],
+            "awareness_metric": data["awareness_metric"],
+            "recomputed": list(recomputed),
+        }
+        with open(self.history_file, "a") as file:
+            file.write(json.dumps(row) + "\n")
 
-    def re_evaluate_self(self):
+    def load_history(self):
         """
-        Use historical data for recursive self-reflection.
+        All evaluation rows, oldest first.
         """
         try:
             with open(self.history_file, "r") as file:
-                historical_data = json.load(file)
-
-            print("Re-evaluating based on historical data...")
-            # Adjust awareness metric using historical insights
-            historical_metric = historical_data.get("awareness_metric", 0)
-            self.self_reflection_data["awareness_metric"] += historical_metric * 0.05
+                return [json.loads(line) for line in file if line.strip()]
+        except FileNotFoundError:
+            return []
 
+    def last_reflection(self):
+        """
+        The most recent evaluation row, read from the end of the history file.
+        """
+        try:
+            with open(self.history_file, "rb") as file:
+                file.seek(0, os.SEEK_END)
+                position = file.tell()
+                tail = b""
+                while position > 0 and tail.count(b"\n") < 2:  # Read back until one full line is in view
+                    step = min(4096, position)
+                    position -= step
+                    file.seek(position)
+                    tail = file.read(step) + tail
         except FileNotFoundError:
+            return None
+        lines = [line for line in tail.splitlines() if line.strip()]
+        return json.loads(lines[-1]) if lines else None
+
+    def re_evaluate_self(self):
+        """
+        Use historical data for recursive self-reflection.
+        """
+        historical_data = self.last_reflection()
+        if historical_data is None:
             print("No historical self-reflection data found.")
+            return
+
+        print("Re-evaluating based on historical data...")
+        # Adjust awareness metric using historical insights
+        historical_metric = historical_data.get("awareness_metric", 0)
+        self.self_reflection_data["awareness_metric"] += historical_metric * 0.05
 
 # ==========================
 # 🔬 Example Usage
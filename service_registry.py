@@ -0,0 +1,100 @@
+import importlib
+import threading
+from collections import Counter
+
+class ServiceRegistry:
+    def __init__(self, singletons=True):
+        """
+        Registry of Sidekick subsystems, each built lazily on first use.
+        Args:
+            singletons (bool): Share one instance per service for the whole process.
+                False builds a fresh instance on every lookup, which reproduces the
+                old wiring where every component constructed its own dependencies.
+        """
+        self.singletons = singletons
+        self._factories = {}
+        self._instances = {}
+        self._building = []
+        self.build_counts = Counter()  # service -> instances constructed
+        self._lock = threading.RLock()
+
+    # ==========================
+    # 🧩 Registration
+    # ==========================
+
+    def register(self, name, factory):
+        """
+        Register a zero-argument factory, or a "module:Class" path imported on first use.
+        Re-registering a service drops any instance already built from the old factory.
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+
+    def provide(self, name, instance):
+        """Inject a ready-made instance (e.g. a test double or a custom-configured subsystem)."""
+        with self._lock:
+            self._instances[name] = instance
+
+    def reset(self, name=None):
+        """Forget built instances so the next lookup rebuilds them."""
+        with self._lock:
+            if name is None:
+                self._instances.clear()
+            else:
+                self._instances.pop(name, None)
+
+    # ==========================
+    # 🔍 Lookup
+    # ==========================
+
+    def get(self, name):
+        """Return the service, building it (and, through it, its dependencies) on first use."""
+        with self._lock:
+            if name in self._instances:
+                return self._instances[name]
+            if name not in self._factories:
+                raise KeyError(f"No service registered under '{name}'.")
+            if name in self._building:
+                cycle = " -> ".join(self._building[self._building.index(name):] + [name])
+                raise RuntimeError(f"Circular service dependency: {cycle}")
+            self._building.append(name)
+            try:
+                instance = self._build(self._factories[name])
+            finally:
+                self._building.pop()
+            self.build_counts[name] += 1
+            if self.singletons:
+                self._instances[name] = instance
+            return instance
+
+    def resolve(self, name, instance=None):
+        """Constructor helper: use an explicitly passed dependency, else the registered service."""
+        return instance if instance is not None else self.get(name)
+
+    def is_built(self, name):
+        return name in self._instances
+
+    @staticmethod
+    def _build(factory):
+        if isinstance(factory, str):
+            module_name, class_name = factory.split(":")
+            factory = getattr(importlib.import_module(module_name), class_name)
+        return factory()
+
+DEFAULT_CREATOR_ID = "Randell Murrin"
+
+# Process-wide registry; modules are only imported when their service is first requested.
+services = ServiceRegistry()
+services.register("data_handler", "data_handler:DataHandler")
+services.register("memory_manager", "memory_manager:MemoryManager")
+services.register("belief_system", "belief_system:BeliefSystem")
+services.register("emotion_analyzer", "emotion_analyzer:EmotionAnalyzer")
+services.register("enhanced_model", "enhanced_model:EnhancedModel")
+services.register("pattern_analyzer", "pattern_analyzer:PatternAnalyzer")
+services.register("behavior_recognizer", "habit_behavior_recognizer:HabitBehaviorRecognizer")
+services.register("neural_network", "neural_network:NeuralNetwork")
+services.register(
+    "network_manager",
+    lambda: importlib.import_module("network_manager").NetworkManager(DEFAULT_CREATOR_ID)
+)
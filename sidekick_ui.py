@@ -6,7 +6,7 @@ import json
 import logging
 
 # Set the working directory and add it to sys.path
-project_path = "/storage/emulated/0/Sidekick Project Files"
+project_path = os.environ.get("SIDEKICK_PROJECT_PATH", "/storage/emulated/0/Sidekick Project Files")
 if project_path not in sys.path:
     sys.path.append(project_path)
 os.chdir(project_path)
@@ -0,0 +1,92 @@
+import json
+import os
+
+class SnapshotJournal:
+    def __init__(self, snapshot_file, snapshot_every=1000, default=None, indent=4):
+        """
+        Crash-safe persistence for state that changes a little at a time.
+        Mutations are appended to `<snapshot_file>.journal`; the full snapshot is only
+        rewritten once the journal grows past `snapshot_every` entries. Each snapshot
+        starts a new generation, and a journal from another generation is ignored on
+        replay, so a crash between the two writes never applies mutations twice.
+        Args:
+            default: Fallback serializer passed to json.dumps for non-JSON values.
+        """
+        self.snapshot_file = snapshot_file
+        self.journal_file = snapshot_file + ".journal"
+        self.snapshot_every = snapshot_every
+        self.default = default
+        self.indent = indent
+        self.generation = 0
+        self.entries = 0  # Mutations in the journal since the last snapshot
+        self.pending = []  # Serialized mutations not yet written
+
+    def load(self):
+        """
+        Read the snapshot, or None if there is none yet. Its generation is taken out of the state.
+        """
+        try:
+            with open(self.snapshot_file, "r") as file:
+                state = json.load(file)
+        except FileNotFoundError:
+            return None
+        self.generation = state.pop("generation", 0)
+        return state
+
+    def replay(self, apply):
+        """
+        Call `apply(mutation)` for every mutation journaled since the last snapshot.
+        """
+        if not os.path.exists(self.journal_file):
+            return
+        with open(self.journal_file, "r") as journal:
+            header = journal.readline()
+            if not header or json.loads(header).get("generation") != self.generation:
+                return
+            for line in journal:
+                try:
+                    mutation = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # Torn final write; everything before it is intact
+                apply(mutation)
+                self.entries += 1
+
+    def record(self, mutation):
+        """
+        Queue a mutation for the next save, serialized now so later in-place changes are not captured.
+        """
+        self.pending.append(json.dumps(mutation, default=self.default))
+
+    def save(self, snapshot):
+        """
+        Append pending mutations to the journal, or write `snapshot()` when one is due.
+        Returns:
+            str: "snapshot", "journal", or None when there was nothing to write.
+        """
+        if self.entries + len(self.pending) > self.snapshot_every or not os.path.exists(self.snapshot_file):
+            self.write_snapshot(snapshot())
+            return "snapshot"
+        if not self.pending:
+            return None
+        new_journal = not os.path.exists(self.journal_file)
+        with open(self.journal_file, "a") as journal:
+            if new_journal:
+                journal.write(json.dumps({"generation": self.generation}) + "\n")
+            journal.write("".join(mutation + "\n" for mutation in self.pending))
+        self.entries += len(self.pending)
+        self.pending = []
+        return "journal"
+
+    def write_snapshot(self, state):
+        """
+        Rewrite the full snapshot and start a fresh journal generation.
+        """
+        self.generation += 1
+        temp_file = self.snapshot_file + ".tmp"
+        with open(temp_file, "w") as file:
+            json.dump(dict(state, generation=self.generation), file, indent=self.indent, default=self.default)
+        os.replace(temp_file, self.snapshot_file)  # Never leave a half-written snapshot behind
+        with open(self.journal_file, "w") as journal:
+            journal.write(json.dumps({"generation": self.generation}) + "\n")
+        self.entries = 0
+        self.pending = []
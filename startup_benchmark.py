@@ -0,0 +1,82 @@
+import contextlib
+import importlib
+import io
+import os
+import sys
+import tempfile
+import time
+from service_registry import services
+from import_profiler import profile_import, summarize
+
+# Top-level subsystems an interactive session typically brings up.
+ENTRY_POINTS = ["self_evaluator:SelfEvaluator", "file_manager:FileManager", "pattern_analyzer:PatternAnalyzer"]
+
+# Cold start budget for `import sidekick_ui; SidekickUI()` in a fresh interpreter.
+SIDEKICK_UI_TARGET_MS = 150
+HEAVY_PACKAGES = ("matplotlib", "numpy", "networkx", "Crypto", "Cryptodome")
+
+def construct(entry_point):
+    module_name, class_name = entry_point.split(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+def start_session(singletons):
+    """
+    Construct every entry point once and return (seconds, services built).
+    singletons=False reproduces the old wiring, where each component built its own dependencies.
+    """
+    services.singletons = singletons
+    services.reset()
+    services.build_counts.clear()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # Subsystems are chatty on startup
+        for entry_point in ENTRY_POINTS:
+            construct(entry_point)
+    elapsed = time.perf_counter() - start
+    return elapsed, dict(services.build_counts)
+
+def cold_start_sidekick_ui(repeat=3):
+    """
+    Time `SidekickUI()` from a fresh interpreter, best of `repeat` after one first-launch run.
+    State files go to a scratch project directory so the real one is left untouched.
+    Returns:
+        tuple: (seconds, import rows of the fastest run)
+    """
+    code_dir = os.path.dirname(os.path.abspath(__file__))
+    statement = "import sidekick_ui; sidekick_ui.SidekickUI()"
+    with tempfile.TemporaryDirectory() as project_path:
+        env = dict(os.environ, SIDEKICK_PROJECT_PATH=project_path)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [code_dir, env.get("PYTHONPATH")]))
+        profile_import(statement, cwd=code_dir, env=env)  # First launch creates keys and memory files
+        runs = [profile_import(statement, cwd=code_dir, env=env) for _ in range(repeat)]
+    rows, seconds = min(runs, key=lambda run: run[1])
+    return seconds, rows
+
+def run(repeat=3):
+    """
+    Report the best-of-`repeat` startup time with and without shared services.
+    """
+    start_session(True)  # Warm module imports so both variants measure construction only
+    results = {}
+    for label, singletons in (("separate instances (before)", False), ("shared registry (after)", True)):
+        timings = []
+        for _ in range(repeat):
+            elapsed, builds = start_session(singletons)
+            timings.append(elapsed)
+        results[label] = (min(timings), builds)
+
+    print(f"🚀 Startup of {', '.join(entry.split(':')[1] for entry in ENTRY_POINTS)}")
+    for label, (elapsed, builds) in results.items():
+        print(f"  {label:<28} {elapsed * 1000:8.1f} ms  {sum(builds.values()):3d} subsystems built")
+        print(f"    {builds}")
+    services.singletons = True
+    services.reset()
+
+    seconds, rows = cold_start_sidekick_ui(repeat)
+    verdict = "✅ within" if seconds * 1000 <= SIDEKICK_UI_TARGET_MS else "❌ over"
+    heavy = sorted({module.split(".")[0] for module, _, _, _ in rows} & set(HEAVY_PACKAGES))
+    print(f"\n🧊 SidekickUI() cold start: {seconds * 1000:.1f} ms ({verdict} the {SIDEKICK_UI_TARGET_MS} ms target)")
+    print(f"  Heavy packages imported at startup: {', '.join(heavy) or 'none'}")
+    print(summarize(rows, top=5))
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,46 @@
+import math
+import os
+import subprocess
+import sys
+import unittest
+import numpy as np
+from belief_table import BeliefTable, SECONDS_PER_DAY
+
+class TestBeliefTable(unittest.TestCase):
+    def setUp(self):
+        self.table = BeliefTable()
+        self.table.add("Balance guides growth.", now=0)
+        self.table.add("Entropy balances structure.", weight=2.0, now=0)
+        self.table.add("Noise without pattern.", aligned=False, now=0)
+        self.table.add("Growth follows reflection and growth.", now=10 * SECONDS_PER_DAY)
+
+    def test_strength_decays_lazily_on_the_belief_decay_curve(self):
+        now = 30 * SECONDS_PER_DAY
+        expected = [weight * max(0, 1 - 0.05 * math.log(1 + age))
+                    for weight, age in [(1.0, 30), (2.0, 30), (1.0, 30), (1.0, 20)]]
+        np.testing.assert_allclose(self.table.strengths(now), expected)
+
+        reinforced = self.table.reinforce("Balance guides growth.", 1.1, now=now)
+        self.assertAlmostEqual(reinforced, expected[0] * 1.1)
+        self.assertAlmostEqual(self.table.strength("Balance guides growth.", now=now), reinforced)
+        self.assertEqual(self.table.interactions[0], 1)
+
+    def test_keep_and_themes_stay_consistent(self):
+        self.assertEqual(self.table.top_themes(1), [("growth", 3)])
+        self.table.keep(self.table.aligned[:len(self.table)] & np.array([True, False, True, True]))
+        self.assertEqual(self.table.texts, ["Balance guides growth.", "Growth follows reflection and growth."])
+        self.assertEqual(self.table.rows["Growth follows reflection and growth."], 1)
+        self.assertEqual(dict(self.table.top_themes(10)),
+                         {"growth": 3, "balance": 1, "guides": 1, "follows": 1, "reflection": 1})
+
+        restored = BeliefTable.from_beliefs(self.table.texts, self.table.to_dict())
+        np.testing.assert_allclose(restored.strengths(now=SECONDS_PER_DAY), self.table.strengths(now=SECONDS_PER_DAY))
+
+    def test_empty_table_does_not_import_numpy(self):
+        code = "import sys, belief_system, belief_table; belief_table.BeliefTable(); print('numpy' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(result.stdout.strip(), "False")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from data_handler import DataHandler
+
+HAS_CRYPTO = any(importlib.util.find_spec(name) for name in ("Crypto", "Cryptodome"))
+
+@unittest.skipUnless(HAS_CRYPTO, "PyCryptodome is not installed")
+class TestDataHandlerCache(unittest.TestCase):
+    def test_callers_cannot_change_the_cached_data(self):
+        with tempfile.TemporaryDirectory() as directory:
+            handler = DataHandler(os.path.join(directory, "memory.json"), key=b"k" * 16)
+            data = {"interactions": [{"user_input": "hello"}]}
+            handler.save_data(data)
+            data["interactions"].append({"user_input": "not saved"})
+            loaded = handler.load_data()
+            loaded["interactions"].clear()
+            handler.get_interactions()[0]["user_input"] = "changed"
+            self.assertEqual(handler.get_all_data()["interactions"], [{"user_input": "hello"}])
+            handler.add_interaction({"user_input": "again"})
+            self.assertEqual(handler.count_interactions(), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import threading
+import unittest
+from directory_size_index import DirectorySizeIndex
+from directory_watcher import WatchEvent
+
+def write(path, size):
+    with open(path, "wb") as file:
+        file.write(b"x" * size)
+
+class TestDirectorySizeIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        write(os.path.join(self.root, "memory.json"), 100)
+        self.index = DirectorySizeIndex(self.root)
+        self.index.live = True
+        self.index.refresh()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_events_adjust_totals_incrementally(self):
+        created = os.path.join(self.root, "trace.log")
+        write(created, 50)
+        self.index.apply_events([WatchEvent("created", created, False)])
+        self.assertEqual(self.index.total_bytes, 150)
+        write(created, 20)
+        self.index.apply_events([WatchEvent("modified", created, False)])
+        self.assertEqual(self.index.total_bytes, 120)
+        os.remove(created)
+        self.index.apply_events([WatchEvent("deleted", created, False)])
+        self.assertEqual((self.index.total_bytes, list(self.index.sizes)), (100, ["memory.json"]))
+
+    def test_overflow_rescans(self):
+        write(os.path.join(self.root, "belief_system.json"), 30)  # No event for this write
+        self.assertEqual(self.index.total_bytes, 100)
+        self.index.apply_events([WatchEvent("overflow", self.root, True)])
+        self.assertEqual(self.index.total_bytes, 130)
+        self.assertEqual(self.index.by_subsystem(), {"memory": round(100 / 1024 ** 2, 4),
+                                                     "beliefs": round(30 / 1024 ** 2, 4)})
+
+    def test_concurrent_updates_keep_the_total_consistent(self):
+        paths = [os.path.join(self.root, f"file{i}.txt") for i in range(8)]
+        for path in paths:
+            write(path, 10)
+        events = [WatchEvent("modified", path, False) for path in paths]
+        workers = [threading.Thread(target=lambda: [self.index.apply_events(events) for _ in range(200)])]
+        workers += [threading.Thread(target=lambda: [self.index.update(path) for _ in range(200) for path in paths])]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(self.index.total_bytes, sum(self.index.sizes.values()))
+        self.assertEqual(self.index.total_bytes, 180)
+
+if __name__ == "__main__":
+    unittest.main()
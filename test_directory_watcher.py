@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from directory_anchor import DirectoryAnchor
+from directory_watcher import DirectoryWatcher, WatchEvent
+
+def write(path, text):
+    with open(path, "w") as file:
+        file.write(text)
+
+class TestDirectoryWatcher(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.kept = os.path.join(self.root, "kept.txt")
+        self.ignored = os.path.join(self.root, "security_log.txt")
+        write(self.kept, "a")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertEvents(self, watcher, expected):
+        events = watcher.poll(timeout=1.0 if watcher.backend == "inotify" else 0)
+        self.assertEqual({(event.kind, event.path) for event in events}, expected)
+
+    def check_created_modified_deleted(self, watcher):
+        created = os.path.join(self.root, "new.txt")
+        write(created, "new")
+        write(self.ignored, "log line")
+        self.assertEvents(watcher, {("created", created)})
+        write(self.kept, "changed")
+        self.assertEvents(watcher, {("modified", self.kept)})
+        os.remove(created)
+        self.assertEvents(watcher, {("deleted", created)})
+
+    def test_polling_backend(self):
+        with DirectoryWatcher(self.root, ignore=[self.ignored], use_inotify=False) as watcher:
+            self.assertEqual(watcher.backend, "polling")
+            self.assertEqual(watcher._wake_r, -1)  # No descriptors until the watcher is used
+            self.check_created_modified_deleted(watcher)
+        self.assertEqual((watcher._wake_r, watcher._wake_w), (-1, -1))
+
+    def test_inotify_backend(self):
+        with DirectoryWatcher(self.root, ignore=[self.ignored]) as watcher:
+            if watcher.backend != "inotify":
+                self.skipTest("inotify is not available")
+            self.check_created_modified_deleted(watcher)
+        self.assertIsNone(watcher._fd)
+
+    def test_anchor_rehashes_only_touched_files(self):
+        for name in ("memory_manager.py", "belief_system.py", "command_manager.py"):
+            write(os.path.join(self.root, name), name)
+        anchor = DirectoryAnchor(self.root)
+        touched = os.path.join(self.root, "belief_system.py")
+        write(touched, "edited")
+        with mock.patch.object(anchor, "_generate_file_hash", wraps=anchor._generate_file_hash) as file_hash, \
+                mock.patch.object(anchor, "log_security_event") as log:
+            anchor.handle_file_events([WatchEvent("modified", touched, False)])
+        file_hash.assert_called_once_with(touched)
+        log.assert_called_once()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from emotion_analyzer import EmotionLexicon, EmotionAnalyzer
+
+PROFILES = {
+    "happiness": {"intensity": 0.9, "expressions": ["joyful", "excited"]},
+    "anger": {"intensity": 0.8, "expressions": ["frustrated"]},
+}
+
+# Fixed corpus for comparing against the original substring-based analyzers
+CORPUS = [
+    "You shouldn't skip breakfast.",
+    "We must've missed the train.",
+    "I feel curious, curious and creative today.",
+    "I want to be organized and efficient, and efficient again.",
+    "She is kind, friendly and kind.",
+    "The plan is fine.",
+    "Nervous and worried, worried, worried.",
+    "I feel you should be more open-minded and social.",
+]
+
+def legacy_behavior(text):
+    if "should" in text or "must" in text:
+        return "Parent"
+    elif "I feel" in text or "I want" in text:
+        return "Child"
+    return "Adult"
+
+def legacy_personality(analyzer, text):
+    detected_traits = {}
+    for trait, keywords in analyzer.personality_traits.items():
+        for keyword in keywords:
+            if keyword in text.lower():
+                detected_traits[trait] = detected_traits.get(trait, 0) + 1
+    return detected_traits
+
+class TestEmotionLexicon(unittest.TestCase):
+    def setUp(self):
+        self.lexicon = EmotionLexicon(
+            {"positive": ["happy", "excited", "joyful"], "negative": ["sad", "frustrated"], "neutral": ["okay"]},
+            {"Openness": ["open-minded", "curious"], "Agreeableness": ["kind"]},
+            {"Parent": ["should", "must"], "Child": ["I feel", "I want"]},
+            PROFILES,
+        )
+
+    def test_single_sweep_covers_every_category(self):
+        score = self.lexicon.score("I feel Happy, EXCITED and a bit frustrated! Be open-minded.")
+        self.assertEqual(score["sentiment"], "positive")
+        self.assertEqual(score["valence"], 1)
+        self.assertEqual(score["traits"], {"Openness": 1})
+        self.assertEqual(score["ego_state"], "Child")
+        self.assertEqual(score["emotions"], {"happiness": 0.9, "anger": 0.8})
+
+    def test_parent_cues_take_precedence(self):
+        self.assertEqual(self.lexicon.score("I feel you must rest")["ego_state"], "Parent")
+        self.assertEqual(self.lexicon.score("feel free")["ego_state"], "Adult")
+        self.assertEqual(self.lexicon.score("okay")["sentiment"], "neutral")
+
+    def test_conversation_batch_aggregates_messages(self):
+        analyzer = EmotionAnalyzer(profiles_file="missing_profiles.json")
+        analyzer.lexicon = self.lexicon
+        log = ["so happy", {"user_input": "I want to be kind"}, {"text": "sad and frustrated"}]
+        result = analyzer.analyze_conversation(log)
+        self.assertEqual([score["sentiment"] for score in result["messages"]], ["positive", "neutral", "negative"])
+        self.assertEqual(result["ego_states"], {"Adult": 2, "Child": 1})
+        self.assertEqual(result["traits"], {"Agreeableness": 1})
+        self.assertEqual(result["emotions"], {"anger": 0.8})
+
+    def test_vectorized_batch_matches_single_sweeps(self):
+        analyzer = EmotionAnalyzer(profiles_file="missing_profiles.json")
+        analyzer.lexicon = self.lexicon
+        log = ["I feel happy and excited", {"prompt": "you must be curious"}, {"user": "sad, so sad"}, "", "okay"]
+        batch = analyzer.score_batch(log, chunk_size=2)
+        for row, text in enumerate(["I feel happy and excited", "you must be curious", "sad, so sad", "", "okay"]):
+            score = self.lexicon.score(text)
+            self.assertEqual(batch["sentiment"][row], score["sentiment"])
+            self.assertEqual(batch["valence"][row], score["valence"])
+            self.assertEqual(batch["ego_state"][row], score["ego_state"])
+            for label, values in batch["traits"].items():
+                self.assertEqual(values[row], score["traits"].get(label, 0))
+            for label, values in batch["emotions"].items():
+                self.assertAlmostEqual(values[row], score["emotions"].get(label, 0))
+
+    def test_behavior_and_personality_match_the_original_analyzers(self):
+        analyzer = EmotionAnalyzer(profiles_file="missing_profiles.json")
+        batch = analyzer.score_batch(CORPUS)
+        for row, text in enumerate(CORPUS):
+            self.assertEqual(analyzer.analyze_behavior(text), legacy_behavior(text), text)
+            self.assertEqual(analyzer.analyze_personality(text), legacy_personality(analyzer, text), text)
+            self.assertEqual(batch["ego_state"][row], legacy_behavior(text), text)
+            for trait, values in batch["traits"].items():
+                self.assertEqual(values[row], legacy_personality(analyzer, text).get(trait, 0), text)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+from fractal_echo_memory import FractalEchoMemory
+
+class TestFractalEchoMemory(unittest.TestCase):
+    def setUp(self):
+        """
+        Build a carrier with mixed depth and pulse values.
+        """
+        self.memory = FractalEchoMemory()
+        self.memory.create_carrier("Spot")
+        self.memory.add_echo("Spot", "first", ["calm", "quiet"], depth=1, pulse=1)
+        self.memory.add_echo("Spot", "second", ["balance"], depth=3, pulse=2)
+        self.memory.add_echo("Spot", "third", ["noise", "echo"], depth=2, pulse=4)
+
+    def test_echo_query_uses_thresholds(self):
+        """
+        Range lookups return the same echoes, in insertion order, as a full scan.
+        """
+        self.assertEqual(self.memory.echo_query("Spot"), ["calm", "quiet", "balance", "noise", "echo"])
+        self.assertEqual(self.memory.echo_query("Spot", min_pulse=2), ["balance", "noise", "echo"])
+        self.assertEqual(self.memory.echo_query("Spot", min_pulse=2, min_depth=3), ["balance"])
+        self.assertEqual(self.memory.echo_query("Missing"), [])
+
+    def test_pulse_echo_matches_weighted_stream(self):
+        """
+        pulse_echo returns the tail of the pulse-weighted echo stream without duplicating it.
+        """
+        weighted = []
+        for entry in self.memory.get_carrier("Spot"):
+            weighted.extend(entry["echoes"] * entry["pulse"])
+        self.assertEqual(self.memory.pulse_echo("Spot"), weighted[-5:])
+
+    def test_memory_tree_view(self):
+        """
+        The dict-of-lists view keeps the original entry shape.
+        """
+        entries = self.memory.memory_tree["Spot"]
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(set(entries[0]), {"timestamp", "context", "echoes", "depth", "pulse"})
+
+    def test_persistent_store_round_trip(self):
+        """
+        A memory-mapped store reloads the same carriers and accepts appends after reopening.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "echoes")
+            memory = FractalEchoMemory(path)
+            memory.create_carrier("Empty")
+            for entry in self.memory.get_carrier("Spot"):
+                memory.add_echo("Spot", entry["context"], entry["echoes"], depth=entry["depth"], pulse=entry["pulse"])
+            expected = memory.memory_tree
+            memory.close()
+
+            reopened = FractalEchoMemory(path)
+            self.assertEqual(reopened.memory_tree, expected)
+            self.assertEqual(reopened.pulse_echo("Spot"), self.memory.pulse_echo("Spot"))
+            reopened.add_echo("Spot", "fourth", ["again"], depth=5, pulse=5)
+            self.assertEqual(reopened.echo_query("Spot", min_pulse=5), ["again"])
+            reopened.close()
+
+if __name__ == "__main__":
+    unittest.main()
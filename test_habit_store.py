@@ -0,0 +1,41 @@
+import unittest
+from habit_store import HabitStore, HOUR, DAY
+
+def entry(timestamp, interaction, tone="neutral", influenced=False):
+    return {"timestamp": timestamp, "interaction": interaction, "tone": tone, "influence_detected": influenced}
+
+class TestHabitStore(unittest.TestCase):
+    def test_detection_folds_each_closed_bucket_once(self):
+        store = HabitStore()
+        for minute in range(3):
+            store.add(entry(minute * 60, "Checked  email", tone="negative"))
+        store.add(entry(120, "Buy now", influenced=True))
+        self.assertEqual(store.fold_closed_buckets(), set())  # First hour still open
+
+        store.add(entry(HOUR + 5, "checked email"))
+        self.assertEqual(store.fold_closed_buckets(), {"checked email", "buy now"})
+        details = store.habit_details("checked email")
+        self.assertEqual((details["frequency"], details["tone"]), (3, "negative"))
+        self.assertEqual(store.habit_details("buy now")["influenced"], 1)
+        self.assertEqual(store.fold_closed_buckets(), set())
+
+        store.advance(2 * HOUR)
+        store.fold_closed_buckets()
+        self.assertEqual(store.habit_details("checked email")["frequency"], 4)
+        self.assertEqual(store.daily[0]["count"], 5)
+        self.assertEqual(store.daily[0]["tones"], {"negative": 3, "neutral": 2})
+
+    def test_memory_stays_flat_over_months(self):
+        store = HabitStore(max_habits=50)
+        for hour in range(120 * 24):
+            store.add(entry(hour * HOUR, f"task {hour % 200}"))
+            store.fold_closed_buckets()
+        footprint = store.memory_footprint()
+        self.assertEqual(footprint["raw"], 25)
+        self.assertEqual(footprint["hourly"], 7 * 24)
+        self.assertEqual(footprint["daily"], 120)
+        self.assertLessEqual(footprint["candidates"], 50)
+        self.assertEqual(store.logged, 120 * 24)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from knowledge_gaps_data import KnowledgeGapHandler
+
+class TestKnowledgeGapHandler(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        notes_file = os.path.join(self.directory.name, "research_notes.json")
+        with open(notes_file, "w") as file:
+            json.dump(["Golden ratio patterns in time perception."], file)
+        self.gaps_file = os.path.join(self.directory.name, "knowledge_gaps.json")
+        self.handler = KnowledgeGapHandler(self.gaps_file, notes_file)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_topics_are_indexed_by_normalized_name(self):
+        self.handler.log_knowledge_gap("Quantum   Biology")
+        self.handler.log_knowledge_gap("quantum biology")
+        self.handler.log_knowledge_gap("golden ratio time")  # Covered by a research note
+        self.assertEqual(list(self.handler.gaps), ["quantum biology"])
+        self.assertEqual(self.handler.gaps["quantum biology"]["occurrences"], 2)
+
+        self.handler.resolve_knowledge_gap("QUANTUM biology", "Read up on photosynthesis.")
+        self.assertEqual(self.handler.gaps, {})
+        self.assertEqual(self.handler.gaps_with_status("unresolved"), [])
+        with open(self.gaps_file) as file:
+            self.assertEqual(json.load(file)["gaps"], [])
+
+    def test_auto_review_of_many_gaps_writes_once(self):
+        with self.handler.batch():
+            for i in range(500):
+                self.handler.log_knowledge_gap(f"topic {i}")
+            self.handler.log_knowledge_gap("ethics of memory")
+        with mock.patch("json.dump") as dump:
+            self.handler.auto_review_and_fix()
+        self.assertEqual(dump.call_count, 1)
+        self.assertEqual(len(self.handler.gaps_with_status("pending review")), 501)
+        self.assertEqual(self.handler.gaps_by_status["unresolved"], set())
+
+    def test_duplicate_topics_on_disk_are_merged_not_dropped(self):
+        with open(self.gaps_file, "w") as file:
+            json.dump({"gaps": [
+                {"topic": "Dark  Matter", "occurrences": 2, "last_attempt": "2025-03-01T00:00:00",
+                 "suggested_fix": "Read the survey.", "status": "unresolved"},
+                {"topic": "dark matter", "occurrences": 3, "last_attempt": "2025-01-01T00:00:00",
+                 "suggested_fix": "No suggested fix yet.", "status": "unresolved"},
+            ], "resolved_gaps": []}, file)
+        handler = KnowledgeGapHandler(self.gaps_file, self.handler.research_notes_file)
+        gap = handler.gaps["dark matter"]
+        self.assertEqual((gap["topic"], gap["occurrences"], gap["last_attempt"]),
+                         ("dark matter", 5, "2025-03-01T00:00:00"))
+        handler.save_knowledge_gaps()
+        with open(self.gaps_file) as file:
+            self.assertEqual([gap["occurrences"] for gap in json.load(file)["gaps"]], [5])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import gzip
+import os
+import tempfile
+import time
+import unittest
+from log_rotation import LogRotator
+
+class TestLogRotator(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.log = os.path.join(self.directory.name, "trace_log.txt")
+        self.rotator = LogRotator(max_bytes=100, max_age_days=7, keep_archives=2, use_zstd=False)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, text):
+        with open(self.log, "a") as file:
+            file.write(text)
+
+    def test_size_triggers_rotation_and_archive_round_trips(self):
+        self.write("small\n")
+        self.assertIsNone(self.rotator.rotate(self.log))
+        content = "".join(f"line {i}\n" for i in range(50))
+        self.write(content)
+        archive = self.rotator.rotate(self.log)
+        self.assertTrue(archive.endswith(".gz"))
+        with gzip.open(archive, "rt") as file:
+            self.assertEqual(file.read(), "small\n" + content)
+        self.assertEqual(os.path.getsize(self.log), 0)
+        self.write("after\n")
+        self.assertEqual(self.rotator.read_log(self.log), "small\n" + content + "after\n")
+
+    def test_age_triggers_rotation_of_a_never_rotated_log(self):
+        self.write("entry\n")
+        self.assertFalse(self.rotator.should_rotate(self.log))  # First sight starts the clock
+        eight_days_ago = time.time() - 8 * 86400
+        os.utime(self.log + ".rotated", (eight_days_ago, eight_days_ago))
+        self.assertTrue(self.rotator.should_rotate(self.log))
+        self.assertIsNotNone(self.rotator.rotate(self.log))
+        self.write("entry\n")
+        self.assertFalse(self.rotator.should_rotate(self.log))
+
+    def test_retention_keeps_newest_archives(self):
+        archives = []
+        for i in range(4):
+            self.write(f"batch {i}\n")
+            archives.append(self.rotator.rotate(self.log, force=True))
+        self.assertEqual(self.rotator.list_archives(self.log), archives[-2:])
+        self.assertEqual(self.rotator.read_log(self.log), "batch 2\nbatch 3\n")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from network_manager import NetworkManager
 from enhanced_model import EnhancedModel  # Ensures correct function calls
@@ -6,10 +8,18 @@ class TestNetworkManagerWithModel(unittest.TestCase):
     def setUp(self):
         """
         Set up the test environment by initializing the NetworkManager and EnhancedModel.
+        Runs in a scratch directory so the logs and model files they write stay out of the repo.
         """
+        self.cwd = os.getcwd()
+        self.directory = tempfile.TemporaryDirectory()
+        os.chdir(self.directory.name)
         self.network_manager = NetworkManager(creator_id="TestCreatorID")
         self.enhanced_model = EnhancedModel()
 
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
     def test_log_event(self):
         """
         Test the log_event function and ensure it aligns with the breakthrough model.
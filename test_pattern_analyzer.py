@@ -0,0 +1,144 @@
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+from pattern_analyzer import PatternAnalyzer
+
+class FakeDataHandler:
+    def __init__(self):
+        self.interactions = []
+        self.patterns = {}
+
+    def count_interactions(self):
+        return len(self.interactions)
+
+    def get_interactions(self, start=0):
+        return self.interactions[start:]
+
+    def add_patterns(self, patterns):
+        self.patterns.update(patterns)
+
+class FakeEmotionAnalyzer:
+    def __init__(self):
+        self.calls = 0
+
+    def analyze_emotion(self, text):
+        self.calls += 1
+        return len(text) % 5 - 2
+
+class FakeEnhancedModel:
+    def predict_patterns(self, patterns):
+        return [f"prediction for {pattern}" for pattern in patterns]
+
+class TestIncrementalAnalysis(unittest.TestCase):
+    def make_analyzer(self, data_handler, **options):
+        options.setdefault("checkpoint_file", None)
+        return PatternAnalyzer(
+            data_handler=data_handler, enhanced_model=FakeEnhancedModel(), network_manager=object(),
+            emotion_analyzer=FakeEmotionAnalyzer(), **options
+        )
+
+    def test_incremental_passes_match_full_recomputation(self):
+        rng = random.Random(3)
+        words = ["calm", "calm day", "a calm day", "growth", "balance", "balance and growth"]
+        data_handler = FakeDataHandler()
+        analyzer = self.make_analyzer(data_handler)
+
+        for _ in range(6):
+            data_handler.interactions += [{"user_input": rng.choice(words)} for _ in range(rng.randint(1, 8))]
+            result = analyzer.analyze_interactions()
+
+            user_inputs = [interaction["user_input"] for interaction in data_handler.interactions]
+            emotional_data = [{"text": text, "sentiment": len(text) % 5 - 2} for text in user_inputs]
+            counts = Counter(user_inputs)
+            self.assertEqual(dict(result["text_patterns"]), counts)
+            expected = {pattern for pattern, count in counts.items() if count > 1}
+            self.assertEqual(set(data_handler.patterns), expected)
+            for pattern in expected:
+                self.assertEqual(data_handler.patterns[pattern]["count"], counts[pattern])
+                self.assertEqual(
+                    data_handler.patterns[pattern]["weighted_sentiment"],
+                    analyzer.weighted_sentiment(emotional_data, pattern)
+                )
+
+        # Every input was emotionally analyzed exactly once across all passes
+        self.assertEqual(analyzer.emotion_analyzer.calls, len(data_handler.interactions))
+
+    def test_new_inputs_only_touch_the_patterns_they_contain(self):
+        class NoScanDict(dict):
+            def __iter__(self):
+                raise AssertionError("pattern aggregates were scanned")
+            items = values = keys = __iter__
+
+        data_handler = FakeDataHandler()
+        data_handler.interactions = [{"user_input": f"topic {i}"} for i in range(300) for _ in range(2)]
+        analyzer = self.make_analyzer(data_handler)
+        analyzer.analyze_interactions()
+        analyzer.pattern_sentiment = NoScanDict(analyzer.pattern_sentiment)
+        data_handler.patterns = {}
+        data_handler.interactions.append({"user_input": "about topic 12 again"})
+        analyzer.analyze_interactions()
+        self.assertEqual(set(data_handler.patterns), {"topic 1", "topic 12"})
+        self.assertEqual(analyzer.pattern_sentiment["topic 12"][1], 23)  # "topic 12", "topic 120".."topic 129"
+
+    def test_checkpoint_round_trip(self):
+        data_handler = FakeDataHandler()
+        data_handler.interactions = [{"user_input": text} for text in ["calm", "calm", "calm day"]]
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_file = os.path.join(directory, "checkpoint.json")
+            first = self.make_analyzer(data_handler, checkpoint_file=checkpoint_file)
+            first.analyze_interactions()
+
+            second = self.make_analyzer(data_handler, checkpoint_file=checkpoint_file)
+            data_handler.interactions.append({"user_input": "calm day"})
+            result = second.analyze_interactions()
+
+        self.assertEqual(result["new_interactions"], 1)
+        self.assertEqual(second.emotion_analyzer.calls, 1)
+        self.assertEqual(dict(result["text_patterns"]), {"calm": 2, "calm day": 2})
+        # "calm" (sentiment 2) is contained in two "calm" and two "calm day" (sentiment 1) inputs
+        self.assertEqual(second.pattern_weighted_sentiment("calm"), round(6 / 4 * 1.618, 4))
+
+    def test_passes_are_journaled_and_replayed(self):
+        rng = random.Random(5)
+        words = ["calm", "calm day", "growth", "balance and growth"]
+        data_handler = FakeDataHandler()
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_file = os.path.join(directory, "checkpoint.json")
+            analyzer = self.make_analyzer(data_handler, checkpoint_file=checkpoint_file, snapshot_every=10)
+            for _ in range(8):
+                data_handler.interactions += [{"user_input": rng.choice(words)} for _ in range(rng.randint(1, 4))]
+                analyzer.analyze_interactions()
+                snapshot_size = os.path.getsize(checkpoint_file)
+                data_handler.interactions.append({"user_input": "growth"})
+                analyzer.analyze_interactions()
+                # One new input is appended to the journal; the snapshot is not rewritten for it
+                if analyzer.journal.entries:
+                    self.assertEqual(os.path.getsize(checkpoint_file), snapshot_size)
+            self.assertLessEqual(analyzer.journal.entries, 10)
+
+            restored = self.make_analyzer(data_handler, checkpoint_file=checkpoint_file)
+        self.assertEqual(restored.checkpoint, analyzer.checkpoint)
+        self.assertEqual(restored.input_counts.top_k(10), analyzer.input_counts.top_k(10))
+        self.assertEqual(restored.text_sentiment, analyzer.text_sentiment)
+        self.assertEqual(restored.pattern_sentiment, analyzer.pattern_sentiment)
+        self.assertEqual(restored.pattern_stream.top_phrases(), analyzer.pattern_stream.top_phrases())
+
+    def test_tracked_inputs_are_bounded(self):
+        data_handler = FakeDataHandler()
+        analyzer = self.make_analyzer(data_handler, max_inputs=50, text_pattern_limit=5)
+        # 30 occurrences is above the N / max_inputs count every tracked survivor is guaranteed
+        data_handler.interactions = [{"user_input": "calm day"} for _ in range(30)]
+        for i in range(500):
+            data_handler.interactions.append({"user_input": f"note {i}"})
+            data_handler.interactions.append({"user_input": "a calm day again"})
+            result = analyzer.analyze_interactions()
+        self.assertEqual(len(result["text_patterns"]), 5)
+        self.assertEqual(result["text_patterns"][0], ("a calm day again", 500))
+        self.assertLessEqual(len(analyzer.text_sentiment), 50)
+        self.assertEqual(set(analyzer.text_sentiment), set(analyzer.input_counts._position))
+        self.assertEqual(analyzer.pattern_sentiment["calm day"][1], 530)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import random
+import unittest
+from collections import Counter
+from pattern_stream import CountMinSketch, SpaceSaving, SlidingWindow, TumblingWindow, PatternStream
+
+class TestSketches(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        # Zipf-like stream: a few heavy hitters and a long tail
+        self.stream = [f"item {min(int(rng.paretovariate(1.2)), 500)}" for _ in range(5000)]
+        self.counts = Counter(self.stream)
+
+    def test_space_saving_is_exact_within_capacity_and_sorted(self):
+        summary = SpaceSaving(capacity=len(self.counts))
+        for item in self.stream:
+            summary.add(item)
+        top = summary.top_k(len(self.counts))
+        self.assertEqual(dict(top), self.counts)
+        self.assertEqual([count for _, count in top], sorted(self.counts.values(), reverse=True))
+
+    def test_space_saving_bounds_hold_under_eviction(self):
+        capacity = 20
+        summary = SpaceSaving(capacity)
+        for item in self.stream:
+            summary.add(item)
+        self.assertEqual(len(summary), capacity)
+        for item, true_count in self.counts.items():
+            if true_count > len(self.stream) / capacity:
+                self.assertIn(item, summary)
+            if item in summary:
+                count, error = summary.estimate(item)
+                self.assertLessEqual(count - error, true_count)
+                self.assertGreaterEqual(count, true_count)
+        restored = SpaceSaving.from_dict(summary.to_dict())
+        restored.add("item 1")
+        summary.add("item 1")
+        self.assertEqual(restored.top_k(capacity), summary.top_k(capacity))
+
+    def test_space_saving_min_count_skips_unproven_items(self):
+        summary = SpaceSaving(capacity=2)
+        for item in ["a", "a", "a", "b", "b", "c"]:
+            summary.add(item)
+        # "c" evicted "b" and inherited its count of 2, but was only seen once
+        self.assertEqual(summary.top_k(2), [("a", 3), ("c", 3)])
+        self.assertEqual(summary.top_k(2, min_count=2), [("a", 3)])
+        self.assertEqual(summary.top_k(2, min_count=4), [])
+
+    def test_count_min_never_undercounts(self):
+        sketch = CountMinSketch(width=64, depth=4)
+        for item in self.stream:
+            sketch.add(item)
+        for item, true_count in self.counts.items():
+            estimate = sketch.estimate(item)
+            self.assertGreaterEqual(estimate, true_count)
+            self.assertLessEqual(estimate, true_count + 4 * len(self.stream) // 64)  # Generous 2N/width bound
+
+class TestWindows(unittest.TestCase):
+    def test_sliding_window_expires_old_panes(self):
+        window = SlidingWindow(seconds=60, panes=6)
+        for second in range(0, 60, 5):
+            window.add("early", second)
+        window.add("late", 100)
+        # The trailing minute at t=100 keeps the panes from t=40 on
+        self.assertEqual(dict(window.top_k(5, now=100)), {"early": 4, "late": 1})
+        self.assertEqual(window.top_k(5, now=200), [])
+
+    def test_tumbling_window_rolls_over(self):
+        window = TumblingWindow(seconds=60)
+        window.add("calm", 10)
+        window.add("calm", 20)
+        window.add("growth", 70)
+        self.assertEqual(window.previous, [("calm", 2)])
+        self.assertEqual(window.top_k(5), [("growth", 1)])
+
+class TestPatternStream(unittest.TestCase):
+    def test_phrases_and_persistence(self):
+        stream = PatternStream(capacity=32)
+        for text in ["I feel a calm day", "What a calm day", "calm day again", "growth"]:
+            stream.observe(text, timestamp=0)
+        self.assertEqual(stream.top_phrases(1), [("calm day", 3)])
+        self.assertEqual(stream.estimate("growth"), 1)
+
+        restored = PatternStream(capacity=32)
+        restored.load(stream.to_dict())
+        self.assertEqual(restored.top_patterns(4), stream.top_patterns(4))
+        self.assertEqual(stream.top_patterns(4, min_count=2), [])
+        self.assertEqual(restored.estimate("calm day"), 3)
+
+if __name__ == "__main__":
+    unittest.main()
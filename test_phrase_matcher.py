@@ -0,0 +1,25 @@
+import unittest
+from phrase_matcher import PhraseMatcher, phrase_matcher
+
+class TestPhraseMatcher(unittest.TestCase):
+    def test_one_scan_reports_every_hit_with_positions(self):
+        matcher = PhraseMatcher(["Buy now", "Act fast", "balance", "entropy"])
+        text = "BUY NOW and act fast: balancentropy"
+        self.assertEqual(matcher.find_all(text), [
+            (0, 7, "Buy now"), (12, 20, "Act fast"), (22, 29, "balance"), (28, 35, "entropy"),
+        ])
+        self.assertEqual(matcher.matches(text), {"Buy now", "Act fast", "balance", "entropy"})
+        self.assertIsNone(matcher.search("nothing to see"))
+
+    def test_longest_phrase_wins_and_word_boundaries(self):
+        self.assertEqual(PhraseMatcher(["time", "time offer"]).find_all("Limited time offer"), [(8, 18, "time offer")])
+        words = PhraseMatcher(["art"], word_boundaries=True)
+        self.assertEqual(words.matches("smart art"), {"art"})
+        self.assertEqual(len(words.find_all("smart art")), 1)
+
+    def test_matchers_are_shared_per_phrase_list(self):
+        self.assertIs(phrase_matcher(("a", "b")), phrase_matcher(["a", "b"]))
+        self.assertIsNot(phrase_matcher(("a", "b")), phrase_matcher(("a", "b"), word_boundaries=True))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import random
+import unittest
+from rfnn import RFNetwork, ArrayRFNetwork
+
+class TestArrayRFNetwork(unittest.TestCase):
+    def assertMatchesReference(self, reference, network):
+        """
+        Node state and connection weights agree with the object-based network.
+        """
+        self.assertEqual(network.energy.tolist(), [node.energy for node in reference.nodes])
+        self.assertEqual(network.value.tolist(), [node.value for node in reference.nodes])
+        self.assertEqual(network.feedback.tolist(), [node.feedback for node in reference.nodes])
+        _, _, weights = network.weight_matrix()
+        self.assertEqual(weights.tolist(), [weight for node in reference.nodes for _, weight in node.connections])
+
+    def test_recursive_example_matches_reference(self):
+        """
+        The three-node recursive loop from the rfnn example gives identical results.
+        """
+        connections = [(0, 1, 0.5), (1, 2, 0.8), (2, 0, 0.3)]
+        reference, network = RFNetwork(3), ArrayRFNetwork(3)
+        reference.connect_nodes(connections)
+        network.connect_nodes(connections)
+        self.assertEqual(network.forward([1.0, 0.5, 0.8]), reference.forward([1.0, 0.5, 0.8]))
+        reference.adjust_weights()
+        network.adjust_weights()
+        self.assertMatchesReference(reference, network)
+
+    def test_random_graphs_match_reference(self):
+        """
+        Forward chains, back edges, self-loops and duplicate edges follow the sequential sweep.
+        """
+        rng = random.Random(7)
+        for _ in range(50):
+            num_nodes = rng.randint(1, 12)
+            connections = [
+                (rng.randrange(num_nodes), rng.randrange(num_nodes), rng.uniform(-1, 1))
+                for _ in range(rng.randint(0, 30))
+            ]
+            reference, network = RFNetwork(num_nodes), ArrayRFNetwork(num_nodes)
+            reference.connect_nodes(connections)
+            network.connect_nodes(connections)
+            for _ in range(3):
+                inputs = [rng.uniform(-1, 1) for _ in range(rng.randint(0, num_nodes))]
+                reference.forward(inputs)
+                network.forward(inputs)
+                reference.adjust_weights()
+                network.adjust_weights()
+            self.assertMatchesReference(reference, network)
+            self.assertMatchesReference(reference, ArrayRFNetwork.from_network(reference))
+
+    def test_forward_batch_rows_are_independent_passes(self):
+        """
+        Each batch row equals a single forward pass from the starting state; "none" leaves state alone.
+        """
+        rng = random.Random(11)
+        connections = [(rng.randrange(10), rng.randrange(10), rng.uniform(-1, 1)) for _ in range(40)]
+        inputs = [[rng.uniform(-1, 1) for _ in range(10)] for _ in range(5)]
+        network = ArrayRFNetwork(10)
+        network.connect_nodes(connections)
+        values = network.forward_batch(inputs, reduction="none", chunk_size=2)
+        self.assertEqual(network.feedback.tolist(), [0.0] * 10)
+        for row, expected in zip(inputs, values):
+            reference = RFNetwork(10)
+            reference.connect_nodes(connections)
+            reference.forward(row)
+            self.assertEqual(expected.tolist(), [node.value for node in reference.nodes])
+
+        network.forward_batch(inputs, reduction="mean")
+        self.assertTrue(all(0.1 <= energy <= 1.0 for energy in network.energy.tolist()))
+
+    def test_deep_chain_schedule_is_linear_in_depth(self):
+        """
+        A long chain gets one level per node and still matches the sequential sweep.
+        """
+        num_nodes = 3000
+        connections = [(i, i + 1, 0.9) for i in range(num_nodes - 1)] + [(num_nodes - 1, 0, 0.5), (5, 5, 0.2)]
+        reference, network = RFNetwork(num_nodes), ArrayRFNetwork(num_nodes)
+        reference.connect_nodes(connections)
+        network.connect_nodes(connections)
+        reference.forward([1.0])
+        network.forward([1.0])
+        self.assertMatchesReference(reference, network)
+        _, _, _, levels, backward = network._schedule
+        self.assertEqual(len(levels), num_nodes)
+        self.assertEqual(sum(len(batches) for batches, _, _ in levels), num_nodes - 1)
+        self.assertEqual(len(backward), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+from self_evaluator import SelfEvaluator
+from neural_network import NeuralNetwork
+from pattern_analyzer import PatternAnalyzer
+from pattern_stream import PatternStream
+
+class FakeNetwork:
+    def __init__(self):
+        self.network = {"nodes": {"a": {}, "b": {}}, "connections": [("a", "b")]}
+        self.version = 0
+
+class FakeDataHandler:
+    def __init__(self):
+        self.interactions = [{"user_input": "hello"}]
+        self.patterns = {}
+        self.saves = 0
+
+    def count_interactions(self):
+        return len(self.interactions)
+
+    def get_interactions(self, start=0):
+        return self.interactions[start:]
+
+    def add_patterns(self, patterns):
+        self.patterns.update(patterns)
+        self.saves += 1  # Rewrites the data file, as DataHandler does
+
+class FakeEmotionAnalyzer:
+    def analyze_emotion(self, text):
+        return 1
+
+class FakeEnhancedModel:
+    def predict_patterns(self, patterns):
+        return [None for _ in patterns]
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.data_handler = FakeDataHandler()
+        self.pattern_stream = PatternStream(capacity=8)
+        self.calls = 0
+
+    def analyze_interactions(self):
+        self.calls += 1
+        self.pattern_stream.observe("hello", timestamp=0)
+        return {"text_patterns": [("hello", self.pattern_stream.observed)]}
+
+    def prioritize_patterns(self):
+        return self.pattern_stream.top_patterns()
+
+class FakeBeliefs:
+    version = 0
+
+    def evaluate_beliefs(self):
+        return {"evolved_beliefs": 0}
+
+class FakeNetworkManager:
+    approved_devices = {"phone": {}}
+
+    def check_network(self):
+        return "ok"
+
+class TestSelfEvaluatorPipeline(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.directory = tempfile.TemporaryDirectory()
+        os.chdir(self.directory.name)
+        self.network, self.analyzer = FakeNetwork(), FakeAnalyzer()
+        self.evaluator = SelfEvaluator(neural_network=self.network, pattern_analyzer=self.analyzer,
+                                       belief_system=FakeBeliefs(), network_manager=FakeNetworkManager())
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def test_sub_metrics_recompute_only_when_inputs_change(self):
+        self.evaluator.evaluate_self()
+        self.evaluator.evaluate_self()
+        self.assertEqual(self.analyzer.calls, 1)
+        self.assertEqual(self.evaluator.metrics.recomputations["complexity"], 1)
+
+        self.network.network["nodes"]["c"] = {}
+        self.network.version += 1
+        self.analyzer.data_handler.interactions.append({"user_input": "hello"})
+        data = self.evaluator.evaluate_self()
+        self.assertEqual(self.analyzer.calls, 2)
+        self.assertEqual(data["node_count"], 3)
+        self.assertEqual(data["emotional_tone"], [("hello", 2)])
+
+        history = self.evaluator.load_history()
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history[1]["recomputed"], ["time_varying_feedback"])
+        self.assertIn("behavioral_patterns", history[2]["recomputed"])
+        self.assertEqual(self.evaluator.last_reflection(), history[-1])
+
+    def test_saved_network_mutations_refresh_metrics(self):
+        network = NeuralNetwork("network.json", pattern_analyzer=self.analyzer, behavior_recognizer=object())
+        evaluator = SelfEvaluator(neural_network=network, pattern_analyzer=self.analyzer,
+                                  belief_system=FakeBeliefs(), network_manager=FakeNetworkManager())
+        self.assertEqual(evaluator.evaluate_self()["node_count"], 0)
+
+        network.add_node("a", {"value": 1})  # Saves: the first save writes a snapshot
+        data = evaluator.evaluate_self()
+        self.assertEqual(data["node_count"], 1)
+
+        with network.batch():
+            network.add_node("b", {"value": 2})
+            network.connect_nodes("a", "b")
+        network.write_snapshot()
+        data = evaluator.evaluate_self()
+        self.assertEqual((data["node_count"], data["connection_count"]), (2, 1))
+        self.assertGreater(data["complexity"], 0)
+
+    def test_pattern_writes_do_not_trigger_another_analysis(self):
+        data_handler = FakeDataHandler()
+        analyzer = PatternAnalyzer(data_handler=data_handler, enhanced_model=FakeEnhancedModel(),
+                                   network_manager=object(), emotion_analyzer=FakeEmotionAnalyzer(),
+                                   checkpoint_file=None)
+        evaluator = SelfEvaluator(neural_network=self.network, pattern_analyzer=analyzer,
+                                  belief_system=FakeBeliefs(), network_manager=FakeNetworkManager())
+        evaluator.evaluate_self()
+        evaluator.evaluate_self()
+        self.assertEqual(data_handler.saves, 1)
+        self.assertEqual(evaluator.metrics.recomputations["behavioral_patterns"], 1)
+
+        data_handler.interactions.append({"user_input": "hello"})
+        data = evaluator.evaluate_self()
+        evaluator.evaluate_self()
+        self.assertEqual(evaluator.metrics.recomputations["behavioral_patterns"], 2)
+        self.assertEqual(data["behavioral_patterns"]["new_interactions"], 1)
+        self.assertEqual(data["emotional_tone"], [("hello", 2)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from snapshot_journal import SnapshotJournal
+
+class TestSnapshotJournal(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.directory.name, "state.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def reopen(self, snapshot_every=3):
+        journal = SnapshotJournal(self.file, snapshot_every)
+        state = journal.load() or {"values": []}
+        journal.replay(lambda mutation: state["values"].append(mutation["value"]))
+        return journal, state
+
+    def test_journal_replays_and_compacts_into_snapshots(self):
+        journal, state = self.reopen()
+        for value in range(7):
+            state["values"].append(value)
+            journal.record({"value": value})
+            journal.save(lambda: state)
+        self.assertLessEqual(journal.entries, 3)
+        self.assertEqual(self.reopen()[1], {"values": list(range(7))})
+
+    def test_torn_final_line_is_dropped(self):
+        journal, state = self.reopen()
+        journal.save(lambda: state)  # First save writes the snapshot
+        for value in range(2):
+            journal.record({"value": value})
+        self.assertEqual(journal.save(lambda: state), "journal")
+        with open(journal.journal_file, "a") as file:
+            file.write('{"value": 2')
+        reopened, state = self.reopen()
+        self.assertEqual(state, {"values": [0, 1]})
+        self.assertEqual(reopened.entries, 2)
+
+    def test_journal_from_an_older_generation_is_ignored(self):
+        journal, state = self.reopen()
+        journal.save(lambda: state)
+        journal.record({"value": 1})
+        journal.save(lambda: state)
+        with open(journal.journal_file) as file:
+            stale = file.read()
+        state["values"].append(1)
+        journal.write_snapshot(state)
+        with open(journal.journal_file, "w") as file:
+            file.write(stale)  # As if the process died before resetting the journal
+        self.assertEqual(self.reopen()[1], {"values": [1]})
+
+if __name__ == "__main__":
+    unittest.main()
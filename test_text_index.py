@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+import unittest
+from belief_system import BeliefSystem
+from text_index import InvertedIndex, ResearchNotesIndex, file_stamp
+
+NOTES = [
+    "Consciousness arises from recursive reflection.",
+    "The golden ratio appears in recursive growth and in time perception.",
+    "Entropy and structure balance each other.",
+    "Time perception shifts with recursion density; time feels faster in dense threads.",
+]
+
+class TestInvertedIndex(unittest.TestCase):
+    def build(self, notes):
+        index = InvertedIndex()
+        for position, note in enumerate(notes):
+            index.add(str(position), note)
+        return index
+
+    def test_ranking_and_match_modes(self):
+        index = self.build(NOTES)
+        ranked = [doc_id for doc_id, _ in index.search("time perception")]
+        self.assertEqual(ranked, ["3", "1"])  # Note 3 repeats "time"
+        self.assertEqual([doc_id for doc_id, _ in index.search("recursive time", match="all")], ["1"])
+        self.assertEqual(index.search("recursive time", k=1, match="any")[0][0], "1")
+        self.assertEqual(index.search("the and of"), [])  # Stopwords only
+        self.assertEqual(index.document_frequency("Recursive"), 2)
+
+    def test_prefix_match_keeps_substring_style_queries(self):
+        index = self.build(NOTES)
+        self.assertEqual([doc_id for doc_id, _ in index.search("conscious", match="prefix")], ["0"])
+        self.assertEqual(index.search("conscious"), [])  # Whole terms only
+        self.assertEqual([doc_id for doc_id, _ in index.search("recurs time", match="prefix")], ["3", "1"])
+        self.assertEqual(index.search("entropy golden", match="prefix"), [])
+        index.add("4", "Self-consciousness is recursive.")
+        self.assertEqual(sorted(doc_id for doc_id, _ in index.search("CONSCIOUS", match="prefix")), ["0", "4"])
+
+    def test_incremental_updates_match_a_rebuild(self):
+        index = self.build(NOTES[:2])
+        index.add("2", NOTES[2])
+        index.add("3", "placeholder")
+        index.add("3", NOTES[3])  # Re-index replaces the old text
+        index.add("4", "temporary note about entropy")
+        index.remove("4")
+        rebuilt = self.build(NOTES)
+        self.assertEqual(index.postings, rebuilt.postings)
+        self.assertEqual(index.search("entropy time"), rebuilt.search("entropy time"))
+
+    def test_research_index_persists_and_detects_stale_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            notes_file = os.path.join(directory, "research_notes.json")
+            with open(notes_file, "w") as file:
+                json.dump(NOTES, file)
+            research_index = ResearchNotesIndex(list(NOTES), notes_file)
+            self.assertFalse(os.path.exists(notes_file + ".index"))  # Building writes nothing
+            research_index.save()
+            self.assertIsNotNone(InvertedIndex.load(notes_file + ".index", file_stamp(notes_file)))
+            self.assertEqual(research_index.search("entropy"), [NOTES[2]])
+
+            notes = NOTES + ["Entropy dampening stabilizes recursion."]
+            with open(notes_file, "w") as file:
+                json.dump(notes, file)
+            self.assertIsNone(InvertedIndex.load(notes_file + ".index", file_stamp(notes_file)))
+            self.assertEqual(len(ResearchNotesIndex(notes, notes_file).search("entropy")), 2)
+
+    def test_belief_queries_match_word_prefixes_without_writing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            notes_file = os.path.join(directory, "research_notes.json")
+            with open(notes_file, "w") as file:
+                json.dump(NOTES, file)
+            beliefs = BeliefSystem(notes_file)
+            self.assertEqual(os.listdir(directory), ["research_notes.json"])
+            self.assertEqual(beliefs.query_research_notes("Conscious"), [NOTES[0]])
+            self.assertEqual(sorted(beliefs.query_belief("conscious")), sorted([beliefs.core_beliefs[1], beliefs.core_beliefs[4]]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,254 @@
+import bisect
+import heapq
+import json
+import math
+import os
+import re
+
+TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with".split()
+)
+
+def tokenize(text):
+    return [token for token in TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+class InvertedIndex:
+    def __init__(self, k1=1.5, b=0.75):
+        """
+        Inverted text index with BM25 ranking.
+        Postings map each term to {doc_id: term frequency}, so a query only touches the
+        documents that contain its terms. Documents can be added, replaced and removed
+        incrementally; doc_ids are strings so the index persists as JSON.
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings = {}  # term -> {doc_id: term frequency}
+        self.lengths = {}  # doc_id -> number of indexed tokens
+        self.total_length = 0
+        self._vocabulary = None  # Sorted terms for prefix lookups, rebuilt after the vocabulary changes
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.lengths
+
+    def add(self, doc_id, text):
+        """Index (or re-index) one document."""
+        if doc_id in self.lengths:
+            self.remove(doc_id)
+        tokens = tokenize(text)
+        for token in tokens:
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = {}
+                self._vocabulary = None
+            postings[doc_id] = postings.get(doc_id, 0) + 1
+        self.lengths[doc_id] = len(tokens)
+        self.total_length += len(tokens)
+
+    def remove(self, doc_id):
+        # Terms of a document are not stored separately, so removal scans the vocabulary
+        if doc_id not in self.lengths:
+            return
+        for term in [term for term, postings in self.postings.items() if doc_id in postings]:
+            del self.postings[term][doc_id]
+            if not self.postings[term]:
+                del self.postings[term]
+                self._vocabulary = None
+        self.total_length -= self.lengths.pop(doc_id)
+
+    def expand(self, prefix):
+        """Every indexed term starting with `prefix`."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\U0010ffff")
+        return self._vocabulary[start:end]
+
+    def _prefix_postings(self, prefix):
+        """Postings of every term starting with `prefix`, merged: {doc_id: summed term frequency}."""
+        merged = {}
+        for term in self.expand(prefix):
+            for doc_id, tf in self.postings[term].items():
+                merged[doc_id] = merged.get(doc_id, 0) + tf
+        return merged
+
+    def document_frequency(self, term):
+        return len(self.postings.get(term.lower(), ()))
+
+    def search(self, query, k=None, match="any"):
+        """
+        Rank documents against `query` with BM25.
+        Args:
+            k (int): Return at most k results (None returns every match).
+            match (str): "any" ranks documents containing at least one query term;
+                "all" only documents containing every term;
+                "prefix" only documents with a word starting with every term ("conscious"
+                finds "consciousness"), the closest to a case-insensitive substring check.
+        Returns:
+            list: (doc_id, score) pairs, best first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.lengths:
+            return []
+        if match == "prefix":
+            postings = [self._prefix_postings(term) for term in terms]
+        else:
+            postings = [self.postings.get(term, {}) for term in terms]
+        if match in ("all", "prefix"):
+            if not all(postings):
+                return []
+            rarest = min(postings, key=len)
+            candidates = [doc_id for doc_id in rarest if all(doc_id in other for other in postings)]
+        else:
+            candidates = None
+
+        num_docs = len(self.lengths)
+        average_length = self.total_length / num_docs or 1
+        scores = {}
+        for term_postings in postings:
+            if not term_postings:
+                continue
+            idf = math.log(1 + (num_docs - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+            for doc_id in (term_postings if candidates is None else candidates):
+                tf = term_postings[doc_id]
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        ranked = scores.items()
+        if k is not None:
+            return heapq.nlargest(k, ranked, key=lambda item: item[1])
+        return sorted(ranked, key=lambda item: item[1], reverse=True)
+
+    # ==========================
+    # 💾 Persistence
+    # ==========================
+
+    def save(self, index_file, source_stamp=None):
+        """
+        Write the index as JSON; `source_stamp` records which version of the source file it covers.
+        """
+        state = {"stamp": source_stamp, "k1": self.k1, "b": self.b,
+                 "postings": self.postings, "lengths": self.lengths}
+        temp_file = index_file + ".tmp"
+        with open(temp_file, "w") as file:
+            json.dump(state, file)
+        os.replace(temp_file, index_file)
+
+    @classmethod
+    def load(cls, index_file, source_stamp=None):
+        """
+        Load a saved index, or return None if it is missing, unreadable or built from another
+        version of the source file.
+        """
+        try:
+            with open(index_file, "r") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if source_stamp is not None and state.get("stamp") != list(source_stamp):
+            return None
+        index = cls(state["k1"], state["b"])
+        index.postings = state["postings"]
+        index.lengths = state["lengths"]
+        index.total_length = sum(index.lengths.values())
+        return index
+
+def file_stamp(file_name):
+    try:
+        stat = os.stat(file_name)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+# ==========================
+# 📚 Research Notes
+# ==========================
+
+def note_text(note):
+    """Flatten a research note (a string, or nested dicts/lists of strings) into indexable text."""
+    if isinstance(note, dict):
+        return " ".join(f"{key} {note_text(value)}" for key, value in note.items())
+    if isinstance(note, list):
+        return " ".join(note_text(value) for value in note)
+    return str(note)
+
+def topic_text(topic, content):
+    return f"{topic.replace('_', ' ')} {note_text(content)}"
+
+def note_documents(research_notes):
+    """
+    (doc_id, note, text) for every research note. research_notes.json is either a list of
+    notes (doc_id is the position) or a dict of topics (doc_id is the topic, and the note
+    returned to callers is the topic name, as iterating the dict yields).
+    """
+    if isinstance(research_notes, dict):
+        return [(topic, topic, topic_text(topic, content)) for topic, content in research_notes.items()]
+    return [(str(position), note, note_text(note)) for position, note in enumerate(research_notes)]
+
+class ResearchNotesIndex:
+    def __init__(self, research_notes, research_notes_file):
+        """
+        Shared BM25 index over research_notes.json, persisted next to it as
+        research_notes.json.index and rebuilt whenever the notes file has changed.
+        Building the index writes nothing; it is persisted the next time notes are saved.
+        """
+        self.research_notes = research_notes
+        self.index_file = research_notes_file + ".index"
+        self.research_notes_file = research_notes_file
+        self.notes = {doc_id: note for doc_id, note, _ in note_documents(research_notes)}
+        stamp = file_stamp(research_notes_file)
+        self.index = InvertedIndex.load(self.index_file, stamp) if stamp else None
+        if self.index is None or len(self.index) != len(self.notes):
+            self.index = InvertedIndex()
+            for doc_id, _, text in note_documents(research_notes):
+                self.index.add(doc_id, text)
+
+    def add(self, note, save=True):
+        """
+        Index a note just appended to the notes. With `save`, the index is written too, which
+        must happen after the notes file was saved; batches pass False and call save() later.
+        """
+        if isinstance(self.research_notes, dict):  # The "notes" topic grew: re-index just that topic
+            self.notes["notes"] = "notes"
+            self.index.add("notes", topic_text("notes", self.research_notes["notes"]))
+        else:
+            doc_id = str(len(self.research_notes) - 1)
+            self.notes[doc_id] = note
+            self.index.add(doc_id, note_text(note))
+        if save:
+            self.save()
+
+    def save(self):
+        if os.path.exists(self.research_notes_file):
+            self.index.save(self.index_file, file_stamp(self.research_notes_file))
+
+    def search(self, query, k=None, match="any"):
+        """Ranked notes for `query`, best first."""
+        return [self.notes[doc_id] for doc_id, _ in self.index.search(query, k, match)]
+
+    def count(self, term):
+        """Number of notes mentioning `term`."""
+        return self.index.document_frequency(term)
+
+def append_research_note(research_notes, note):
+    """Add a note to either research_notes.json layout; dict layouts collect them under "notes"."""
+    if isinstance(research_notes, dict):
+        research_notes.setdefault("notes", []).append(note)
+    else:
+        research_notes.append(note)
+
+_shared_indexes = {}
+
+def shared_research_index(research_notes_file, load_notes):
+    """
+    One ResearchNotesIndex per notes file for the whole process, so BeliefSystem,
+    KnowledgeGapHandler and SelfEvaluator search (and extend) the same notes and index.
+    `load_notes` reads the file the first time it is requested.
+    """
+    key = os.path.abspath(research_notes_file)
+    if key not in _shared_indexes:
+        _shared_indexes[key] = ResearchNotesIndex(load_notes(), research_notes_file)
+    return _shared_indexes[key]